@@ -2,7 +2,7 @@
 # This project is licensed under the MIT License (SPDX-License-identifier: MIT).
 
 from fastapi import APIRouter, HTTPException, UploadFile, File
-from fastapi.responses import Response
+from fastapi.responses import StreamingResponse
 
 from pixelle.upload.file_service import file_service
 from pixelle.upload.base import FileInfo
@@ -37,24 +37,20 @@ async def get_file(file_id: str):
         file_id: File ID
         
     Returns:
-        File content
+        File content stream
     """
     # Get file information
     file_info = await file_service.get_file_info(file_id)
     if not file_info:
         raise HTTPException(status_code=404, detail="File not found")
 
-    # Get file content
-    file_content = await file_service.get_file(file_id)
-    if not file_content:
-        raise HTTPException(status_code=404, detail="File content not found")
-
-    # Return file stream
-    return Response(
-        content=file_content,
+    # Stream file content in chunks instead of loading it into memory
+    return StreamingResponse(
+        file_service.iter_file(file_id),
         media_type=file_info.content_type,
         headers={
-            "Content-Disposition": f"inline; filename={file_info.filename}"
+            "Content-Disposition": f"inline; filename={file_info.filename}",
+            "Content-Length": str(file_info.size),
         }
     )
 
@@ -5,12 +5,11 @@
 
 import typer
 from pathlib import Path
-from rich.console import Console
 from rich.table import Table
 from rich.tree import Tree
 from rich.panel import Panel
 
-console = Console()
+from pixelle.cli.utils.console import console
 
 
 def dev_command():
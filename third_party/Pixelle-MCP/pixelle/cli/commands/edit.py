@@ -5,12 +5,9 @@
 
 import typer
 from pathlib import Path
-from rich.console import Console
 from rich.panel import Panel
 
-
-
-console = Console()
+from pixelle.cli.utils.console import console
 
 
 def edit_command():
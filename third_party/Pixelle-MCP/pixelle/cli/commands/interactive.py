@@ -3,12 +3,8 @@
 
 """Interactive command implementation."""
 
-from rich.console import Console
-
 from pixelle.cli.interactive.welcome import run_interactive_mode
 
-console = Console()
-
 
 def interactive_command():
     """🎨 Run in interactive mode (default when no command specified)"""
@@ -3,11 +3,101 @@
 
 """Logs command implementation."""
 
+import os
 import typer
 from pathlib import Path
-from rich.console import Console
 
-console = Console()
+from pixelle.cli.utils.console import console
+
+
+def _tail(path: Path, n: int, chunk_size: int = 8192) -> list[str]:
+    """Return the last ``n`` lines of ``path``, reading backwards from the end in chunks."""
+    if n <= 0:
+        return []
+    
+    with open(path, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        chunks = []
+        newlines = 0
+        # n + 1 newlines guarantee n complete lines even with a trailing newline
+        while pos > 0 and newlines <= n:
+            step = min(chunk_size, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step)
+            chunks.append(chunk)
+            newlines += chunk.count(b'\n')
+    
+    lines = b''.join(reversed(chunks)).split(b'\n')
+    if lines and not lines[-1]:
+        lines.pop()
+    return [line.decode('utf-8', errors='replace') for line in lines[-n:]]
+
+
+def _follow(log_file: Path) -> None:
+    """Print lines appended to ``log_file`` until interrupted.
+    
+    Wakes on file-change events via watchdog (inotify on Linux, FSEvents on
+    macOS, ReadDirectoryChangesW on Windows) when it is installed, otherwise
+    polls the file size every 250 ms. New bytes are read straight from the
+    descriptor and printed line by line through the rich console, verbatim
+    (log text is not parsed as markup).
+    """
+    import threading
+    import time
+    
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        Observer = None
+    
+    changed = threading.Event()
+    observer = None
+    if Observer is not None:
+        target = os.path.normcase(str(log_file.resolve()))
+        
+        class _LogHandler(FileSystemEventHandler):
+            def on_modified(self, event):
+                if os.path.normcase(os.path.abspath(event.src_path)) == target:
+                    changed.set()
+        
+        observer = Observer()
+        observer.schedule(_LogHandler(), str(log_file.parent))
+        observer.start()
+    
+    fd = os.open(log_file, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        # Go to end of file
+        pos = os.lseek(fd, 0, os.SEEK_END)
+        pending = b''
+        
+        while True:
+            size = os.fstat(fd).st_size
+            if size < pos:
+                # Truncated in place: start over from the beginning
+                pos = os.lseek(fd, 0, os.SEEK_SET)
+                pending = b''
+            while size > pos:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                pos += len(chunk)
+                *complete, pending = (pending + chunk).split(b'\n')
+                for line in complete:
+                    console.print(line.decode('utf-8', errors='replace').rstrip(), markup=False, highlight=False)
+            
+            if observer is None:
+                time.sleep(0.25)
+            else:
+                # Timeout only keeps Ctrl+C responsive; idle waits cost no reads
+                changed.wait(1.0)
+                changed.clear()
+    finally:
+        os.close(fd)
+        if observer is not None:
+            observer.stop()
+            observer.join()
 
 
 def logs_command(
@@ -29,48 +119,21 @@ def logs_command(
     
     try:
         if follow:
-            # Follow mode - use subprocess to call tail
+            # Follow mode - same in-process follower on every platform
             console.print(f"📄 [bold]Following log file: {log_file}[/bold]")
             console.print("Press [bold]Ctrl+C[/bold] to stop following\n")
             
-            import subprocess
-            import sys
-            
             try:
-                # Use tail -f on Unix systems
-                if sys.platform != "win32":
-                    subprocess.run(["tail", "-f", str(log_file)])
-                else:
-                    # For Windows, implement a simple follow mechanism
-                    import time
-                    
-                    with open(log_file, 'r', encoding='utf-8') as f:
-                        # Go to end of file
-                        f.seek(0, 2)
-                        
-                        while True:
-                            line = f.readline()
-                            if line:
-                                console.print(line.rstrip())
-                            else:
-                                time.sleep(0.1)  # Sleep briefly
-                                
+                _follow(log_file)
             except KeyboardInterrupt:
                 console.print("\n👋 Stopped following logs")
         else:
             # Show last N lines
             console.print(f"📄 [bold]Last {lines} lines from: {log_file}[/bold]\n")
             
-            with open(log_file, 'r', encoding='utf-8') as f:
-                all_lines = f.readlines()
-                
-                if len(all_lines) > lines:
-                    display_lines = all_lines[-lines:]
-                else:
-                    display_lines = all_lines
-                
-                for line in display_lines:
-                    console.print(line.rstrip())
+            for line in _tail(log_file, lines):
+                # Log lines are arbitrary text: "[/some/path]" must not be read as markup
+                console.print(line.rstrip(), markup=False, highlight=False)
             
             console.print(f"\n💡 Use [cyan]pixelle logs --follow[/cyan] (or [cyan]-f[/cyan]) to follow logs in real-time")
             
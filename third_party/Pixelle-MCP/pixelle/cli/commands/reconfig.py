@@ -4,7 +4,6 @@
 """Reconfig command implementation."""
 
 import typer
-from rich.console import Console
 
 from pixelle.cli.setup.comfyui import setup_comfyui
 from pixelle.cli.setup.service import setup_service_config
@@ -14,8 +13,7 @@ from pixelle.cli.setup.providers.manager import (
     collect_all_selected_models,
     select_default_model_interactively
 )
-
-console = Console()
+from pixelle.cli.utils.console import console
 
 
 def init_command():
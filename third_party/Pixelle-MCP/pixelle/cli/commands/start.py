@@ -4,12 +4,10 @@
 """Start command implementation."""
 
 import typer
-from rich.console import Console
 
 from pixelle.cli.utils.command_utils import detect_config_status
 from pixelle.cli.utils.server_utils import start_pixelle_server
-
-console = Console()
+from pixelle.cli.utils.console import console
 
 
 def start_command(
@@ -5,11 +5,10 @@
 
 import typer
 from pathlib import Path
-from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 
-console = Console()
+from pixelle.cli.utils.console import console
 
 
 def status_command():
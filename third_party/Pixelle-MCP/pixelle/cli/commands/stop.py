@@ -5,9 +5,8 @@
 
 import typer
 from pathlib import Path
-from rich.console import Console
 
-console = Console()
+from pixelle.cli.utils.console import console
 
 
 def stop_command():
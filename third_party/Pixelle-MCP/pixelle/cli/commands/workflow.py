@@ -3,22 +3,15 @@
 
 """Workflow command implementation."""
 
+# Only Typer, the shared console and the builtin time module are imported at module load; everything
+# else is imported inside the subcommand that needs it to keep CLI startup fast.
+import time
 import typer
-import json
-import shutil
-import subprocess
-import platform
 from pathlib import Path
-from datetime import datetime
-from typing import List, Optional
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
-from rich.prompt import Confirm
-import questionary
+from typing import Optional
+
+from pixelle.cli.utils.console import console
 
-console = Console()
 
 # Create workflow sub-app
 workflow_app = typer.Typer(help="🔧 Workflow management commands")
@@ -29,11 +22,78 @@ def workflow_command():
     workflow_app()
 
 
+_TS_FMT = "%Y-%m-%d %H:%M"
+
+
+def _fmt_ts(ts: float) -> str:
+    """Format a file timestamp in local time for the workflow tables."""
+    return time.strftime(_TS_FMT, time.localtime(ts))
+
+
+def _short(text: str, width: int) -> str:
+    """Truncate ``text`` to at most ``width`` characters, ending with "..." when cut."""
+    return text if len(text) <= width else text[:width - 3] + "..."
+
+
+def _iter_rows(loaded_workflows: dict, source: Optional[str], workflow_entries: dict):
+    """Yield ``workflow list`` table rows, skipping tools filtered out by ``source`` before any formatting."""
+    for tool_name, tool_info in loaded_workflows.items():
+        metadata = tool_info.get("metadata", {})
+        
+        # Filter by source if specified
+        workflow_source = metadata.get("source", "local")
+        if source and source != "all":
+            if source == "local" and workflow_source not in ["local", "comfyui"]:
+                continue
+            elif source == "runninghub" and workflow_source != "runninghub":
+                continue
+        description = metadata.get("description", "No description")
+        if not description or description == "No description":
+            description = "[dim]No description[/dim]"
+        else:
+            # Limit description length to avoid overly tall rows
+            description = _short(description, 100)
+        
+        # Format parameters - each parameter on a new line
+        params = metadata.get("params", {})
+        if params:
+            param_lines = []
+            for param_name, param_info in params.items():
+                param_type = param_info.get("type", "str")
+                required = param_info.get("required", False)
+                marker = "!" if required else "?"
+                param_lines.append(f"{param_name}({param_type}){marker}")
+            param_display = "\n".join(param_lines)
+        else:
+            param_display = "No params"
+        
+        # Determine workflow source display
+        if workflow_source == "runninghub":
+            source_display = "🌐 Cloud"
+        else:
+            source_display = "🏠 Local"
+        
+        # Get file creation and modification times
+        entry = workflow_entries.get(tool_name)
+        if entry is not None:
+            file_stat = entry.stat()
+            created_time = _fmt_ts(file_stat.st_ctime)
+            modified_time = _fmt_ts(file_stat.st_mtime)
+        else:
+            created_time = "Unknown"
+            modified_time = "Unknown"
+        
+        yield tool_name, source_display, param_display, description, created_time, modified_time
+
+
 @workflow_app.command("list")
 def list_workflows(
     source: Optional[str] = typer.Option(None, "--source", "-s", help="Filter by workflow source: 'local', 'runninghub', or 'all'")
 ):
     """📋 Display all current workflow files and tools information"""
+    import os
+    from rich.panel import Panel
+    from rich.table import Table
     
     # Show header information
     from pixelle.cli.utils.display import show_header_info
@@ -73,56 +133,15 @@ def list_workflows(
         loaded_table.add_column("Created", style="green", width=16)
         loaded_table.add_column("Modified", style="blue", width=16)
         
-        for tool_name, tool_info in loaded_workflows.items():
-            metadata = tool_info.get("metadata", {})
-            
-            # Filter by source if specified
-            workflow_source = metadata.get("source", "local")
-            if source and source != "all":
-                if source == "local" and workflow_source not in ["local", "comfyui"]:
-                    continue
-                elif source == "runninghub" and workflow_source != "runninghub":
-                    continue
-            description = metadata.get("description", "No description")
-            if not description or description == "No description":
-                description = "[dim]No description[/dim]"
-            else:
-                # Limit description length to avoid overly tall rows
-                max_length = 100  # Adjust based on column width
-                if len(description) > max_length:
-                    description = description[:max_length-3] + "..."
-            
-            # Format parameters - each parameter on a new line
-            params = metadata.get("params", {})
-            if params:
-                param_lines = []
-                for param_name, param_info in params.items():
-                    param_type = param_info.get("type", "str")
-                    required = param_info.get("required", False)
-                    marker = "!" if required else "?"
-                    param_lines.append(f"{param_name}({param_type}){marker}")
-                param_display = "\n".join(param_lines)
-            else:
-                param_display = "No params"
-            
-            # Determine workflow source display
-            workflow_source = metadata.get("source", "local")
-            if workflow_source == "runninghub":
-                source_display = "🌐 Cloud"
-            else:
-                source_display = "🏠 Local"
-            
-            # Get file creation and modification times
-            workflow_file = custom_workflows_dir / f"{tool_name}.json"
-            if workflow_file.exists():
-                file_stat = workflow_file.stat()
-                created_time = datetime.fromtimestamp(file_stat.st_ctime).strftime("%Y-%m-%d %H:%M")
-                modified_time = datetime.fromtimestamp(file_stat.st_mtime).strftime("%Y-%m-%d %H:%M")
-            else:
-                created_time = "Unknown"
-                modified_time = "Unknown"
-            
-            loaded_table.add_row(tool_name, source_display, param_display, description, created_time, modified_time)
+        # Stat the custom workflows directory in one pass instead of two stat calls per tool
+        try:
+            with os.scandir(custom_workflows_dir) as it:
+                workflow_entries = {e.name[:-5]: e for e in it if e.name.endswith(".json")}
+        except OSError:
+            workflow_entries = {}
+        
+        for row in _iter_rows(loaded_workflows, source, workflow_entries):
+            loaded_table.add_row(*row)
         
         console.print(loaded_table)
         
@@ -136,7 +155,19 @@ def list_workflows(
 @workflow_app.command("install")
 def install_examples():
     """📥 Install workflow examples from the built-in collection"""
-    
+    import shutil
+    from concurrent.futures import ThreadPoolExecutor
+    import questionary
+    from rich.panel import Panel
+    from rich.prompt import Confirm
+    from rich.table import Table
+    
+    from pixelle.cli.utils.workflow_meta_cache import (
+        get_dir_metadata,
+        get_metadata,
+        invalidate_dir_metadata,
+        store_dir_metadata,
+    )
     from pixelle.utils.os_util import get_src_path, get_data_path
     
     # Get built-in workflows directory from package
@@ -163,23 +194,49 @@ def install_examples():
         border_style="cyan"
     ))
     
-    # Scan built-in workflows
-    workflow_files = list(builtin_workflows_dir.glob("*.json"))
+    # Reuse the last scan while the built-in directory is unchanged
+    cached_entries = get_dir_metadata(builtin_workflows_dir)
+    if cached_entries is not None:
+        workflow_files = [builtin_workflows_dir / file_name for file_name in cached_entries]
+        parsed = [(metadata, None) for metadata in cached_entries.values()]
+    else:
+        # Scan built-in workflows
+        dir_mtime_ns = builtin_workflows_dir.stat().st_mtime_ns
+        workflow_files = list(builtin_workflows_dir.glob("*.json"))
+        
+        # Read workflow metadata in parallel so cold-cache file reads overlap.
+        # Results keep the glob order.
+        def load_metadata(workflow_file: Path):
+            try:
+                return get_metadata(workflow_file), None
+            except Exception as e:
+                return None, e
+        
+        parsed = []
+        if workflow_files:
+            with ThreadPoolExecutor(max_workers=min(8, len(workflow_files))) as executor:
+                parsed = list(executor.map(load_metadata, workflow_files))
+        
+        # Only remember complete scans so parse failures are reported again next time
+        if all(error is None for _, error in parsed):
+            store_dir_metadata(builtin_workflows_dir, dir_mtime_ns, {
+                workflow_file.name: metadata
+                for workflow_file, (metadata, _) in zip(workflow_files, parsed)
+            })
+    
     if not workflow_files:
         console.print("❌ [red]No built-in workflow files found![/red]")
         return
     
-    # Parse workflow metadata and create choices
+    # Build choices from the parsed metadata (console output stays on this thread)
     workflow_choices = []
     workflow_info = {}
     
-    for workflow_file in workflow_files:
+    for workflow_file, (metadata, error) in zip(workflow_files, parsed):
+        if error is not None:
+            console.print(f"⚠️  Failed to parse {workflow_file.name}: {error}")
+            continue
         try:
-            with open(workflow_file, 'r', encoding='utf-8') as f:
-                workflow_data = json.load(f)
-            
-            # Extract metadata
-            metadata = workflow_data.get("metadata", {})
             name = workflow_file.stem
             description = metadata.get("description", "No description available")
             category = metadata.get("category", "General")
@@ -191,18 +248,14 @@ def install_examples():
             
             workflow_info[name] = {
                 "file": workflow_file,
-                "description": description,
+                "description": _short(description, 40),  # Fits the table column
                 "category": category,
                 "installed": is_installed
             }
             
             # Create choice display
-            choice_text = f"{status} [{category}] {name}"
-            if len(description) > 50:
-                choice_text += f" - {description[:47]}..."
-            else:
-                choice_text += f" - {description}"
-                
+            choice_text = f"{status} [{category}] {name} - {_short(description, 50)}"
+            
             workflow_choices.append(questionary.Choice(choice_text, name))
             
         except Exception as e:
@@ -222,10 +275,7 @@ def install_examples():
     
     for name, info in workflow_info.items():
         status = "✅ Installed" if info["installed"] else "📦 Available"
-        description = info["description"]
-        if len(description) > 40:
-            description = description[:37] + "..."
-        table.add_row(name, info["category"], status, description)
+        table.add_row(name, info["category"], status, info["description"])
     
     console.print(table)
     
@@ -273,6 +323,8 @@ def install_examples():
         console.print(f"   ⏭️  Skipped: {skipped_count}")
     
     if installed_count > 0:
+        # Force the next install menu to rescan instead of trusting the cached listing
+        invalidate_dir_metadata(builtin_workflows_dir)
         console.print(f"\n💡 [bold yellow]New workflows installed successfully![/bold yellow]")
         console.print("🔄 [bold red]Please restart Pixelle service to load the new MCP tools.[/bold red]")
 
@@ -280,6 +332,10 @@ def install_examples():
 @workflow_app.command("open")
 def open_workflows_folder():
     """📁 Open the custom workflows folder in file manager"""
+    import platform
+    import shutil
+    import subprocess
+    from rich.panel import Panel
     
     from pixelle.utils.os_util import get_data_path
     
@@ -297,32 +353,29 @@ def open_workflows_folder():
         return
     
     try:
-        # Detect OS and open file manager
+        # Detect OS and open file manager; GUI launchers are not waited on
         system = platform.system().lower()
         
         if system == "darwin":  # macOS
-            subprocess.run(["open", str(custom_workflows_dir)], check=True)
+            subprocess.Popen(["open", str(custom_workflows_dir)])
             console.print("🍎 [green]Opened in Finder (macOS)[/green]")
         elif system == "windows":  # Windows
-            subprocess.run(["explorer", str(custom_workflows_dir)], check=True)
+            subprocess.Popen(["explorer", str(custom_workflows_dir)])
             console.print("🪟 [green]Opened in File Explorer (Windows)[/green]")
         elif system == "linux":  # Linux
-            # Try common Linux file managers
-            file_managers = ["xdg-open", "nautilus", "dolphin", "thunar", "pcmanfm"]
-            for fm in file_managers:
-                try:
-                    subprocess.run([fm, str(custom_workflows_dir)], check=True)
-                    console.print(f"🐧 [green]Opened with {fm} (Linux)[/green]")
-                    break
-                except (subprocess.CalledProcessError, FileNotFoundError):
-                    continue
+            # Use the first common Linux file manager found on PATH
+            file_managers = ("xdg-open", "nautilus", "dolphin", "thunar", "pcmanfm")
+            fm = next((name for name in file_managers if shutil.which(name)), None)
+            if fm:
+                subprocess.Popen([fm, str(custom_workflows_dir)])
+                console.print(f"🐧 [green]Opened with {fm} (Linux)[/green]")
             else:
                 # Fallback: print the path
                 console.print("🐧 [yellow]Could not auto-open file manager. Path copied above.[/yellow]")
         else:
             console.print(f"❓ [yellow]Unknown OS: {system}. Path copied above.[/yellow]")
             
-    except subprocess.CalledProcessError as e:
+    except OSError as e:
         console.print(f"❌ [red]Failed to open file manager: {e}[/red]")
         console.print("💡 [yellow]You can manually navigate to the path shown above.[/yellow]")
     except Exception as e:
@@ -335,6 +388,7 @@ def add_runninghub_workflow(
     tool_name: str = typer.Argument(..., help="Tool name for the workflow (must be valid Python identifier)")
 ):
     """📥 Add a workflow from RunningHub by workflow ID"""
+    from rich.panel import Panel
     
     from pixelle.cli.utils.display import show_header_info
     show_header_info()
@@ -349,11 +403,11 @@ def add_runninghub_workflow(
     
     try:
         # Import the RunningHub workflow handling function
-        import asyncio
+        from pixelle.cli.utils.aio import run_async
         from pixelle.utils.runninghub_util import handle_runninghub_workflow_save
         
-        # Run the async function
-        result = asyncio.run(handle_runninghub_workflow_save(workflow_id, tool_name))
+        # Run the async function on the shared CLI event loop
+        result = run_async(handle_runninghub_workflow_save(workflow_id, tool_name))
         
         if result["success"]:
             console.print("✅ [bold green]RunningHub workflow added successfully![/bold green]")
@@ -368,8 +422,31 @@ def add_runninghub_workflow(
         raise typer.Exit(1)
 
 
+_MENU_ITEMS = (
+    ("📋 List Current MCP Tools", "list"),
+    ("🌐 Add RunningHub Workflow", "add_runninghub"),
+    ("📥 Install Workflow Examples", "install"),
+    ("📁 Open Workflows Folder", "open"),
+    ("❌ Exit", "exit"),
+)
+
+_MENU_STYLE_RULES = [
+    ('question', 'bold'),
+    ('answer', 'fg:#ff9d00 bold'),
+    ('pointer', 'fg:#ff9d00 bold'),
+    ('highlighted', 'fg:#ff9d00 bold'),
+    ('selected', 'fg:#cc5454'),
+    ('separator', 'fg:#cc5454'),
+    ('instruction', ''),
+    ('text', ''),
+]
+
+
 def show_workflow_menu():
     """Show interactive workflow management menu"""
+    import questionary
+    from rich.panel import Panel
+    
     from pixelle.cli.utils.display import show_header_info
     
     # Show header
@@ -382,28 +459,16 @@ def show_workflow_menu():
         border_style="blue"
     ))
     
+    # Menu choices and style are constant, build them once for the whole session
+    menu_choices = [questionary.Choice(title, value) for title, value in _MENU_ITEMS]
+    menu_style = questionary.Style(_MENU_STYLE_RULES)
+    
     while True:
         try:
-            # Create menu choices
             choice = questionary.select(
                 "What would you like to do?",
-                choices=[
-                    questionary.Choice("📋 List Current MCP Tools", "list"),
-                    questionary.Choice("🌐 Add RunningHub Workflow", "add_runninghub"),
-                    questionary.Choice("📥 Install Workflow Examples", "install"), 
-                    questionary.Choice("📁 Open Workflows Folder", "open"),
-                    questionary.Choice("❌ Exit", "exit")
-                ],
-                style=questionary.Style([
-                    ('question', 'bold'),
-                    ('answer', 'fg:#ff9d00 bold'),
-                    ('pointer', 'fg:#ff9d00 bold'),
-                    ('highlighted', 'fg:#ff9d00 bold'),
-                    ('selected', 'fg:#cc5454'),
-                    ('separator', 'fg:#cc5454'),
-                    ('instruction', ''),
-                    ('text', ''),
-                ])
+                choices=menu_choices,
+                style=menu_style
             ).ask()
             
             if choice is None or choice == "exit":
@@ -5,14 +5,12 @@
 
 import questionary
 from pathlib import Path
-from rich.console import Console
 from rich.panel import Panel
 
 from pixelle.cli.utils.display import show_header_info, show_current_config, show_enhanced_help
 from pixelle.cli.utils.server_utils import start_pixelle_server, check_service_status
 from pixelle.cli.interactive.wizard import run_fresh_setup_wizard
-
-console = Console()
+from pixelle.cli.utils.console import console
 
 
 def show_main_menu():
@@ -21,8 +19,7 @@ def show_main_menu():
     # Show header information
     show_header_info()
     
-    console.print("\n📋 [bold]Current configuration status[/bold]")
-    show_current_config()
+    show_current_config(header="\n📋 [bold]Current configuration status[/bold]")
     
     action = questionary.select(
         "Please select the action to perform:",
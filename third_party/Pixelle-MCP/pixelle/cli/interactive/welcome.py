@@ -3,12 +3,10 @@
 
 """Welcome and initial setup detection for interactive mode."""
 
-from rich.console import Console
 
 from pixelle.cli.utils.display import show_welcome
 from pixelle.cli.utils.command_utils import detect_config_status
-
-console = Console()
+from pixelle.cli.utils.console import console
 
 
 def run_interactive_mode():
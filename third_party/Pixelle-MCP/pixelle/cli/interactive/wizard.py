@@ -3,25 +3,29 @@
 
 """Setup wizard for interactive configuration."""
 
-import questionary
-from rich.console import Console
+from pixelle.cli.utils.console import console
 
-from pixelle.cli.setup.execution_engines import setup_execution_engines_interactive
-from pixelle.cli.setup.service import setup_service_config
-from pixelle.cli.setup.config_saver import save_unified_config
-from pixelle.cli.setup.providers.manager import (
-    setup_multiple_llm_providers,
-    collect_all_selected_models,
-    select_default_model_interactively
-)
-from pixelle.cli.utils.server_utils import start_pixelle_server
 
-console = Console()
-
-
-def run_full_setup_wizard():
-    """Run full setup wizard"""
-    console.print("\n🚀 [bold]Start Pixelle MCP configuration wizard[/bold]\n")
+def _run_wizard(*, confirm_reset: bool):
+    """Run the shared configuration steps
+    
+    Args:
+        confirm_reset: True when reconfiguring an existing setup (after the user
+            confirmed the reset); only changes the wording of status messages
+    """
+    import questionary
+    
+    from pixelle.cli.setup.execution_engines import setup_execution_engines_interactive
+    from pixelle.cli.setup.service import setup_service_config
+    from pixelle.cli.setup.config_saver import save_unified_config
+    from pixelle.cli.setup.providers.manager import (
+        setup_multiple_llm_providers,
+        collect_all_selected_models,
+        select_default_model_interactively
+    )
+    from pixelle.cli.utils.server_utils import start_pixelle_server
+    
+    action = "Reconfiguration" if confirm_reset else "Configuration"
     
     try:
         # Step 1: Execution engines config (ComfyUI and/or RunningHub)
@@ -50,20 +54,26 @@ def run_full_setup_wizard():
         save_unified_config(comfyui_config, runninghub_config, llm_configs, service_config, selected_default_model)
         
         # Step 6: Ask to start immediately
-        console.print("\n✅ [bold green]Configuration completed![/bold green]")
+        console.print(f"\n✅ [bold green]{action} completed![/bold green]")
         if questionary.confirm("Start Pixelle MCP immediately?", default=True, instruction="(Y/n)").ask():
             start_pixelle_server()
             
     except KeyboardInterrupt:
-        console.print("\n\n❌ Configuration cancelled (Ctrl+C pressed)")
+        console.print(f"\n\n❌ {action} cancelled (Ctrl+C pressed)")
 
     except Exception as e:
         console.print(f"\n❌ Error during configuration: {e}")
 
 
+def run_full_setup_wizard():
+    """Run full setup wizard"""
+    console.print("\n🚀 [bold]Start Pixelle MCP configuration wizard[/bold]\n")
+    _run_wizard(confirm_reset=False)
+
 
 def run_fresh_setup_wizard():
     """Reconfigure Pixelle MCP (same process as initial setup)"""
+    import questionary
     from rich.panel import Panel
     
     console.print(Panel(
@@ -79,41 +89,4 @@ def run_fresh_setup_wizard():
         return
     
     console.print("\n🚀 [bold]Start initialization wizard[/bold]\n")
-    
-    try:
-        # Step 1: Execution engines config (ComfyUI and/or RunningHub)
-        runninghub_config, comfyui_config = setup_execution_engines_interactive()
-        if runninghub_config is None and comfyui_config is None:  # User cancelled
-            console.print("❌ Configuration cancelled")
-            return
-        
-        # Step 2: LLM configuration (multiple providers can be configured)
-        llm_configs = setup_multiple_llm_providers()
-        if not llm_configs:
-            console.print("❌ At least one LLM provider is required")
-            return
-        
-        # Step 3: Select default model (based on selected providers and models)
-        all_models = collect_all_selected_models(llm_configs)
-        selected_default_model = select_default_model_interactively(all_models)
-
-        # Step 4: Service configuration
-        service_config = setup_service_config()
-        if not service_config:
-            console.print("⚠️  Service configuration skipped, using default configuration")
-            service_config = {"port": "9004", "host": "localhost"}  # Use default value
-        
-        # Step 5: Save configuration
-        save_unified_config(comfyui_config, runninghub_config, llm_configs, service_config, selected_default_model)
-        
-        # Step 6: Ask if immediately start
-        console.print("\n✅ [bold green]Reconfiguration completed![/bold green]")
-        if questionary.confirm("Start Pixelle MCP immediately?", default=True, instruction="(Y/n)").ask():
-            start_pixelle_server()
-            
-    except KeyboardInterrupt:
-        console.print("\n\n❌ Reconfiguration cancelled (Ctrl+C pressed)")
-
-    except Exception as e:
-        console.print(f"\n❌ Error occurred during configuration: {e}")
-
+    _run_wizard(confirm_reset=True)
@@ -5,12 +5,9 @@
 
 from typing import Dict, Optional
 import questionary
-from rich.console import Console
 from rich.panel import Panel
 
-
-
-console = Console()
+from pixelle.cli.utils.console import console
 
 
 def setup_comfyui(default_url: str = None) -> Optional[Dict]:
@@ -3,18 +3,19 @@
 
 """Configuration saving and loading utilities."""
 
-from typing import Dict, List, Optional
+import os
+import shutil
+from typing import Dict, Iterable, List, Optional
 from pathlib import Path
-from rich.console import Console
 from rich.panel import Panel
 
+from pixelle.cli.setup.providers.config import ProviderConfig
 from pixelle.utils.config_util import build_env_lines
-
-console = Console()
+from pixelle.cli.utils.console import console
 
 
 def save_unified_config(comfyui_config: Optional[Dict], runninghub_config: Optional[Dict], 
-                       llm_configs: List[Dict], service_config: Dict, default_model: Optional[str] = None):
+                       llm_configs: List[ProviderConfig], service_config: Dict, default_model: Optional[str] = None):
     """Save unified configuration to .env file"""
     console.print(Panel(
         "💾 [bold]Save configuration[/bold]\n\n"
@@ -23,48 +24,76 @@ def save_unified_config(comfyui_config: Optional[Dict], runninghub_config: Optio
         border_style="magenta"
     ))
     
-    env_lines = build_env_lines(comfyui_config, runninghub_config, llm_configs, service_config, default_model)
+    env_lines, env_keys = build_env_lines(comfyui_config, runninghub_config, llm_configs, service_config, default_model)
     
     # Save to root path
     from pixelle.utils.os_util import ensure_pixelle_root_path
     pixelle_root = ensure_pixelle_root_path()
     env_path = Path(pixelle_root) / '.env'
     
-    with open(env_path, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(env_lines))
+    # Write to a sibling temp file and swap it in, so a crash never leaves a truncated .env.
+    # The file holds API keys: the temp file is created owner-only and takes over the
+    # mode of an existing .env, so a save never loosens the permissions.
+    payload = ('\n'.join(env_lines) + '\n').encode('utf-8')
+    tmp_path = env_path.with_name(env_path.name + '.tmp')
+    try:
+        tmp_path.unlink(missing_ok=True)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        if env_path.exists():
+            shutil.copymode(env_path, tmp_path)
+        os.replace(tmp_path, env_path)
+    except BaseException:
+        # Don't leave a partial file with secrets behind
+        tmp_path.unlink(missing_ok=True)
+        raise
     
     console.print("✅ [bold green]Configuration saved to .env file[/bold green]")
     
-    # Reload config immediately
-    reload_config()
+    # Reload config immediately, only the keys we just wrote can have changed
+    reload_config(env_keys)
 
 
-def reload_config():
-    """Reload environment variables and settings configuration"""
-    import os
-    from dotenv import load_dotenv
+def reload_config(env_keys: Optional[Iterable[str]] = None):
+    """Reload environment variables and settings configuration
+    
+    Args:
+        env_keys: Environment variable names to refresh on the settings object;
+            defaults to every key present in the .env file
+    """
+    from dotenv import dotenv_values
+    from pydantic import ValidationError
     
     # Force reload .env file from root path
     from pixelle.utils.os_util import get_pixelle_root_path
     pixelle_root = get_pixelle_root_path()
     env_path = Path(pixelle_root) / ".env"
-    if env_path.exists():
-        load_dotenv(env_path, override=True)
+    env_values = dotenv_values(env_path) if env_path.exists() else {}
+    for key, value in env_values.items():
+        if value is not None:
+            os.environ[key] = value
+    if env_keys is None:
+        env_keys = env_values.keys()
     
     # Set Chainlit environment variables
     from pixelle.utils.os_util import get_src_path
-    import os
     os.environ["CHAINLIT_APP_ROOT"] = get_src_path()
     
     # Update global settings instance values
     from pixelle import settings as settings_module
-    
-    # Create new Settings instance to get latest configuration
     from pixelle.settings import Settings
-    new_settings = Settings()
+    settings = settings_module.settings
     
-    # Update global settings object attributes
-    for field_name in new_settings.model_fields:
-        setattr(settings_module.settings, field_name, getattr(new_settings, field_name))
+    # Validate and assign only the affected fields instead of building a new Settings()
+    try:
+        for key in env_keys:
+            field_name = key.lower()
+            if field_name in Settings.model_fields and key in os.environ:
+                settings.__pydantic_validator__.validate_assignment(settings, field_name, os.environ[key])
+    except ValidationError:
+        new_settings = Settings()
+        for field_name in Settings.model_fields:
+            setattr(settings, field_name, getattr(new_settings, field_name))
     
     console.print("🔄 [bold blue]Configuration reloaded[/bold blue]")
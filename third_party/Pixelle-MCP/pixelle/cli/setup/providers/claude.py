@@ -3,31 +3,28 @@
 
 """Claude provider configuration."""
 
-from typing import Dict, Optional
-import questionary
-from rich.console import Console
+from __future__ import annotations
 
-console = Console()
+from pixelle.cli.setup.providers.config import ProviderConfig
 
 
-def configure_claude() -> Optional[Dict]:
+def configure_claude() -> ProviderConfig | None:
     """Configure Claude"""
+    from pixelle.cli.utils.prompt import ask_password, ask_text
+    from pixelle.cli.utils.console import console
+    
     console.print("\n🤖 [bold]Configure Claude[/bold]")
     console.print("Claude is a powerful AI assistant developed by Anthropic")
     console.print("Get API Key: https://console.anthropic.com/\n")
     
-    api_key = questionary.password("Please input your Claude API Key:").ask()
+    api_key = ask_password("Please input your Claude API Key:")
     if not api_key:
         return None
     
-    models = questionary.text(
+    models = ask_text(
         "Available models (optional):",
         default="claude-3-sonnet-20240229,claude-3-haiku-20240307",
         instruction="(multiple models separated by commas)"
-    ).ask()
+    )
     
-    return {
-        "provider": "claude",
-        "api_key": api_key,
-        "models": models
-    }
+    return ProviderConfig(provider="claude", api_key=api_key, models=models)
@@ -0,0 +1,26 @@
+# Copyright (C) 2025 AIDC-AI
+# This project is licensed under the MIT License (SPDX-License-identifier: MIT).
+
+"""LLM provider configuration record."""
+
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+# Leading whitespace, or trailing slashes followed by trailing whitespace;
+# same result as .strip().rstrip("/") in a single scan
+_URL_CLEAN = re.compile(r"\A\s+|/*\s*\Z")
+
+
+def clean_base_url(base_url: str) -> str:
+    """Strip surrounding whitespace and trailing slashes from a base URL"""
+    return _URL_CLEAN.sub("", base_url)
+
+
+@dataclass(slots=True, frozen=True)
+class ProviderConfig:
+    """Configuration collected for one LLM provider"""
+    provider: str
+    models: Optional[str]
+    api_key: str = ""
+    base_url: str = ""
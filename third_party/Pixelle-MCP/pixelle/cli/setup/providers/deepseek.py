@@ -3,31 +3,28 @@
 
 """DeepSeek provider configuration."""
 
-from typing import Dict, Optional
-import questionary
-from rich.console import Console
+from __future__ import annotations
 
-console = Console()
+from pixelle.cli.setup.providers.config import ProviderConfig
 
 
-def configure_deepseek() -> Optional[Dict]:
+def configure_deepseek() -> ProviderConfig | None:
     """Configure DeepSeek"""
+    from pixelle.cli.utils.prompt import ask_password, ask_text
+    from pixelle.cli.utils.console import console
+    
     console.print("\n🚀 [bold]Configure DeepSeek[/bold]")
     console.print("DeepSeek is a highly cost-effective code-specific model")
     console.print("Get API Key: https://platform.deepseek.com/api_keys\n")
     
-    api_key = questionary.password("Please input your DeepSeek API Key:").ask()
+    api_key = ask_password("Please input your DeepSeek API Key:")
     if not api_key:
         return None
     
-    models = questionary.text(
+    models = ask_text(
         "Available models (optional):",
         default="deepseek-chat,deepseek-coder",
         instruction="(multiple models separated by commas)"
-    ).ask()
+    )
     
-    return {
-        "provider": "deepseek",
-        "api_key": api_key,
-        "models": models
-    }
+    return ProviderConfig(provider="deepseek", api_key=api_key, models=models)
@@ -3,31 +3,28 @@
 
 """Gemini provider configuration."""
 
-from typing import Dict, Optional
-import questionary
-from rich.console import Console
+from __future__ import annotations
 
-console = Console()
+from pixelle.cli.setup.providers.config import ProviderConfig
 
 
-def configure_gemini() -> Optional[Dict]:
+def configure_gemini() -> ProviderConfig | None:
     """Configure Gemini"""
+    from pixelle.cli.utils.prompt import ask_password, ask_text
+    from pixelle.cli.utils.console import console
+    
     console.print("\n💎 [bold]Configure Google Gemini[/bold]")
     console.print("Google Gemini is the latest large language model from Google")
     console.print("Get API Key: https://makersuite.google.com/app/apikey\n")
     
-    api_key = questionary.password("Please input your Gemini API Key:").ask()
+    api_key = ask_password("Please input your Gemini API Key:")
     if not api_key:
         return None
     
-    models = questionary.text(
+    models = ask_text(
         "Available models (optional):",
         default="gemini-pro,gemini-pro-vision",
         instruction="(multiple models separated by commas)"
-    ).ask()
+    )
     
-    return {
-        "provider": "gemini",
-        "api_key": api_key,
-        "models": models
-    }
+    return ProviderConfig(provider="gemini", api_key=api_key, models=models)
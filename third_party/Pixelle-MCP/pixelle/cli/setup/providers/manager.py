@@ -3,22 +3,21 @@
 
 """LLM provider manager."""
 
-from typing import Dict, List, Optional
+from typing import List, Optional
 import questionary
-from rich.console import Console
 from rich.panel import Panel
 
+from pixelle.cli.setup.providers.config import ProviderConfig
 from pixelle.cli.setup.providers.openai import configure_openai
 from pixelle.cli.setup.providers.ollama import configure_ollama
 from pixelle.cli.setup.providers.gemini import configure_gemini
 from pixelle.cli.setup.providers.deepseek import configure_deepseek
 from pixelle.cli.setup.providers.claude import configure_claude
 from pixelle.cli.setup.providers.qwen import configure_qwen
+from pixelle.cli.utils.console import console
 
-console = Console()
 
-
-def configure_specific_llm(provider: str) -> Optional[Dict]:
+def configure_specific_llm(provider: str) -> Optional[ProviderConfig]:
     """Configure specific LLM provider"""
     
     if provider == "openai":
@@ -37,7 +36,7 @@ def configure_specific_llm(provider: str) -> Optional[Dict]:
     return None
 
 
-def setup_multiple_llm_providers() -> Optional[List[Dict]]:
+def setup_multiple_llm_providers() -> Optional[List[ProviderConfig]]:
     """Setup multiple LLM providers - Step 2"""
     console.print(Panel(
         "🤖 [bold]LLM provider configuration[/bold]\n\n"
@@ -65,7 +64,7 @@ def setup_multiple_llm_providers() -> Optional[List[Dict]]:
         
         # Filter configured providers
         remaining_providers = [p for p in available_providers 
-                             if p.value not in [cp["provider"] for cp in configured_providers]]
+                             if p.value not in [cp.provider for cp in configured_providers]]
         
         if not remaining_providers:
             console.print("✅ All available LLM providers are configured, automatically enter next step")
@@ -75,7 +74,7 @@ def setup_multiple_llm_providers() -> Optional[List[Dict]]:
         if configured_providers:
             console.print("\n📋 [bold]Configured providers:[/bold]")
             for provider in configured_providers:
-                console.print(f"  ✅ {provider['provider'].title()}")
+                console.print(f"  ✅ {provider.provider.title()}")
         
         # Select provider to configure
         if configured_providers:
@@ -111,7 +110,7 @@ def setup_multiple_llm_providers() -> Optional[List[Dict]]:
             configured_providers.append(provider_config)
             
             # Show selected models
-            models = provider_config.get('models', '')
+            models = provider_config.models
             if models:
                 model_list = [m.strip() for m in models.split(',')]
                 model_display = '、'.join(model_list)
@@ -139,12 +138,12 @@ def setup_multiple_llm_providers() -> Optional[List[Dict]]:
     return configured_providers
 
 
-def collect_all_selected_models(llm_configs: List[Dict]) -> List[str]:
+def collect_all_selected_models(llm_configs: List[ProviderConfig]) -> List[str]:
     """Collect all models from all configured providers, remove duplicates and maintain order."""
     seen = set()
     ordered_models: List[str] = []
     for conf in llm_configs or []:
-        models_str = (conf.get("models") or "").strip()
+        models_str = (conf.models or "").strip()
         if not models_str:
             continue
         for m in models_str.split(","):
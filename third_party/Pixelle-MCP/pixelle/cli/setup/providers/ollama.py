@@ -3,63 +3,59 @@
 
 """Ollama provider configuration."""
 
-from typing import Dict, Optional
-import questionary
-from rich.console import Console
+from __future__ import annotations
 
-from pixelle.utils.network_util import test_ollama_connection, get_ollama_models
+from pixelle.cli.setup.providers.config import ProviderConfig, clean_base_url
 
-console = Console()
 
-
-def configure_ollama() -> Optional[Dict]:
+def configure_ollama() -> ProviderConfig | None:
     """Configure Ollama"""
+    from pixelle.cli.utils.prompt import ask_checkbox, ask_text
+    from pixelle.utils.network_util import fetch_ollama_status
+    from pixelle.cli.utils.console import console
+    
     console.print("\n🏠 [bold]Configure Ollama (local model)[/bold]")
     console.print("Ollama can run open-source models locally, completely free and data does not leave the machine")
     console.print("Install Ollama: https://ollama.ai\n")
     
     default_base_url = "http://localhost:11434/v1"
-    base_url = questionary.text(
+    base_url = ask_text(
         "Ollama address:",
         default=default_base_url,
         instruction="(press Enter to use default, or input custom address)"
-    ).ask()
+    )
+    if base_url is None:
+        return None
+    base_url = clean_base_url(base_url)
     
     # Test connection
+    # One /api/tags request answers both "is it up" and "which models"
     console.print("🔌 Testing Ollama connection...")
-    if test_ollama_connection(base_url):
+    connected, models = fetch_ollama_status(base_url)
+    if connected:
         console.print("✅ Ollama connection successful")
         
-        # Get available models
-        models = get_ollama_models(base_url)
+        # Available models came with the connection test
         if models:
             console.print(f"📋 Found {len(models)} available models")
-            selected_models = questionary.checkbox(
+            selected_models = ask_checkbox(
                 "Please select the model to use:",
-                choices=[questionary.Choice(model, model) for model in models]
-            ).ask()
+                choices=models
+            )
             
             if selected_models:
-                return {
-                    "provider": "ollama", 
-                    "base_url": base_url,
-                    "models": ",".join(selected_models)
-                }
+                return ProviderConfig(provider="ollama", base_url=base_url, models=",".join(selected_models))
         else:
             console.print("⚠️  No available models found, you may need to download models first")
             console.print("e.g. ollama pull llama2")
             
-            models = questionary.text(
+            models = ask_text(
                 "Please manually specify models:",
                 instruction="(multiple models separated by commas)"
-            ).ask()
+            )
             
             if models:
-                return {
-                    "provider": "ollama",
-                    "base_url": base_url, 
-                    "models": models
-                }
+                return ProviderConfig(provider="ollama", base_url=base_url, models=models)
     else:
         console.print("❌ Cannot connect to Ollama")
         console.print("Please ensure Ollama is running")
@@ -3,34 +3,36 @@
 
 """OpenAI provider configuration."""
 
-from typing import Dict, Optional
-import questionary
-from rich.console import Console
+from __future__ import annotations
 
-from pixelle.utils.network_util import get_openai_models
+from pixelle.cli.setup.providers.config import ProviderConfig, clean_base_url
 
-console = Console()
 
-
-def configure_openai() -> Optional[Dict]:
+def configure_openai() -> ProviderConfig | None:
     """Configure OpenAI"""
+    from pixelle.cli.utils.prompt import ask_checkbox, ask_password, ask_text
+    from pixelle.utils.network_util import get_openai_models
+    from pixelle.cli.utils.console import console
+    
     console.print("\n🔥 [bold]Configure OpenAI compatible interface[/bold]")
     console.print("Support OpenAI official and all compatible OpenAI SDK providers")
     console.print("Including but not limited to: OpenAI, Azure OpenAI, various third-party proxy services, etc.")
     console.print("Get OpenAI official API Key: https://platform.openai.com/api-keys\n")
     
-    api_key = questionary.password("Please input your OpenAI API Key:").ask()
+    api_key = ask_password("Please input your OpenAI API Key:")
     if not api_key:
         return None
     api_key = api_key.strip()
     
     default_base_url = "https://api.openai.com/v1"
-    base_url = questionary.text(
+    base_url = ask_text(
         "OpenAI Base Url:",
         default=default_base_url,
         instruction="(press Enter to use default, or input custom base url)"
-    ).ask()
-    base_url = base_url.strip().rstrip('/')
+    )
+    if base_url is None:
+        return None
+    base_url = clean_base_url(base_url)
     
     # Try to get model list
     console.print("🔍 Getting available model list...")
@@ -44,36 +46,27 @@ def configure_openai() -> Optional[Dict]:
         console.print("   Function calling is required for this application to work properly.")
         console.print("   Common models that support function calling include: GPT-4, GPT-4.1, etc.\n")
         
-        # Create choices list with all available models
-        choices = []
-        for model in available_models:
-            choices.append(questionary.Choice(model, model, checked=False))
-        
-        selected_models = questionary.checkbox(
+        # Plain model names; questionary turns each into an unchecked Choice itself
+        selected_models = ask_checkbox(
             "Please select the model to use (space to select/cancel, enter to confirm):",
-            choices=choices,
+            choices=available_models,
             instruction="Use arrow keys to navigate, space to select/cancel, enter to confirm"
-        ).ask()
+        )
         
         if selected_models:
             models = ",".join(selected_models)
             console.print(f"✅ Selected models: {models}")
         else:
             console.print("⚠️  No models selected, using manual input")
-            models = questionary.text(
+            models = ask_text(
                 "Please input custom models:",
                 instruction="(Separate multiple models with commas)"
-            ).ask()
+            )
     else:
         console.print("⚠️  Cannot get model list, please input models manually")
-        models = questionary.text(
+        models = ask_text(
             "Please input model list:",
             instruction="(multiple models separated by commas, e.g. gpt-4,gpt-3.5-turbo)"
-        ).ask()
+        )
     
-    return {
-        "provider": "openai",
-        "api_key": api_key,
-        "base_url": base_url,
-        "models": models
-    }
+    return ProviderConfig(provider="openai", api_key=api_key, base_url=base_url, models=models)
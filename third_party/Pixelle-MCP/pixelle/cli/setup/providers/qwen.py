@@ -3,31 +3,28 @@
 
 """Qwen provider configuration."""
 
-from typing import Dict, Optional
-import questionary
-from rich.console import Console
+from __future__ import annotations
 
-console = Console()
+from pixelle.cli.setup.providers.config import ProviderConfig
 
 
-def configure_qwen() -> Optional[Dict]:
+def configure_qwen() -> ProviderConfig | None:
     """Configure Qwen"""
+    from pixelle.cli.utils.prompt import ask_password, ask_text
+    from pixelle.cli.utils.console import console
+    
     console.print("\n🌟 [bold]Configure Alibaba Tongyi Qwen[/bold]")
     console.print("Tongyi Qwen is a large language model developed by Alibaba")
     console.print("Get API Key: https://dashscope.console.aliyun.com/\n")
     
-    api_key = questionary.password("Please input your Qwen API Key:").ask()
+    api_key = ask_password("Please input your Qwen API Key:")
     if not api_key:
         return None
     
-    models = questionary.text(
+    models = ask_text(
         "Available models (optional):",
         default="qwen-plus,qwen-turbo",
         instruction="(multiple models separated by commas)"
-    ).ask()
+    )
     
-    return {
-        "provider": "qwen",
-        "api_key": api_key, 
-        "models": models
-    }
+    return ProviderConfig(provider="qwen", api_key=api_key, models=models)
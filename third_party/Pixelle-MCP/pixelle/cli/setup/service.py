@@ -6,12 +6,9 @@
 from typing import Dict, Optional
 import socket
 import questionary
-from rich.console import Console
 from rich.panel import Panel
 
-
-
-console = Console()
+from pixelle.cli.utils.console import console
 
 
 def setup_service_config() -> Optional[Dict]:
@@ -0,0 +1,33 @@
+# Copyright (C) 2025 AIDC-AI
+# This project is licensed under the MIT License (SPDX-License-identifier: MIT).
+
+"""Asyncio helpers for synchronous CLI commands."""
+
+import asyncio
+import atexit
+from typing import Any, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+_runner: Optional[asyncio.Runner] = None
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on a process-wide event loop.
+    
+    Unlike ``asyncio.run``, the loop (and anything bound to it, such as HTTP
+    connection pools) is kept alive between calls, so repeated commands in the
+    interactive menu don't pay loop setup and teardown each time.
+    """
+    global _runner
+    if _runner is None:
+        _runner = asyncio.Runner()
+        atexit.register(_close_runner)
+    return _runner.run(coro)
+
+
+def _close_runner():
+    global _runner
+    if _runner is not None:
+        _runner.close()
+        _runner = None
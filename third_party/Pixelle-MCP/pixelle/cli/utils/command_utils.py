@@ -4,10 +4,8 @@
 """Command-line utility functions."""
 
 from pathlib import Path
-from rich.console import Console
-
-console = Console()
 
+from pixelle.cli.utils.console import console
 
 
 def detect_config_status() -> str:
@@ -21,8 +19,6 @@ def detect_config_status() -> str:
     
     # Check if .env is a directory (common Docker issue)
     if env_file.is_dir():
-        from rich.console import Console
-        console = Console()
         console.print("\n❌ [bold red]Configuration Error: .env is a directory![/bold red]")
         console.print("💡 This happens when Docker creates a directory instead of mounting a file")
         console.print("\n🔧 [bold]Fix steps:[/bold]")
@@ -0,0 +1,9 @@
+# Copyright (C) 2025 AIDC-AI
+# This project is licensed under the MIT License (SPDX-License-identifier: MIT).
+
+"""Shared Rich console for CLI output."""
+
+from rich.console import Console
+
+# One console for the whole CLI, so the terminal is probed only once
+console = Console()
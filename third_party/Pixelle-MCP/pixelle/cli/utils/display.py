@@ -3,15 +3,19 @@
 
 """Display utility functions for CLI."""
 
-from rich.console import Console
+import functools
+from typing import Optional
+
+from rich.console import Group
 from rich.panel import Panel
 from rich.table import Table
 
-console = Console()
+from pixelle.cli.utils.console import console
 
 
-def show_welcome():
-    """Show welcome message"""
+@functools.lru_cache(maxsize=None)
+def _welcome_panel() -> Panel:
+    """Build the (static) welcome panel once"""
     welcome_text = """
 🎨 [bold blue]Pixelle MCP 2.0[/bold blue]
 A simple solution to convert ComfyUI workflow to MCP tool
@@ -22,21 +26,42 @@ A simple solution to convert ComfyUI workflow to MCP tool
 🤖 Support multiple mainstream LLMs (OpenAI, Ollama, Gemini, etc.)
 """
     
-    console.print(Panel(
+    return Panel(
         welcome_text,
         title="Welcome to Pixelle MCP",
         border_style="blue",
         padding=(1, 2)
-    ))
+    )
 
 
-def show_header_info():
-    """Show version and root path information"""
-    # Show version information
+def show_welcome():
+    """Show welcome message"""
+    console.print(_welcome_panel())
+
+
+@functools.lru_cache(maxsize=1)
+def _pixelle_version() -> str:
+    """Read the installed package version from its metadata, falling back to the package attribute"""
+    from importlib.metadata import version, PackageNotFoundError
+    try:
+        return version("pixelle")
+    except PackageNotFoundError:
+        pass
+    # Development checkout without installed metadata
     try:
         from pixelle import __version__
-        console.print(f"🚀 [bold green]Pixelle Version:[/bold green] {__version__}")
+        return __version__
     except ImportError:
+        return "unknown"
+
+
+def show_header_info():
+    """Show version and root path information"""
+    # Show version information
+    pixelle_version = _pixelle_version()
+    if pixelle_version != "unknown":
+        console.print(f"🚀 [bold green]Pixelle Version:[/bold green] {pixelle_version}")
+    else:
         console.print("🚀 [bold yellow]Pixelle Version:[/bold yellow] unknown")
     
     # Show current root path
@@ -45,36 +70,61 @@ def show_header_info():
     console.print(f"🗂️  [bold blue]Root Path:[/bold blue] {current_root_path}")
 
 
-def show_current_config():
-    """Show current configuration"""
+def show_current_config(header: Optional[str] = None):
+    """Show current configuration, optionally preceded by a header line"""
     from pixelle.settings import settings
     
-    # Create configuration table
-    table = Table(title="Current configuration", show_header=True, header_style="bold magenta")
-    table.add_column("Configuration item", style="cyan", width=20)
-    table.add_column("Current value", style="green")
-    
+    # Collect rows first, then build the table in one pass
     # Service configuration
-    table.add_row("Service address", f"http://{settings.host}:{settings.port}")
+    rows = [("Service address", f"http://{settings.host}:{settings.port}")]
     
     # Execution engines configuration
-    if hasattr(settings, 'comfyui_base_url') and settings.comfyui_base_url:
-        table.add_row("ComfyUI address", settings.comfyui_base_url)
-    if hasattr(settings, 'runninghub_api_key') and settings.runninghub_api_key:
-        table.add_row("RunningHub", "✅ Configured")
+    comfyui_base_url = getattr(settings, 'comfyui_base_url', None)
+    if comfyui_base_url:
+        rows.append(("ComfyUI address", comfyui_base_url))
+    if getattr(settings, 'runninghub_api_key', None):
+        rows.append(("RunningHub", "✅ Configured"))
     
     # LLM configuration
     providers = settings.get_configured_llm_providers()
     if providers:
-        table.add_row("LLM providers", ", ".join(providers))
+        rows.append(("LLM providers", ", ".join(providers)))
         models = settings.get_all_available_models()
         if models:
-            table.add_row("Available models", f"{len(models)} models")
-            table.add_row("Default model", settings.chainlit_chat_default_model)
+            rows.append(("Available models", f"{len(models)} models"))
+            rows.append(("Default model", settings.chainlit_chat_default_model))
     else:
-        table.add_row("LLM providers", "[red]Not configured[/red]")
+        rows.append(("LLM providers", "[red]Not configured[/red]"))
+    
+    # Create configuration table
+    table = Table(title="Current configuration", show_header=True, header_style="bold magenta")
+    table.add_column("Configuration item", style="cyan", width=20)
+    table.add_column("Current value", style="green")
+    for row in rows:
+        table.add_row(*row)
     
-    console.print(table)
+    console.print(Group(header, table) if header else table)
+
+
+_HELP_RESOURCE_LINES = (
+    "• 📚 Documentation: https://github.com/AIDC-AI/Pixelle-MCP",
+    "• 🐛 Issue feedback: https://github.com/AIDC-AI/Pixelle-MCP/issues",
+    "• 💬 Community discussion: https://github.com/AIDC-AI/Pixelle-MCP#-community",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _help_resources() -> Group:
+    """Build the (static) help resources block once, with its lines already parsed and highlighted"""
+    return Group(
+        Panel(
+            "📚 [bold]More Help Resources[/bold]",
+            title="Help Resources",
+            border_style="blue",
+            padding=(0, 1)
+        ),
+        *(console.render_str(line) for line in _HELP_RESOURCE_LINES),
+    )
 
 
 def show_enhanced_help(ctx=None):
@@ -86,13 +136,4 @@ def show_enhanced_help(ctx=None):
         console.print(ctx.get_help())
     
     # Show additional help resources
-    console.print(Panel(
-        "📚 [bold]More Help Resources[/bold]",
-        title="Help Resources",
-        border_style="blue",
-        padding=(0, 1)
-    ))
-    
-    console.print("• 📚 Documentation: https://github.com/AIDC-AI/Pixelle-MCP")
-    console.print("• 🐛 Issue feedback: https://github.com/AIDC-AI/Pixelle-MCP/issues")
-    console.print("• 💬 Community discussion: https://github.com/AIDC-AI/Pixelle-MCP#-community")
+    console.print(_help_resources())
@@ -0,0 +1,61 @@
+# Copyright (C) 2025 AIDC-AI
+# This project is licensed under the MIT License (SPDX-License-identifier: MIT).
+
+"""Interactive prompt helpers for the setup wizard.
+
+Text and password questions go through one shared prompt_toolkit session
+instead of a new questionary ``PromptSession`` (application, key bindings and
+merged style) per question. The rendering matches questionary's default look.
+List questions still use questionary, which provides the select/checkbox
+widgets; the helpers only fold in ``.ask()``.
+"""
+
+import functools
+from typing import Any, List, Optional, Sequence
+
+_KBI_MESSAGE = "Cancelled by user"
+
+
+@functools.lru_cache(maxsize=1)
+def _text_session():
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.history import DummyHistory
+    from prompt_toolkit.lexers import SimpleLexer
+    from questionary.constants import DEFAULT_STYLE
+    
+    # No history: answers include API keys and must not be recallable with the up arrow
+    return PromptSession(style=DEFAULT_STYLE, lexer=SimpleLexer("class:answer"), history=DummyHistory())
+
+
+def _ask_line(message: str, default: str, instruction: Optional[str], is_password: bool) -> Optional[str]:
+    tokens = [("class:qmark", "?"), ("class:question", f" {message} ")]
+    if instruction:
+        tokens.append(("class:instruction", f" {instruction} "))
+    try:
+        return _text_session().prompt(tokens, default=default, is_password=is_password)
+    except KeyboardInterrupt:
+        # Same contract as questionary's ask(): report and return None
+        print(f"\n{_KBI_MESSAGE}\n")
+        return None
+
+
+def ask_text(message: str, default: str = "", instruction: Optional[str] = None) -> Optional[str]:
+    """Ask for a line of text; returns None if the user cancels"""
+    return _ask_line(message, default, instruction, is_password=False)
+
+
+def ask_password(message: str, instruction: Optional[str] = None) -> Optional[str]:
+    """Ask for a secret without echoing it; returns None if the user cancels"""
+    return _ask_line(message, "", instruction, is_password=True)
+
+
+def ask_select(message: str, choices: Sequence[Any], **kwargs) -> Optional[Any]:
+    """Ask the user to pick one of ``choices``; returns None if the user cancels"""
+    import questionary
+    return questionary.select(message, choices=choices, **kwargs).ask()
+
+
+def ask_checkbox(message: str, choices: Sequence[Any], **kwargs) -> Optional[List[Any]]:
+    """Ask the user to pick any of ``choices``; returns None if the user cancels"""
+    import questionary
+    return questionary.checkbox(message, choices=choices, **kwargs).ask()
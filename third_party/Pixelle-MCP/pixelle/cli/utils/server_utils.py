@@ -4,7 +4,6 @@
 """Server management utility functions."""
 
 import typer
-from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
@@ -19,8 +18,7 @@ from pixelle.utils.network_util import (
     test_comfyui_connection,
     check_url_status,
 )
-
-console = Console()
+from pixelle.cli.utils.console import console
 
 
 def start_pixelle_server(daemon: bool = False, force: bool = False):
@@ -217,20 +215,21 @@ def check_service_status():
     engines_working = 0
     
     # Check ComfyUI if configured
-    if hasattr(settings, 'comfyui_base_url') and settings.comfyui_base_url:
+    comfyui_base_url = getattr(settings, 'comfyui_base_url', None)
+    if comfyui_base_url:
         engines_checked += 1
-        comfyui_status = test_comfyui_connection(settings.comfyui_base_url)
+        comfyui_status = test_comfyui_connection(comfyui_base_url)
         if comfyui_status:
             engines_working += 1
         status_table.add_row(
             "ComfyUI (Local)",
-            settings.comfyui_base_url,
+            comfyui_base_url,
             "🟢 Connected" if comfyui_status else "🔴 Connection failed",
             "Local workflow execution" if comfyui_status else "Please check if ComfyUI is running"
         )
     
     # Check RunningHub if configured
-    if hasattr(settings, 'runninghub_api_key') and settings.runninghub_api_key:
+    if getattr(settings, 'runninghub_api_key', None):
         engines_checked += 1
         # For RunningHub, we just check if API key is configured
         # Actual connectivity would require an API call
@@ -0,0 +1,152 @@
+# Copyright (C) 2025 AIDC-AI
+# This project is licensed under the MIT License (SPDX-License-identifier: MIT).
+
+"""Workflow metadata reading with an on-disk cache keyed by file mtime and size."""
+
+import atexit
+import functools
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+_cache = None
+_dirty = False
+_load_lock = threading.Lock()
+
+
+@functools.cache
+def _metadata_decoder():
+    """Return a ``bytes -> metadata dict`` decoder using the fastest available JSON library.
+
+    msgspec decodes into a struct that only materializes ``metadata`` and skips
+    the (potentially large) node graph; orjson and stdlib json decode the whole
+    document.
+    """
+    try:
+        import msgspec
+
+        class _WorkflowFile(msgspec.Struct):
+            metadata: dict = {}
+
+        decoder = msgspec.json.Decoder(_WorkflowFile)
+        return lambda data: decoder.decode(data).metadata
+    except ImportError:
+        pass
+    try:
+        import orjson
+        loads = orjson.loads
+    except ImportError:
+        loads = json.loads
+    return lambda data: loads(data).get("metadata", {})
+
+
+def read_workflow_metadata(workflow_file: Path) -> dict:
+    """Read only the metadata section of a workflow JSON file (uncached)."""
+    return _metadata_decoder()(Path(workflow_file).read_bytes())
+
+
+def _cache_file() -> Path:
+    from pixelle.utils.os_util import get_data_path
+    return Path(get_data_path("workflow_meta_cache.json"))
+
+
+def _load_cache() -> dict:
+    global _cache
+    if _cache is None:
+        # get_metadata() may be called from worker threads; load exactly once
+        with _load_lock:
+            if _cache is None:
+                try:
+                    cache = json.loads(_cache_file().read_bytes())
+                    if not isinstance(cache.get("files"), dict):
+                        raise ValueError("invalid cache layout")
+                except (OSError, ValueError, AttributeError):
+                    cache = {"files": {}}
+                atexit.register(_save_cache)
+                _cache = cache
+    return _cache
+
+
+def _save_cache():
+    """Flush the cache to disk if it changed; failures only cost a re-parse next time."""
+    global _dirty
+    if not _dirty or _cache is None:
+        return
+    try:
+        cache_file = _cache_file()
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(cache_file.name + ".tmp")
+        tmp_file.write_text(json.dumps(_cache, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_file, cache_file)
+        _dirty = False
+    except OSError:
+        pass
+
+
+def get_metadata(workflow_file: Path) -> dict:
+    """Return the workflow's metadata, decoding the file only if it changed since last time.
+
+    Args:
+        workflow_file: Workflow JSON file
+
+    Returns:
+        dict: The workflow's ``metadata`` section
+    """
+    global _dirty
+    workflow_file = Path(workflow_file)
+    st = workflow_file.stat()
+    files = _load_cache()["files"]
+    key = str(workflow_file.resolve())
+
+    entry = files.get(key)
+    if entry and entry.get("mtime") == st.st_mtime_ns and entry.get("size") == st.st_size:
+        return entry["meta"]
+
+    meta = read_workflow_metadata(workflow_file)
+    files[key] = {"mtime": st.st_mtime_ns, "size": st.st_size, "meta": meta}
+    _dirty = True
+    return meta
+
+
+def get_dir_metadata(directory: Path) -> Optional[Dict[str, dict]]:
+    """Return the cached ``{file name: metadata}`` listing of a workflow directory.
+    
+    The listing is only returned while the directory's own st_mtime_ns still
+    matches the recorded value, which lets callers skip globbing and per-file
+    stats entirely. Files edited in place without being re-created don't
+    change the directory mtime; built-in workflow directories are only
+    replaced on upgrade, so that is acceptable there.
+    
+    Args:
+        directory: Workflow directory
+        
+    Returns:
+        Optional[Dict[str, dict]]: Cached listing, or None if missing or stale
+    """
+    entry = _load_cache().get("dirs", {}).get(str(Path(directory).resolve()))
+    if not entry:
+        return None
+    try:
+        if Path(directory).stat().st_mtime_ns != entry.get("_dir_mtime_ns"):
+            return None
+    except OSError:
+        return None
+    return entry.get("entries")
+
+
+def store_dir_metadata(directory: Path, dir_mtime_ns: int, entries: Dict[str, dict]):
+    """Record the ``{file name: metadata}`` listing of a directory scanned at ``dir_mtime_ns``."""
+    global _dirty
+    dirs = _load_cache().setdefault("dirs", {})
+    dirs[str(Path(directory).resolve())] = {"_dir_mtime_ns": dir_mtime_ns, "entries": entries}
+    _dirty = True
+
+
+def invalidate_dir_metadata(directory: Path):
+    """Drop the cached listing of a directory so the next scan re-reads it."""
+    global _dirty
+    dirs = _load_cache().get("dirs", {})
+    if dirs.pop(str(Path(directory).resolve()), None) is not None:
+        _dirty = True
@@ -1,9 +1,13 @@
 # Copyright (C) 2025 AIDC-AI
 # This project is licensed under the MIT License (SPDX-License-identifier: MIT).
 
-from .facade import execute_workflow, get_workflow_metadata, ComfyUIClient
-from .runninghub_client import RunningHubClient, get_runninghub_client
-from .runninghub_executor import RunningHubExecutor
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .facade import execute_workflow, get_workflow_metadata, ComfyUIClient
+    from .runninghub_client import RunningHubClient, get_runninghub_client
+    from .runninghub_executor import RunningHubExecutor
 
 __all__ = [
     'execute_workflow', 
@@ -12,4 +16,28 @@ __all__ = [
     'RunningHubClient',
     'get_runninghub_client',
     'RunningHubExecutor'
-]
\ No newline at end of file
+]
+
+# Public names are resolved on first access (PEP 562) so importing the package
+# doesn't pull in the executors and their HTTP/websocket dependencies.
+_LAZY = {
+    'execute_workflow': '.facade',
+    'get_workflow_metadata': '.facade',
+    'ComfyUIClient': '.facade',
+    'RunningHubClient': '.runninghub_client',
+    'get_runninghub_client': '.runninghub_client',
+    'RunningHubExecutor': '.runninghub_executor',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # Later lookups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
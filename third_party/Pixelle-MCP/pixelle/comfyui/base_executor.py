@@ -3,29 +3,36 @@
 
 import os
 import json
-import copy
-import tempfile
+import time
+import asyncio
+import hashlib
 import mimetypes
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from http.cookies import SimpleCookie
 from urllib.parse import urlparse
 from typing import Any, Optional, Dict, List, Tuple
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 import aiohttp
-import random
+import aiofiles
+import secrets
 
 from pixelle.logger import logger
-from pixelle.utils.file_util import download_files
+from pixelle.utils.file_util import download_files, get_ext_from_content_type
 from pixelle.utils.file_uploader import upload
 from pixelle.comfyui.workflow_parser import WorkflowParser, WorkflowMetadata
 from pixelle.comfyui.models import ExecuteResult
 from pixelle.utils.os_util import get_data_path
+from pixelle.utils.workflow_source_util import invalidate_workflow_json
+from pixelle.utils.http_session_util import SessionPool
 from pixelle.settings import settings
 
 # Configuration variables
 COMFYUI_BASE_URL = settings.comfyui_base_url
 COMFYUI_API_KEY = settings.comfyui_api_key
 COMFYUI_COOKIES = settings.comfyui_cookies
+COMFYUI_COOKIES_TTL = settings.comfyui_cookies_ttl
 
 # Node types that need special media upload handling
 MEDIA_UPLOAD_NODE_TYPES = {
@@ -37,11 +44,158 @@ MEDIA_UPLOAD_NODE_TYPES = {
 TEMP_DIR = get_data_path("temp")
 os.makedirs(TEMP_DIR, exist_ok=True)
 
+# Output file extension -> bucket index in _split_media_by_suffix: 0 images, 1 videos, 2 audios
+_EXT_TO_BUCKET = {
+    **dict.fromkeys(('png', 'jpg', 'jpeg', 'webp', 'bmp', 'tiff'), 0),
+    **dict.fromkeys(('mp4', 'mov', 'avi', 'webm', 'gif'), 1),
+    **dict.fromkeys(('mp3', 'wav', 'flac', 'ogg', 'aac', 'm4a', 'wma', 'opus'), 2),
+}
+
+# MIME types of common upload media, checked before falling back to mimetypes.guess_type
+_EXT_TO_MIME = {
+    '.png': 'image/png', '.jpg': 'image/jpeg', '.jpeg': 'image/jpeg', '.webp': 'image/webp',
+    '.bmp': 'image/bmp', '.tiff': 'image/tiff', '.gif': 'image/gif',
+    '.mp4': 'video/mp4', '.mov': 'video/quicktime', '.avi': 'video/x-msvideo', '.webm': 'video/webm',
+    '.mp3': 'audio/mpeg', '.wav': 'audio/wav', '.flac': 'audio/flac', '.ogg': 'audio/ogg',
+    '.aac': 'audio/aac', '.m4a': 'audio/mp4', '.opus': 'audio/opus',
+}
+
+UPLOAD_CHUNK_SIZE = 256 * 1024
+
+
+async def _iter_file_chunks(file_path: str):
+    """Read a file in chunks without blocking the event loop"""
+    async with aiofiles.open(file_path, 'rb') as f:
+        while chunk := await f.read(UPLOAD_CHUNK_SIZE):
+            yield chunk
+
+# Parsed COMFYUI_COOKIES, shared by all executors: (expires at, in time.monotonic(), cookies).
+# Static cookie strings never expire; cookies fetched from a URL are refetched after COMFYUI_COOKIES_TTL.
+_cookies_cache: Optional[Tuple[float, Optional[Dict[str, str]]]] = None
+_cookies_lock: Optional[asyncio.Lock] = None
+_cookies_lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_cookies_lock() -> asyncio.Lock:
+    """Lock serializing cookie refreshes on the running event loop (a lock can't be shared across loops)"""
+    global _cookies_lock, _cookies_lock_loop
+    loop = asyncio.get_running_loop()
+    if _cookies_lock is None or _cookies_lock_loop is not loop:
+        _cookies_lock = asyncio.Lock()
+        _cookies_lock_loop = loop
+    return _cookies_lock
+
+
+def invalidate_comfyui_cookies():
+    """Forget the cached cookies so the next request parses (or fetches) them again"""
+    global _cookies_cache
+    _cookies_cache = None
+
+
+# Parsed workflow metadata: path -> (st_mtime_ns, st_size, metadata)
+_workflow_metadata_cache: Dict[str, Tuple[int, int, WorkflowMetadata]] = {}
+
+
+def invalidate_workflow_cache(workflow_file: Optional[str] = None):
+    """Drop cached metadata and JSON of one workflow file (or of all files), e.g. for hot reload"""
+    if workflow_file is None:
+        _workflow_metadata_cache.clear()
+    else:
+        _workflow_metadata_cache.pop(os.fspath(workflow_file), None)
+    invalidate_workflow_json(workflow_file)
+
+
+def _cookie_header(cookies: Optional[Dict[str, str]]) -> Dict[str, str]:
+    """Cookie request header for the cookies (empty if there are none)"""
+    if not cookies:
+        return {}
+    jar = SimpleCookie()
+    for name, value in cookies.items():
+        jar[name] = value
+    return {"Cookie": "; ".join(morsel.OutputString() for morsel in jar.values())}
+
+
+# Process-wide cache of transferred result files, shared by all executors:
+# (source URL, cookies fingerprint) -> (created at, future of the uploaded URL).
+# Concurrent executions producing the same output URL await one transfer.
+URL_TRANSFER_CACHE_TTL = 600  # seconds
+URL_TRANSFER_CACHE_MAX_SIZE = 1024
+_url_transfer_cache: "OrderedDict[Tuple[str, str], Tuple[float, asyncio.Future]]" = OrderedDict()
+
+
+def _cookies_fingerprint(cookies: Optional[Dict[str, str]]) -> str:
+    """Stable hash of the cookies, so files fetched with different credentials are never shared"""
+    if not cookies:
+        return ""
+    return hashlib.sha256(json.dumps(cookies, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+async def _transfer_urls_shared(urls: List[str], cookies: Optional[Dict[str, str]]) -> List[str]:
+    """Download and re-upload unique ``urls``, reusing finished and in-flight transfers
+    
+    Cache lookups and inserts happen without awaiting in between, so no lock is
+    needed on the event loop. Failed transfers are dropped from the cache and
+    re-raised to every waiter.
+    """
+    loop = asyncio.get_running_loop()
+    cookies_key = _cookies_fingerprint(cookies)
+    now = time.monotonic()
+    
+    owned: Dict[str, asyncio.Future] = {}
+    pending: Dict[str, asyncio.Future] = {}
+    for url in urls:
+        key = (url, cookies_key)
+        entry = _url_transfer_cache.get(key)
+        if entry is not None:
+            created, future = entry
+            failed = future.done() and (future.cancelled() or future.exception() is not None)
+            # Futures belong to one event loop; entries from another loop are useless here
+            if now - created < URL_TRANSFER_CACHE_TTL and not failed and future.get_loop() is loop:
+                _url_transfer_cache.move_to_end(key)
+                pending[url] = future
+                continue
+            del _url_transfer_cache[key]
+        future = loop.create_future()
+        _url_transfer_cache[key] = (now, future)
+        owned[url] = future
+    
+    while len(_url_transfer_cache) > URL_TRANSFER_CACHE_MAX_SIZE:
+        _url_transfer_cache.popitem(last=False)
+    
+    if owned:
+        try:
+            async with download_files(list(owned), cookies=cookies) as temp_files:
+                # upload() is blocking, so run the uploads concurrently in worker threads;
+                # wait for all of them before the temp files are removed
+                results = await asyncio.gather(
+                    *(asyncio.to_thread(upload, temp_file) for temp_file in temp_files),
+                    return_exceptions=True,
+                )
+                for result, future in zip(results, owned.values()):
+                    if isinstance(result, BaseException):
+                        raise result
+                    future.set_result(result)
+        except BaseException as e:
+            error = e if isinstance(e, Exception) else Exception("Result file transfer was interrupted")
+            for url, future in owned.items():
+                if not future.done():
+                    future.set_exception(error)
+                    future.exception()  # Mark retrieved; waiters (if any) still get it
+                    _url_transfer_cache.pop((url, cookies_key), None)
+            raise
+    
+    # shield(): a cancelled waiter must not cancel a transfer other executions await
+    return [await asyncio.shield(owned.get(url) or pending[url]) for url in urls]
+
+
 class ComfyUIExecutor(ABC):
     """ComfyUI executor abstract base class"""
     
     def __init__(self, base_url: str = None):
         self.base_url = (base_url or COMFYUI_BASE_URL).rstrip('/')
+        # HTTP session kept alive on the server loop, and the cookies it currently sends
+        self._session_pool = SessionPool()
+        self._pooled_cookies: Optional[Dict[str, str]] = None
         
     @abstractmethod
     async def execute_workflow(self, workflow_file: str, params: Dict[str, Any] = None) -> ExecuteResult:
@@ -50,19 +204,46 @@ class ComfyUIExecutor(ABC):
     
     async def _parse_comfyui_cookies(self) -> Optional[Dict[str, str]]:
         """Parse COMFYUI_COOKIES configuration and return cookies dictionary
+        
+        The result is cached: static cookies are parsed once, cookies fetched from
+        a URL are reused for COMFYUI_COOKIES_TTL seconds. Concurrent callers wait
+        for a single refresh instead of each fetching the URL.
+        """
+        global _cookies_cache
+        if not COMFYUI_COOKIES:
+            return None
+        
+        if _cookies_cache is not None and time.monotonic() < _cookies_cache[0]:
+            return _cookies_cache[1]
+        
+        async with _get_cookies_lock():
+            # Another task may have refreshed the cookies while this one waited
+            if _cookies_cache is not None and time.monotonic() < _cookies_cache[0]:
+                return _cookies_cache[1]
+            
+            cookies, from_url = await self._load_comfyui_cookies()
+            # A failed URL fetch is not cached, so the next call retries it
+            if cookies is not None or not from_url:
+                expires_at = time.monotonic() + COMFYUI_COOKIES_TTL if from_url else float("inf")
+                _cookies_cache = (expires_at, cookies)
+            return cookies
+
+    async def _load_comfyui_cookies(self) -> Tuple[Optional[Dict[str, str]], bool]:
+        """Load cookies from the COMFYUI_COOKIES configuration (uncached)
         Supports three formats:
         1. HTTP URL - Access cookies from a URL
         2. JSON string format - directly parse
         3. Key-value string format - parse to dictionary
+        
+        Returns:
+            (cookies or None on failure, whether they came from a URL)
         """
-        if not COMFYUI_COOKIES:
-            return None
+        content = COMFYUI_COOKIES.strip()
+        from_url = content.startswith(('http://', 'https://'))
         
         try:
-            content = COMFYUI_COOKIES.strip()
-            
             # Check if it is an HTTP URL
-            if content.startswith(('http://', 'https://')):
+            if from_url:
                 async with aiohttp.ClientSession() as session:
                     async with session.get(content) as response:
                         if response.status != 200:
@@ -73,67 +254,86 @@ class ComfyUIExecutor(ABC):
             
             # Parse cookies content
             if content.startswith('{'):
-                return json.loads(content)
+                return json.loads(content), from_url
             else:
-                cookies = {}
-                for pair in content.split(';'):
-                    if '=' in pair:
-                        k, v = pair.strip().split('=', 1)
-                        cookies[k.strip()] = v.strip()
-                return cookies
+                # Cookie header syntax: handles quoted values and drops attributes (Path, Expires...)
+                parsed = SimpleCookie()
+                parsed.load(content)
+                cookies = {key: morsel.value for key, morsel in parsed.items()}
+                if not cookies and '=' in content:
+                    # SimpleCookie rejects the whole string on names it considers illegal
+                    raise ValueError("not a valid cookie string")
+                return cookies, from_url
         except Exception as e:
             logger.warning(f"Failed to parse COMFYUI_COOKIES: {e}")
-            return None
+            return None, from_url
+
+    @staticmethod
+    def _new_session(cookies: Optional[Dict[str, str]]) -> aiohttp.ClientSession:
+        """Create an HTTP session that sends the COMFYUI_COOKIES cookies
+        
+        The session also downloads media from arbitrary hosts, so it keeps no cookie
+        jar: cookies set by those hosts are not collected and replayed across
+        executions. The configured cookies go out as a default Cookie header instead.
+        """
+        return aiohttp.ClientSession(
+            headers=_cookie_header(cookies),
+            cookie_jar=aiohttp.DummyCookieJar(),
+            connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=60),
+        )
 
     @asynccontextmanager
     async def get_comfyui_session(self) -> AsyncGenerator[aiohttp.ClientSession, None]:
-        """aiohttp session with cookies, automatically loaded if COMFYUI_COOKIES exists"""
+        """aiohttp session with cookies, automatically loaded if COMFYUI_COOKIES exists
+        
+        On the server loop this is the executor's pooled session, which keeps
+        connections to ComfyUI alive between requests instead of paying a new TCP
+        (and TLS) handshake for every call; it stays open after the block, call
+        close() on shutdown. Elsewhere the session is closed after the block.
+        """
         cookies = await self._parse_comfyui_cookies()
-        async with aiohttp.ClientSession(cookies=cookies) as session:
+        async with self._session_pool.acquire(lambda: self._new_session(cookies)) as session:
+            if session is self._session_pool.pooled and cookies is not self._pooled_cookies:
+                # New pooled session, or cookies fetched from a COMFYUI_COOKIES URL were refreshed
+                session.headers.popall("Cookie", None)
+                session.headers.update(_cookie_header(cookies))
+                self._pooled_cookies = cookies
             yield session
 
+    async def close(self):
+        """Close the pooled HTTP session"""
+        await self._session_pool.close()
+        self._pooled_cookies = None
+
     async def transfer_result_files(self, result: ExecuteResult) -> ExecuteResult:
         """Transfer result files to new URLs"""
-        url_cache: Dict[str, str] = {}
-        
         # Parse ComfyUI cookies, for downloading files that need authentication
         cookies = await self._parse_comfyui_cookies()
 
-        async def transfer_urls(urls: List[str]) -> List[str]:
-            # Remove duplicates, preserve order
-            unique_urls = []
-            seen = set()
-            for url in urls:
-                if url not in seen:
-                    unique_urls.append(url)
-                    seen.add(url)
-            
-            # Download and upload uncached URLs
-            uncached_urls = [url for url in unique_urls if url not in url_cache]
-            if uncached_urls:
-                async with download_files(uncached_urls, cookies=cookies) as temp_files:
-                    for temp_file, url in zip(temp_files, uncached_urls):
-                        new_url = upload(temp_file)
-                        url_cache[url] = new_url
-            
-            return [url_cache.get(url, url) for url in urls]
-
-        async def transfer_dict_urls(d: Dict[str, List[str]]) -> Dict[str, List[str]]:
-            if d:
-                result = {}
-                for k, v in d.items():
-                    result[k] = await transfer_urls(v)
-                return result
-            return d
+        data = result.model_dump()
+        list_fields = ["images", "audios", "videos"]
+        dict_fields = ["images_by_var", "audios_by_var", "videos_by_var"]
+        
+        # Collect every URL across all fields once (duplicates removed, order kept),
+        # then transfer them concurrently instead of field by field
+        all_urls: List[str] = []
+        for field in list_fields:
+            all_urls.extend(data.get(field) or [])
+        for field in dict_fields:
+            for urls in (data.get(field) or {}).values():
+                all_urls.extend(urls)
+        unique_urls = list(dict.fromkeys(all_urls))
+        
+        new_urls = await asyncio.gather(*(_transfer_urls_shared([url], cookies) for url in unique_urls))
+        url_map: Dict[str, str] = {url: new[0] for url, new in zip(unique_urls, new_urls)}
 
         # Construct new data
-        data = result.model_dump()
-        for field in ["images", "audios", "videos"]:
+        for field in list_fields:
             if data.get(field):
-                data[field] = await transfer_urls(data[field])
-        for field in ["images_by_var", "audios_by_var", "videos_by_var"]:
+                data[field] = [url_map.get(url, url) for url in data[field]]
+        for field in dict_fields:
             if data.get(field):
-                data[field] = await transfer_dict_urls(data[field])
+                data[field] = {k: [url_map.get(url, url) for url in v] for k, v in data[field].items()}
         
         # texts is native string, no need to transfer
         for field in ["texts"]:
@@ -148,19 +348,27 @@ class ComfyUIExecutor(ABC):
     def _generate_63bit_seed(self) -> int:
         """Generate a 63-bit random integer seed.
 
-        Using SystemRandom to avoid global RNG side-effects in multi-threaded or
-        multi-tenant environments.
+        Drawn from the OS CSPRNG (like SystemRandom) to avoid global RNG side-effects
+        in multi-threaded or multi-tenant environments; randbits(63) covers exactly
+        [0, 2**63 - 1] without creating an RNG object or going through randint.
         """
-        return random.SystemRandom().randint(0, (1 << 63) - 1)
+        return secrets.randbits(63)
 
-    def _randomize_seed_in_workflow(self, workflow_data: Dict[str, Any]) -> tuple[Dict[str, Any], Dict[str, int]]:
+    def _randomize_seed_in_workflow(self, workflow_data: Dict[str, Any], seed_node_ids: Optional[List[str]] = None) -> tuple[Dict[str, Any], Dict[str, int]]:
         """Replace any node inputs.seed == 0 (int or string "0") with a new random seed.
 
+        If seed_node_ids (precomputed by the parser, see WorkflowMetadata) is given,
+        only those nodes are checked instead of scanning the whole workflow.
+
         Returns a tuple of (modified_workflow, seed_changes) where seed_changes maps
         node_id (as string) to the new seed value.
         """
         changed: Dict[str, int] = {}
-        for node_id, node in workflow_data.items():
+        if seed_node_ids is None:
+            nodes = workflow_data.items()
+        else:
+            nodes = ((node_id, workflow_data.get(node_id)) for node_id in seed_node_ids)
+        for node_id, node in nodes:
             if not isinstance(node, dict):
                 continue
             inputs = node.get("inputs")
@@ -177,33 +385,42 @@ class ComfyUIExecutor(ABC):
             logger.info(f"Randomized seeds for {len(changed)} node(s): {changed}")
         return workflow_data, changed
 
-    async def _apply_param_mapping(self, workflow_data: Dict[str, Any], mapping: Any, param_value: Any):
-        """Apply single parameter based on parameter mapping"""
+    def _is_media_mapping(self, mapping: Any) -> bool:
+        """Whether the mapping's value goes through media upload handling"""
+        # New DSL handler_type mark first, then node types needing upload (backward compatibility)
+        return getattr(mapping, 'handler_type', None) == "upload_rel" or mapping.node_class_type in MEDIA_UPLOAD_NODE_TYPES
+
+    def _is_media_url(self, param_value: Any) -> bool:
+        """Whether a media parameter value is a URL that must be uploaded first"""
+        return isinstance(param_value, str) and param_value.startswith(('http://', 'https://'))
+
+    def _get_mapped_node(self, workflow_data: Dict[str, Any], mapping: Any) -> Optional[Dict[str, Any]]:
+        """Return the node a mapping targets (with inputs ensured), or None if it does not exist"""
         node_id = mapping.node_id
-        input_field = mapping.input_field
-        node_class_type = mapping.node_class_type
-        handler_type = getattr(mapping, 'handler_type', None)  # Get handler type (compatible with old version)
         
         # Check if node exists
         if node_id not in workflow_data:
             logger.warning(f"Node {node_id} does not exist in workflow")
-            return
+            return None
         
         node_data = workflow_data[node_id]
         
         # Ensure inputs exist
         if "inputs" not in node_data:
             node_data["inputs"] = {}
+        return node_data
+
+    async def _apply_param_mapping(self, workflow_data: Dict[str, Any], mapping: Any, param_value: Any):
+        """Apply single parameter based on parameter mapping"""
+        node_data = self._get_mapped_node(workflow_data, mapping)
+        if node_data is None:
+            return
         
-        # Priority 1: Check new DSL handler_type mark
-        if handler_type == "upload_rel":
-            await self._handle_media_upload(node_data, input_field, param_value)
-        # Priority 2: Check if node type needs special media upload handling (backward compatibility)
-        elif node_class_type in MEDIA_UPLOAD_NODE_TYPES:
-            await self._handle_media_upload(node_data, input_field, param_value)
+        if self._is_media_mapping(mapping):
+            await self._handle_media_upload(node_data, mapping.input_field, param_value)
         else:
             # Regular parameter setting
-            await self._set_node_param(node_data, input_field, param_value)
+            self._set_node_param(node_data, mapping.input_field, param_value)
 
     async def _handle_media_upload(self, node_data: Dict[str, Any], input_field: str, param_value: Any):
         """Handle media upload"""
@@ -212,21 +429,21 @@ class ComfyUIExecutor(ABC):
             node_data["inputs"] = {}
         
         # If parameter value is a URL starting with http, upload media first
-        if isinstance(param_value, str) and param_value.startswith(('http://', 'https://')):
+        if self._is_media_url(param_value):
             try:
                 # Upload media and get uploaded media name
                 media_value = await self._upload_media_from_source(param_value)
                 # Use uploaded media name as node input value
-                await self._set_node_param(node_data, input_field, media_value)
+                self._set_node_param(node_data, input_field, media_value)
                 logger.info(f"Media upload successful: {media_value}")
             except Exception as e:
                 logger.error(f"Media upload failed: {str(e)}")
                 raise Exception(f"Media upload failed: {str(e)}")
         else:
             # Use parameter value as media name
-            await self._set_node_param(node_data, input_field, param_value)
+            self._set_node_param(node_data, input_field, param_value)
 
-    async def _set_node_param(self, node_data: Dict[str, Any], input_field: str, param_value: Any):
+    def _set_node_param(self, node_data: Dict[str, Any], input_field: str, param_value: Any):
         """Set node parameter"""
         # Ensure inputs exist
         if "inputs" not in node_data:
@@ -235,45 +452,38 @@ class ComfyUIExecutor(ABC):
         node_data["inputs"][input_field] = param_value
 
     async def _upload_media_from_source(self, media_url: str) -> str:
-        """Upload media from URL"""
+        """Upload media from URL
+        
+        The download is streamed straight into the ComfyUI upload request, without
+        buffering the whole file in memory or writing it to a temporary file.
+        """
+        # Extract filename from URL; fall back to a name derived from the URL itself,
+        # which (unlike hash()) is the same in every process
+        parsed_url = urlparse(media_url)
+        filename = os.path.basename(parsed_url.path)
+        if not filename:
+            filename = f"temp_media_{hashlib.blake2b(media_url.encode(), digest_size=8).hexdigest()}"
+        
         async with self.get_comfyui_session() as session:
             async with session.get(media_url) as response:
                 if response.status != 200:
                     raise Exception(f"Download media failed: HTTP {response.status}")
                 
-                # Extract filename from URL
-                parsed_url = urlparse(media_url)
-                filename = os.path.basename(parsed_url.path)
-                if not filename:
-                    filename = f"temp_media_{hash(media_url)}.jpg"
+                if not os.path.splitext(filename)[1]:
+                    # No extension in the URL path, take it from the response's Content-Type
+                    filename += get_ext_from_content_type(response.headers.get('Content-Type', '')) or ".jpg"
                 
-                # Get media data
-                media_data = await response.read()
-                
-                # Save to temporary file
-                suffix = os.path.splitext(filename)[1] or ".jpg"
-                with tempfile.NamedTemporaryFile(delete=False, suffix=suffix, dir=TEMP_DIR) as tmp:
-                    tmp.write(media_data)
-                    temp_path = tmp.name
-        
-        try:
-            # Upload temporary file to ComfyUI
-            return await self._upload_media(temp_path)
-        finally:
-            # Delete temporary file
-            os.unlink(temp_path)
+                return await self._post_media(response.content, filename)
 
     async def _upload_media(self, media_path: str) -> str:
         """Upload media to ComfyUI"""
-        # Read media data
-        with open(media_path, 'rb') as f:
-            media_data = f.read()
-        
-        # Extract filename
-        filename = os.path.basename(media_path)
-        
+        # Stream the file in chunks instead of a blocking read of the whole file
+        return await self._post_media(_iter_file_chunks(media_path), os.path.basename(media_path))
+
+    async def _post_media(self, media_data: Any, filename: str) -> str:
+        """Post media (bytes, an aiohttp stream or an async iterator of chunks) to ComfyUI's upload endpoint and return the stored name"""
         # Automatically detect file MIME type
-        mime_type = mimetypes.guess_type(filename)[0]
+        mime_type = _EXT_TO_MIME.get(os.path.splitext(filename)[1].lower()) or mimetypes.guess_type(filename)[0]
         if mime_type is None:
             mime_type = 'application/octet-stream'
         
@@ -294,26 +504,66 @@ class ComfyUIExecutor(ABC):
                 result = await response.json()
                 return result.get('name', '')
 
+    def _clone_workflow(self, workflow_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy the workflow just deep enough for parameter and seed updates
+        
+        Only node dicts and their ``inputs`` dicts are written to, so those are
+        copied; input values (links, lists) are shared with the original.
+        """
+        clone = {}
+        for node_id, node in workflow_data.items():
+            if isinstance(node, dict):
+                node = dict(node)
+                inputs = node.get("inputs")
+                if isinstance(inputs, dict):
+                    node["inputs"] = dict(inputs)
+            clone[node_id] = node
+        return clone
+
     async def _apply_params_to_workflow(self, workflow_data: Dict[str, Any], metadata: WorkflowMetadata, params: Dict[str, Any]) -> Dict[str, Any]:
         """Apply parameters to workflow using new parser"""
-        workflow_data = copy.deepcopy(workflow_data)
+        workflow_data = self._clone_workflow(workflow_data)
         
-        # Iterate through all parameter mappings
+        # Resolve the value of every mapping first, so a missing required parameter
+        # fails before any media is uploaded
+        plain_mappings = []
+        upload_mappings = []
         for mapping in metadata.mapping_info.param_mappings:
             param_name = mapping.param_name
             
             # Check if parameter exists
             if param_name in params:
                 param_value = params[param_name]
-                await self._apply_param_mapping(workflow_data, mapping, param_value)
-            else:
+            elif param_name in metadata.params:
                 # Use default value (if exists)
-                if param_name in metadata.params:
-                    param_info = metadata.params[param_name]
-                    if param_info.default is not None:
-                        await self._apply_param_mapping(workflow_data, mapping, param_info.default)
-                    elif param_info.required:
-                        raise Exception(f"Required parameter '{param_name}' is missing")
+                param_info = metadata.params[param_name]
+                if param_info.default is not None:
+                    param_value = param_info.default
+                elif param_info.required:
+                    raise Exception(f"Required parameter '{param_name}' is missing")
+                else:
+                    continue
+            else:
+                continue
+            
+            # Only media given as a URL needs awaiting (download + upload)
+            if self._is_media_mapping(mapping) and self._is_media_url(param_value):
+                upload_mappings.append((mapping, param_value))
+            else:
+                plain_mappings.append((mapping, param_value))
+        
+        # Everything else is a plain assignment, done without creating a coroutine per parameter
+        for mapping, param_value in plain_mappings:
+            node_data = self._get_mapped_node(workflow_data, mapping)
+            if node_data is not None:
+                self._set_node_param(node_data, mapping.input_field, param_value)
+        
+        # Media uploads are independent (each writes its own node), so run them concurrently
+        if upload_mappings:
+            await asyncio.gather(*(
+                self._apply_param_mapping(workflow_data, mapping, param_value)
+                for mapping, param_value in upload_mappings
+            ))
         
         return workflow_data
 
@@ -327,40 +577,51 @@ class ComfyUIExecutor(ABC):
         return output_id_2_var
 
     def get_workflow_metadata(self, workflow_file: str) -> Optional[WorkflowMetadata]:
-        """Get workflow metadata (using new parser)"""
-        parser = WorkflowParser()
-        return parser.parse_workflow_file(workflow_file)
+        """Get workflow metadata (using new parser)
+        
+        Parsed metadata is cached per file and reused until its mtime or size changes.
+        """
+        path = os.fspath(workflow_file)
+        try:
+            st = os.stat(path)
+        except OSError:
+            # Let the parser report the missing file
+            return WorkflowParser().parse_workflow_file(workflow_file)
+        
+        entry = _workflow_metadata_cache.get(path)
+        if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            return entry[2]
+        
+        metadata = WorkflowParser().parse_workflow_file(workflow_file)
+        if metadata is not None:
+            _workflow_metadata_cache[path] = (st.st_mtime_ns, st.st_size, metadata)
+        return metadata
 
     def _split_media_by_suffix(self, node_output: Dict[str, Any], base_url: str) -> Tuple[List[str], List[str], List[str]]:
         """Split media by file extension into images/videos/audios"""
-        image_exts = {'.png', '.jpg', '.jpeg', '.webp', '.bmp', '.tiff'}
-        video_exts = {'.mp4', '.mov', '.avi', '.webm', '.gif'}
-        audio_exts = {'.mp3', '.wav', '.flac', '.ogg', '.aac', '.m4a', '.wma', '.opus'}
-        
-        images = []
-        videos = []
-        audios = []
+        buckets = ([], [], [])
+        view_url = f"{base_url}/view?filename="
         
         for media_key in ("images", "gifs", "audio"):
             for media_data in node_output.get(media_key, []):
                 filename = media_data.get("filename")
+                # Skip unsupported extensions before building the URL
+                _, dot, ext = filename.rpartition('.')
+                bucket = _EXT_TO_BUCKET.get(ext.lower()) if dot else None
+                if bucket is None:
+                    continue
+                
                 subfolder = media_data.get("subfolder", "")
                 media_type = media_data.get("type", "output")
                 
-                url = f"{base_url}/view?filename={filename}"
+                url = view_url + filename
                 if subfolder:
                     url += f"&subfolder={subfolder}"
                 if media_type:
                     url += f"&type={media_type}"
-                
-                ext = os.path.splitext(filename)[1].lower()
-                if ext in image_exts:
-                    images.append(url)
-                elif ext in video_exts:
-                    videos.append(url)
-                elif ext in audio_exts:
-                    audios.append(url)
+                buckets[bucket].append(url)
         
+        images, videos, audios = buckets
         return images, videos, audios
 
     def _map_outputs_by_var(self, output_id_2_var: Dict[str, str], output_id_2_media: Dict[str, List[str]]) -> Dict[str, List[str]]:
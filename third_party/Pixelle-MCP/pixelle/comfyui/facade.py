@@ -28,6 +28,7 @@ class ComfyUIClient:
         self.base_url = base_url
         self.executor_type = executor_type or COMFYUI_EXECUTOR_TYPE
         self._executor = None
+        self._runninghub_executor = None
         
     def _get_executor(self):
         """Get the corresponding executor instance for local ComfyUI"""
@@ -40,6 +41,18 @@ class ComfyUIClient:
                 raise ValueError(f"Unsupported executor type: {self.executor_type}. Valid types: 'websocket', 'http'")
         return self._executor
     
+    def _get_runninghub_executor(self):
+        """Get the RunningHub executor instance (reused so its HTTP session is kept alive)"""
+        if self._runninghub_executor is None:
+            self._runninghub_executor = RunningHubExecutor(self.base_url)
+        return self._runninghub_executor
+    
+    async def close(self):
+        """Close the HTTP sessions held by the executors"""
+        for executor in (self._executor, self._runninghub_executor):
+            if executor is not None:
+                await executor.close()
+    
     async def execute_workflow(self, workflow_file: str, params: Dict[str, Any] = None) -> ExecuteResult:
         """
         Execute workflow
@@ -54,7 +67,7 @@ class ComfyUIClient:
         # Check if this is a RunningHub workflow by examining the file content
         if is_runninghub_workflow(workflow_file):
             # Use RunningHub executor for RunningHub workflows
-            runninghub_executor = RunningHubExecutor(self.base_url)
+            runninghub_executor = self._get_runninghub_executor()
             return await runninghub_executor.execute_workflow(workflow_file, params)
         else:
             # Use configured executor for local ComfyUI workflows
@@ -105,4 +118,11 @@ def get_workflow_metadata(workflow_file: str):
     Returns:
         Workflow metadata
     """
-    return default_client.get_workflow_metadata(workflow_file) 
\ No newline at end of file
+    return default_client.get_workflow_metadata(workflow_file)
+
+
+async def close():
+    """
+    Convenient function to close the default client's HTTP sessions, call on shutdown
+    """
+    await default_client.close()
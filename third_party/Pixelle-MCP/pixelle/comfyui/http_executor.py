@@ -10,6 +10,7 @@ from typing import Optional, Dict, Any
 
 from pixelle.comfyui.base_executor import ComfyUIExecutor, COMFYUI_API_KEY, logger
 from pixelle.comfyui.models import ExecuteResult
+from pixelle.utils.workflow_source_util import load_workflow_json
 
 
 class HttpExecutor(ComfyUIExecutor):
@@ -165,9 +166,8 @@ class HttpExecutor(ComfyUIExecutor):
             if not metadata:
                 return ExecuteResult(status="error", msg="Cannot parse workflow metadata")
             
-            # Load workflow JSON
-            with open(workflow_file, 'r', encoding='utf-8') as f:
-                workflow_data = json.load(f)
+            # Load workflow JSON (cached and shared; _apply_params_to_workflow works on a copy)
+            workflow_data = load_workflow_json(workflow_file)
             
             if not workflow_data:
                 return ExecuteResult(status="error", msg="Workflow data is missing")
@@ -180,7 +180,7 @@ class HttpExecutor(ComfyUIExecutor):
                 workflow_data = await self._apply_params_to_workflow(workflow_data, metadata, {})
             
             # Replace any seed == 0 with a random 63-bit seed before submission
-            workflow_data, _ = self._randomize_seed_in_workflow(workflow_data)
+            workflow_data, _ = self._randomize_seed_in_workflow(workflow_data, metadata.seed_node_ids)
             
             # Extract output node information from metadata
             output_id_2_var = self._extract_output_nodes(metadata)
@@ -1,15 +1,25 @@
 # Copyright (C) 2025 AIDC-AI
 # This project is licensed under the MIT License (SPDX-License-identifier: MIT).
 
+import os
 import json
+import time
+import random
 import tempfile
-from typing import Optional, Dict, Any, List, Literal
+from typing import Optional, Dict, Any, List, Literal, Tuple
 from pathlib import Path
 import aiohttp
 import asyncio
 
 from pixelle.logger import logger
 from pixelle.settings import settings
+from pixelle.utils.os_util import get_temp_path
+from pixelle.utils.http_session_util import SessionPool
+
+# Workflow definitions fetched via getJsonApiFormat are reused (in memory and on disk) for this long
+WORKFLOW_JSON_CACHE_TTL = 300  # seconds
+# Upper bound of the retry backoff before jitter
+RETRY_BACKOFF_CAP = 30  # seconds
 
 
 class RunningHubClient:
@@ -20,10 +30,32 @@ class RunningHubClient:
         self.base_url = (base_url or settings.runninghub_base_url).rstrip('/')
         self.timeout = settings.runninghub_timeout
         self.retry_count = settings.runninghub_retry_count
+        self.max_concurrent_uploads = settings.runninghub_max_concurrent_uploads
+        # HTTP session kept alive on the server loop
+        self._session_pool = SessionPool()
+        # workflow_id -> (fetched at, workflow JSON)
+        self._workflow_json_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
         
         if not self.api_key:
             raise ValueError("RunningHub API key is required")
     
+    def _new_session(self) -> aiohttp.ClientSession:
+        """Create an HTTP session for RunningHub API calls
+        
+        All API calls go to the same host, so on the server loop one pooled session
+        lets them reuse kept-alive connections; status polling no longer reconnects
+        on every poll.
+        """
+        connector = aiohttp.TCPConnector(limit_per_host=20, ttl_dns_cache=300, keepalive_timeout=75)
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+    
+    async def close(self):
+        """Close the pooled HTTP session"""
+        await self._session_pool.close()
+    
     async def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None, 
                           files: Optional[Dict] = None, timeout: Optional[int] = None) -> Dict[str, Any]:
         """Make HTTP request to RunningHub API with retry logic"""
@@ -33,53 +65,126 @@ class RunningHubClient:
         # Prepare request data
         if files:
             # For file upload, don't set Content-Type (let aiohttp handle it)
-            request_data = aiohttp.FormData()
-            if data:
-                for key, value in data.items():
-                    request_data.add_field(key, str(value))
-            for key, file_info in files.items():
-                request_data.add_field(key, file_info['content'], filename=file_info['filename'])
+            def build_request_data():
+                # A FormData can only be sent once, so each attempt builds its own
+                form = aiohttp.FormData()
+                if data:
+                    for key, value in data.items():
+                        form.add_field(key, str(value))
+                for key, file_info in files.items():
+                    form.add_field(key, file_info['content'], filename=file_info['filename'])
+                return form
         else:
             # For JSON requests
             headers['Content-Type'] = 'application/json'
-            request_data = json.dumps(data) if data else None
+            json_data = json.dumps(data) if data else None
+            
+            def build_request_data():
+                return json_data
         
-        # Retry logic
+        # Retry logic: only transient failures (connection errors, timeouts, 5xx, 429) are retried
         last_exception = None
+        # The session already applies self.timeout; only override it when asked to
+        request_kwargs = {"timeout": aiohttp.ClientTimeout(total=timeout)} if timeout else {}
         for attempt in range(self.retry_count + 1):
+            retryable = True
             try:
-                async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=timeout or self.timeout)) as session:
-                    async with session.request(method, url, headers=headers, data=request_data) as response:
-                        if response.status == 200:
-                            result = await response.json()
-                            if result.get('code') == 0:
-                                return result
-                            else:
-                                raise Exception(f"RunningHub API error: {result.get('msg', 'Unknown error')}")
-                        else:
-                            response_text = await response.text()
-                            raise Exception(f"HTTP {response.status}: {response_text}")
+                async with self._session_pool.acquire(self._new_session) as session, \
+                        session.request(method, url, headers=headers, data=build_request_data(), **request_kwargs) as response:
+                    if response.status != 200:
+                        response_text = await response.text()
+                        retryable = response.status >= 500 or response.status == 429
+                        raise Exception(f"HTTP {response.status}: {response_text}")
+                    
+                    # Malformed responses and API errors won't fix themselves on retry
+                    retryable = False
+                    result = await response.json()
+                    if result.get('code') == 0:
+                        return result
+                    else:
+                        raise Exception(f"RunningHub API error: {result.get('msg', 'Unknown error')}")
                             
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                # Includes ClientConnectorError and ServerDisconnectedError, also mid-response
+                retryable = True
+                last_exception = e
             except Exception as e:
                 last_exception = e
-                if attempt < self.retry_count:
-                    wait_time = 2 ** attempt  # Exponential backoff
-                    logger.warning(f"Request failed (attempt {attempt + 1}/{self.retry_count + 1}): {e}. Retrying in {wait_time}s...")
-                    await asyncio.sleep(wait_time)
-                else:
-                    logger.error(f"Request failed after {self.retry_count + 1} attempts: {e}")
+            
+            if not retryable:
+                logger.error(f"Request failed (not retryable): {last_exception}")
+                break
+            if attempt < self.retry_count:
+                # Capped exponential backoff with jitter, so clients don't retry in lockstep
+                wait_time = min(RETRY_BACKOFF_CAP, 2 ** attempt) * (0.5 + random.random())
+                logger.warning(f"Request failed (attempt {attempt + 1}/{self.retry_count + 1}): {last_exception}. Retrying in {wait_time:.1f}s...")
+                await asyncio.sleep(wait_time)
+            else:
+                logger.error(f"Request failed after {self.retry_count + 1} attempts: {last_exception}")
         
         raise last_exception
     
+    def _workflow_cache_file(self, workflow_id: str) -> Optional[Path]:
+        """On-disk cache file of a workflow's JSON (None for IDs unsafe as file names)"""
+        if not str(workflow_id).isalnum():
+            return None
+        return Path(get_temp_path("runninghub", f"{workflow_id}.json"))
+    
+    def _get_cached_workflow_json(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+        """Return the cached workflow JSON if fetched less than WORKFLOW_JSON_CACHE_TTL ago
+        
+        The on-disk copy (its mtime is the fetch time) keeps the cache warm across restarts.
+        """
+        now = time.time()
+        entry = self._workflow_json_cache.get(workflow_id)
+        if entry is not None and now - entry[0] < WORKFLOW_JSON_CACHE_TTL:
+            return entry[1]
+        
+        cache_file = self._workflow_cache_file(workflow_id)
+        if cache_file is None:
+            return None
+        try:
+            fetched_at = cache_file.stat().st_mtime
+            if now - fetched_at < WORKFLOW_JSON_CACHE_TTL:
+                workflow_json = json.loads(cache_file.read_text(encoding='utf-8'))
+                self._workflow_json_cache[workflow_id] = (fetched_at, workflow_json)
+                return workflow_json
+        except (OSError, ValueError):
+            pass
+        return None
+    
+    def _store_workflow_json(self, workflow_id: str, workflow_json: Dict[str, Any]):
+        """Cache a freshly fetched workflow JSON in memory and on disk"""
+        self._workflow_json_cache[workflow_id] = (time.time(), workflow_json)
+        
+        cache_file = self._workflow_cache_file(workflow_id)
+        if cache_file is None:
+            return
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_name(cache_file.name + ".tmp")
+            tmp_file.write_text(json.dumps(workflow_json, ensure_ascii=False, indent=2), encoding='utf-8')
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.debug(f"Failed to write workflow cache file {cache_file}: {e}")
+    
     async def get_workflow_json(self, workflow_id: str) -> Dict[str, Any]:
         """Get workflow JSON by workflow ID using getJsonApiFormat API
         
+        Responses are cached for WORKFLOW_JSON_CACHE_TTL seconds; the returned
+        data is shared and must not be modified.
+        
         Args:
             workflow_id: RunningHub workflow ID
             
         Returns:
             Workflow JSON data
         """
+        workflow_json = self._get_cached_workflow_json(workflow_id)
+        if workflow_json is not None:
+            logger.debug(f"Using cached workflow JSON for workflow_id: {workflow_id}")
+            return workflow_json
+        
         logger.info(f"Getting workflow JSON for workflow_id: {workflow_id}")
         
         data = {
@@ -95,8 +200,8 @@ class RunningHubClient:
                 raise Exception("No workflow JSON found in response")
             
             # Parse the JSON string to get the actual workflow object
-            import json
             workflow_json = json.loads(prompt_str)
+            self._store_workflow_json(workflow_id, workflow_json)
             
             logger.info(f"Successfully retrieved workflow JSON for {workflow_id}")
             return workflow_json
@@ -112,10 +217,15 @@ class RunningHubClient:
             workflow_id: RunningHub workflow ID
             
         Returns:
-            Path to temporary workflow file
+            Path to the workflow file (the shared on-disk cache copy while fresh; do not delete it)
         """
         workflow_json = await self.get_workflow_json(workflow_id)
         
+        # The on-disk cache already holds this JSON while fresh; reuse it instead of a new temp file
+        cache_file = self._workflow_cache_file(workflow_id)
+        if cache_file is not None and self._get_cached_workflow_json(workflow_id) is not None and cache_file.exists():
+            return str(cache_file)
+        
         # Create temporary file
         with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False, encoding='utf-8') as f:
             json.dump(workflow_json, f, ensure_ascii=False, indent=2)
@@ -178,6 +288,26 @@ class RunningHubClient:
             logger.error(f"Failed to upload file {file_path}: {e}")
             raise
     
+    async def upload_files(self, file_paths: List[str]) -> List[str]:
+        """Upload several files to RunningHub concurrently
+        
+        At most ``max_concurrent_uploads`` uploads run at once; they share the
+        client's pooled session.
+        
+        Args:
+            file_paths: Local file paths to upload
+            
+        Returns:
+            RunningHub fileNames, in the order of ``file_paths``
+        """
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrent_uploads))
+        
+        async def upload_one(file_path: str) -> str:
+            async with semaphore:
+                return await self.upload_file(file_path)
+        
+        return list(await asyncio.gather(*(upload_one(file_path) for file_path in file_paths)))
+    
     async def create_task(self, workflow_id: str, node_info_list: List[Dict] = None) -> Dict[str, Any]:
         """Create workflow execution task
         
@@ -264,3 +394,9 @@ def get_runninghub_client() -> RunningHubClient:
     if _runninghub_client is None:
         _runninghub_client = RunningHubClient()
     return _runninghub_client
+
+
+async def close_runninghub_client():
+    """Close the global RunningHub client's HTTP session, if the client was created"""
+    if _runninghub_client is not None:
+        await _runninghub_client.close()
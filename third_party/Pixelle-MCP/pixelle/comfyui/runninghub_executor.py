@@ -8,7 +8,7 @@ import asyncio
 from typing import Dict, Any, Optional, List
 from urllib.parse import urlparse
 
-from pixelle.comfyui.base_executor import ComfyUIExecutor, MEDIA_UPLOAD_NODE_TYPES
+from pixelle.comfyui.base_executor import ComfyUIExecutor
 from pixelle.comfyui.models import ExecuteResult
 from pixelle.comfyui.runninghub_client import get_runninghub_client
 from pixelle.logger import logger
@@ -94,6 +94,8 @@ class RunningHubExecutor(ComfyUIExecutor):
         - Check node_class_type in MEDIA_UPLOAD_NODE_TYPES (backward compatibility)
         """
         node_info_list = []
+        # nodeInfo entries whose value is a media URL that must be uploaded first
+        upload_entries: List[dict] = []
         
         # Process parameter mappings from metadata
         for param_mapping in metadata.mapping_info.param_mappings:
@@ -101,16 +103,6 @@ class RunningHubExecutor(ComfyUIExecutor):
             
             if param_name in params:
                 param_value = params[param_name]
-                node_class_type = param_mapping.node_class_type
-                handler_type = getattr(param_mapping, 'handler_type', None)
-                
-                # Follow the same upload logic as base_executor
-                # Priority 1: Check new DSL handler_type mark
-                if handler_type == "upload_rel":
-                    param_value = await self._handle_runninghub_media_upload(param_value)
-                # Priority 2: Check if node type needs special media upload handling (backward compatibility)
-                elif node_class_type in MEDIA_UPLOAD_NODE_TYPES:
-                    param_value = await self._handle_runninghub_media_upload(param_value)
                 
                 # Create nodeInfo entry
                 node_info = {
@@ -119,6 +111,25 @@ class RunningHubExecutor(ComfyUIExecutor):
                     "fieldValue": param_value
                 }
                 node_info_list.append(node_info)
+                
+                # Follow the same upload logic as base_executor (upload_rel mark or media node type)
+                if self._is_media_mapping(param_mapping) and self._is_media_url(param_value):
+                    upload_entries.append(node_info)
+                else:
+                    logger.debug(f"Added nodeInfo: {node_info}")
+        
+        # Upload all media inputs in one batch instead of one after another
+        if upload_entries:
+            media_urls = list(dict.fromkeys(node_info["fieldValue"] for node_info in upload_entries))
+            try:
+                file_names = await self._upload_media_from_urls(media_urls)
+            except Exception as e:
+                logger.error(f"Media upload failed: {str(e)}")
+                raise Exception(f"Media upload failed: {str(e)}")
+            uploaded = dict(zip(media_urls, file_names))
+            for node_info in upload_entries:
+                node_info["fieldValue"] = uploaded[node_info["fieldValue"]]
+                logger.info(f"Media upload successful: {node_info['fieldValue']}")
                 logger.debug(f"Added nodeInfo: {node_info}")
         
         return node_info_list
@@ -139,6 +150,15 @@ class RunningHubExecutor(ComfyUIExecutor):
             # Use parameter value as is (could be a local file path or fileName)
             return param_value
     
+    async def _upload_media_from_urls(self, media_urls: List[str]) -> List[str]:
+        """Download media from URLs and upload them to RunningHub concurrently"""
+        try:
+            async with download_files(media_urls) as temp_file_paths:
+                return await self.client.upload_files(temp_file_paths)
+        except Exception as e:
+            logger.error(f"Failed to upload media from URLs {media_urls}: {e}")
+            raise
+    
     async def _upload_media_from_url(self, media_url: str) -> str:
         """Upload media from URL to RunningHub"""
         try:
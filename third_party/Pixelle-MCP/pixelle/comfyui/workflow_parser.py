@@ -41,6 +41,7 @@ class WorkflowMetadata(BaseModel):
     mapping_info: WorkflowMappingInfo
     workflow_id: Optional[str] = None  # RunningHub workflow ID
     is_runninghub: bool = False  # Whether this is a RunningHub workflow
+    seed_node_ids: Optional[List[str]] = None  # Nodes with a seed input (None: unknown, scan all nodes)
 
 class WorkflowParser:
     """Workflow parser"""
@@ -242,6 +243,7 @@ class WorkflowParser:
         params = {}
         param_mappings = []
         output_mappings = []
+        seed_node_ids = []
         
         for node_id, node_data in workflow_data.items():
             param, param_mapping, output_mapping = self.parse_node(node_id, node_data)
@@ -252,6 +254,11 @@ class WorkflowParser:
             
             if output_mapping:
                 output_mappings.append(output_mapping)
+            
+            # Remember nodes with a seed input (or a parameter mapped onto one) for seed randomization
+            inputs = node_data.get("inputs") if isinstance(node_data, dict) else None
+            if (isinstance(inputs, dict) and "seed" in inputs) or (param_mapping and param_mapping.input_field == "seed"):
+                seed_node_ids.append(str(node_id))
         
         # 3. Build mapping_info
         mapping_info = WorkflowMappingInfo(
@@ -264,7 +271,8 @@ class WorkflowParser:
             title=title,
             description=description,
             params=params,
-            mapping_info=mapping_info
+            mapping_info=mapping_info,
+            seed_node_ids=seed_node_ids
         )
         
         return metadata
@@ -38,7 +38,18 @@ async def combined_lifespan(app: FastAPI):
     async with mcp_app.lifespan(app):
         # start chainlit lifespan
         async with chainlit_lifespan(app):
-            yield
+            from pixelle.utils.http_session_util import bind_session_pool_loop, unbind_session_pool_loop
+            # Keep the HTTP sessions used to talk to ComfyUI / RunningHub alive on the server loop
+            bind_session_pool_loop()
+            try:
+                yield
+            finally:
+                # Close the pooled HTTP sessions used to talk to ComfyUI / RunningHub
+                from pixelle.comfyui import facade
+                from pixelle.comfyui.runninghub_client import close_runninghub_client
+                await facade.close()
+                await close_runninghub_client()
+                unbind_session_pool_loop()
 
 
 # Create a fastapi application
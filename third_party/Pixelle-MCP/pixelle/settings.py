@@ -1,5 +1,6 @@
 # Copyright (C) 2025 AIDC-AI
 # This project is licensed under the MIT License (SPDX-License-identifier: MIT).
+from functools import lru_cache
 from typing import Optional
 from pydantic_settings import BaseSettings
 import os
@@ -23,6 +24,16 @@ if not os.getenv('PIXELLE_ENV_LOADED'):
     os.environ['PIXELLE_ENV_LOADED'] = 'true'
 
 
+@lru_cache(maxsize=8)
+def _split_available_models(provider_models: tuple) -> tuple:
+    """Flatten ``(enabled, "a,b")`` pairs into model names; cached by the config values themselves."""
+    models = []
+    for enabled, model_list in provider_models:
+        if enabled and model_list:
+            models.extend(m.strip() for m in model_list.split(",") if m.strip())
+    return tuple(models)
+
+
 class Settings(BaseSettings):
     # Base service configuration
     host: str = "localhost"
@@ -34,6 +45,7 @@ class Settings(BaseSettings):
     comfyui_base_url: str = "http://localhost:8188"
     comfyui_api_key: str = ""
     comfyui_cookies: str = ""
+    comfyui_cookies_ttl: int = 300
     comfyui_executor_type: str = "http"
     
     # RunningHub configuration
@@ -41,6 +53,7 @@ class Settings(BaseSettings):
     runninghub_api_key: str = ""
     runninghub_timeout: int = 3600
     runninghub_retry_count: int = 0
+    runninghub_max_concurrent_uploads: int = 8
     
     # Chainlit configuration
     chainlit_auth_secret: str = "changeme-generate-a-secure-secret-key"
@@ -103,27 +116,15 @@ class Settings(BaseSettings):
     
     def get_all_available_models(self) -> list[str]:
         """Get list of all available models"""
-        models = []
-        
-        if self.openai_api_key and self.chainlit_chat_openai_models:
-            models.extend([m.strip() for m in self.chainlit_chat_openai_models.split(",") if m.strip()])
-        
-        if self.ollama_models:
-            models.extend([m.strip() for m in self.ollama_models.split(",") if m.strip()])
-            
-        if self.gemini_api_key and self.gemini_models:
-            models.extend([m.strip() for m in self.gemini_models.split(",") if m.strip()])
-            
-        if self.deepseek_api_key and self.deepseek_models:
-            models.extend([m.strip() for m in self.deepseek_models.split(",") if m.strip()])
-            
-        if self.claude_api_key and self.claude_models:
-            models.extend([m.strip() for m in self.claude_models.split(",") if m.strip()])
-            
-        if self.qwen_api_key and self.qwen_models:
-            models.extend([m.strip() for m in self.qwen_models.split(",") if m.strip()])
-        
-        return models
+        # Keyed on the current field values, so settings reloads are picked up automatically
+        return list(_split_available_models((
+            (bool(self.openai_api_key), self.chainlit_chat_openai_models),
+            (True, self.ollama_models),
+            (bool(self.gemini_api_key), self.gemini_models),
+            (bool(self.deepseek_api_key), self.deepseek_models),
+            (bool(self.claude_api_key), self.claude_models),
+            (bool(self.qwen_api_key), self.qwen_models),
+        )))
 
     def get_read_url(self) -> str:
         if self.public_read_url:
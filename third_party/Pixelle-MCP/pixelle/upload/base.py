@@ -6,7 +6,7 @@ Storage backend abstract base class
 """
 
 from abc import ABC, abstractmethod
-from typing import BinaryIO, Optional
+from typing import AsyncGenerator, BinaryIO, Optional
 from dataclasses import dataclass
 
 
@@ -56,6 +56,25 @@ class StorageBackend(ABC):
         """
         pass
     
+    async def iter_file(self, file_id: str, chunk_size: int = 65536) -> AsyncGenerator[bytes, None]:
+        """
+        Stream file content in chunks
+        
+        Backends that can read incrementally should override this; the
+        default falls back to a full download.
+        
+        Args:
+            file_id: File ID
+            chunk_size: Maximum bytes per chunk
+            
+        Yields:
+            bytes: Next chunk of file content
+        """
+        content = await self.download(file_id)
+        if content:
+            for start in range(0, len(content), chunk_size):
+                yield content[start:start + chunk_size]
+    
     @abstractmethod
     async def delete(self, file_id: str) -> bool:
         """
@@ -3,7 +3,7 @@
 
 import mimetypes
 from pathlib import Path
-from typing import Optional, List
+from typing import AsyncGenerator, Optional, List
 from fastapi import HTTPException, UploadFile
 
 from pixelle.upload.base import FileInfo
@@ -67,6 +67,19 @@ class FileService:
             print(f"Error downloading file {file_id}: {e}")
             return None
     
+    def iter_file(self, file_id: str, chunk_size: int = 65536) -> AsyncGenerator[bytes, None]:
+        """
+        Stream file content in chunks
+        
+        Args:
+            file_id: file ID
+            chunk_size: maximum bytes per chunk
+            
+        Returns:
+            AsyncGenerator[bytes, None]: file content chunks
+        """
+        return self.storage.iter_file(file_id, chunk_size)
+    
     async def get_file_info(self, file_id: str) -> Optional[FileInfo]:
         """
         Get file info
@@ -4,13 +4,17 @@
 import uuid
 import aiofiles
 from pathlib import Path
-from typing import BinaryIO, Optional
+from typing import AsyncGenerator, BinaryIO, Optional
 
 from pixelle.upload.base import StorageBackend, FileInfo
 from pixelle.settings import settings
 from pixelle.utils.os_util import get_data_path
 
 
+# Upload chunk size: bounds memory per request regardless of file size
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
 class LocalStorage(StorageBackend):
 
     def __init__(self, read_url: Optional[str] = None):
@@ -38,11 +42,11 @@ class LocalStorage(StorageBackend):
         file_id = self._generate_file_id(filename)
         file_path = self._get_file_path(file_id)
         
+        file_size = 0
         async with aiofiles.open(file_path, 'wb') as f:
-            content = file_data.read()
-            await f.write(content)
-        
-        file_size = len(content)
+            while chunk := file_data.read(UPLOAD_CHUNK_SIZE):
+                await f.write(chunk)
+                file_size += len(chunk)
         
         return FileInfo(
             file_id=file_id,
@@ -64,6 +68,13 @@ class LocalStorage(StorageBackend):
         except Exception:
             return None
     
+    async def iter_file(self, file_id: str, chunk_size: int = 65536) -> AsyncGenerator[bytes, None]:
+        file_path = self._get_file_path(file_id)
+        
+        async with aiofiles.open(file_path, 'rb') as f:
+            while chunk := await f.read(chunk_size):
+                yield chunk
+    
     async def delete(self, file_id: str) -> bool:
         file_path = self._get_file_path(file_id)
         
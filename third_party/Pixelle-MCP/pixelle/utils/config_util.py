@@ -1,5 +1,8 @@
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from pixelle.cli.setup.providers.config import ProviderConfig
 
 
 def parse_env_file(env_path: Path) -> Dict[str, str]:
@@ -54,11 +57,14 @@ def detect_config_status_from_env(env_vars: Dict[str, str]) -> str:
 def build_env_lines(
     comfyui_config: Optional[Dict],
     runninghub_config: Optional[Dict],
-    llm_configs: List[Dict],
+    llm_configs: List["ProviderConfig"],
     service_config: Dict,
     default_model: Optional[str] = None,
-) -> List[str]:
-    """Build .env file content lines from provided configs. No I/O here."""
+) -> Tuple[List[str], List[str]]:
+    """Build .env file content lines from provided configs. No I/O here.
+
+    Returns the lines and the environment variable names they assign.
+    """
     env_lines: List[str] = [
         "# Pixelle MCP Project Environment Variables Configuration",
         "# This file is generated by Pixelle MCP CLI; you may edit it manually.",
@@ -136,23 +142,23 @@ def build_env_lines(
     ])
 
     for llm_config in llm_configs:
-        provider = llm_config["provider"].upper()
+        provider = llm_config.provider.upper()
         if provider == "OPENAI":
             env_lines.extend([
                 "# OpenAI configuration",
-                f"OPENAI_BASE_URL=\"{llm_config.get('base_url', 'https://api.openai.com/v1')}\"",
+                f"OPENAI_BASE_URL=\"{llm_config.base_url or 'https://api.openai.com/v1'}\"",
                 "# Get your API key at: https://platform.openai.com/api-keys",
-                f"OPENAI_API_KEY=\"{llm_config['api_key']}\"",
+                f"OPENAI_API_KEY=\"{llm_config.api_key}\"",
                 "# List OpenAI models to be used, if multiple, separate with English commas",
-                f"CHAINLIT_CHAT_OPENAI_MODELS=\"{llm_config.get('models', 'gpt-4o-mini')}\"",
+                f"CHAINLIT_CHAT_OPENAI_MODELS=\"{llm_config.models or 'gpt-4o-mini'}\"",
                 "",
             ])
         elif provider == "OLLAMA":
             env_lines.extend([
                 "# Ollama configuration (local models)",
-                f"OLLAMA_BASE_URL=\"{llm_config.get('base_url', 'http://localhost:11434/v1')}\"",
+                f"OLLAMA_BASE_URL=\"{llm_config.base_url or 'http://localhost:11434/v1'}\"",
                 "# List Ollama models to be used, if multiple, separate with English commas",
-                f"OLLAMA_MODELS=\"{llm_config.get('models', '')}\"",
+                f"OLLAMA_MODELS=\"{llm_config.models or ''}\"",
                 "",
             ])
         elif provider == "GEMINI":
@@ -160,9 +166,9 @@ def build_env_lines(
                 "# Gemini configuration",
                 "GEMINI_BASE_URL=\"https://generativelanguage.googleapis.com/v1beta\"",
                 "# Get your API key at: https://aistudio.google.com/app/apikey",
-                f"GEMINI_API_KEY=\"{llm_config['api_key']}\"",
+                f"GEMINI_API_KEY=\"{llm_config.api_key}\"",
                 "# List Gemini models to be used, if multiple, separate with English commas",
-                f"GEMINI_MODELS=\"{llm_config.get('models', '')}\"",
+                f"GEMINI_MODELS=\"{llm_config.models or ''}\"",
                 "",
             ])
         elif provider == "DEEPSEEK":
@@ -170,9 +176,9 @@ def build_env_lines(
                 "# DeepSeek configuration",
                 "DEEPSEEK_BASE_URL=\"https://api.deepseek.com\"",
                 "# Get your API key at: https://platform.deepseek.com/api_keys",
-                f"DEEPSEEK_API_KEY=\"{llm_config['api_key']}\"",
+                f"DEEPSEEK_API_KEY=\"{llm_config.api_key}\"",
                 "# List DeepSeek models to be used, if multiple, separate with English commas",
-                f"DEEPSEEK_MODELS=\"{llm_config.get('models', '')}\"",
+                f"DEEPSEEK_MODELS=\"{llm_config.models or ''}\"",
                 "",
             ])
         elif provider == "CLAUDE":
@@ -180,9 +186,9 @@ def build_env_lines(
                 "# Claude (Anthropic) configuration",
                 "CLAUDE_BASE_URL=\"https://api.anthropic.com\"",
                 "# Get your API key at: https://console.anthropic.com/settings/keys",
-                f"CLAUDE_API_KEY=\"{llm_config['api_key']}\"",
+                f"CLAUDE_API_KEY=\"{llm_config.api_key}\"",
                 "# List Claude models to be used, if multiple, separate with English commas",
-                f"CLAUDE_MODELS=\"{llm_config.get('models', '')}\"",
+                f"CLAUDE_MODELS=\"{llm_config.models or ''}\"",
                 "",
             ])
         elif provider == "QWEN":
@@ -190,9 +196,9 @@ def build_env_lines(
                 "# Qwen (Alibaba Cloud) configuration",
                 "QWEN_BASE_URL=\"https://dashscope.aliyun.com/compatible-mode/v1\"",
                 "# Get your API key at: https://bailian.console.aliyun.com/?tab=model#/api-key",
-                f"QWEN_API_KEY=\"{llm_config['api_key']}\"",
+                f"QWEN_API_KEY=\"{llm_config.api_key}\"",
                 "# List Qwen models to be used, if multiple, separate with English commas",
-                f"QWEN_MODELS=\"{llm_config.get('models', '')}\"",
+                f"QWEN_MODELS=\"{llm_config.models or ''}\"",
                 "",
             ])
 
@@ -200,7 +206,7 @@ def build_env_lines(
         computed_default_model = default_model
         if not computed_default_model:
             first_llm = llm_configs[0]
-            models = first_llm.get("models", "")
+            models = first_llm.models
             if models:
                 computed_default_model = models.split(",")[0].strip()
 
@@ -211,6 +217,11 @@ def build_env_lines(
                 "",
             ])
 
-    return env_lines
+    env_keys = [
+        line.split("=", 1)[0]
+        for line in env_lines
+        if line and not line.startswith("#") and "=" in line
+    ]
+    return env_lines, env_keys
 
 
@@ -0,0 +1,69 @@
+# Copyright (C) 2025 AIDC-AI
+# This project is licensed under the MIT License (SPDX-License-identifier: MIT).
+
+"""
+Pooled aiohttp sessions - keep-alive connections on the server's event loop only
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, Callable, Optional
+
+import aiohttp
+
+# The event loop pooled sessions live on (the server loop), set by the app lifespan.
+# Code driven by asyncio.run() in helper threads runs on short-lived loops; a session
+# left on such a loop can never be closed properly, so those calls get one-shot sessions.
+_pool_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def bind_session_pool_loop():
+    """Pool HTTP sessions on the running event loop; call on server startup"""
+    global _pool_loop
+    _pool_loop = asyncio.get_running_loop()
+
+
+def unbind_session_pool_loop():
+    """Stop pooling HTTP sessions; call on shutdown after the pools are closed"""
+    global _pool_loop
+    _pool_loop = None
+
+
+class SessionPool:
+    """One aiohttp session reused on the bound event loop, one-shot sessions elsewhere
+
+    The pooled session is only created and used on the bound loop's thread, so no
+    locking is needed.
+    """
+
+    def __init__(self):
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def pooled(self) -> Optional[aiohttp.ClientSession]:
+        """The open pooled session, if any"""
+        if self._session is None or self._session.closed:
+            return None
+        return self._session
+
+    @asynccontextmanager
+    async def acquire(self, factory: Callable[[], aiohttp.ClientSession]) -> AsyncGenerator[aiohttp.ClientSession, None]:
+        """Yield the pooled session on the bound loop, otherwise a session closed after the block
+
+        Args:
+            factory: Creates a new session (called on the running loop)
+        """
+        if asyncio.get_running_loop() is not _pool_loop:
+            async with factory() as session:
+                yield session
+            return
+
+        if self.pooled is None:
+            self._session = factory()
+        yield self._session
+
+    async def close(self):
+        """Close the pooled session; call on the bound loop"""
+        session, self._session = self._session, None
+        if session is not None and not session.closed:
+            await session.close()
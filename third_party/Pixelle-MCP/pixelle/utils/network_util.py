@@ -1,6 +1,15 @@
+import hashlib
+import json
+import os
+import time
 import requests
 from urllib.parse import urljoin
-from typing import List
+from typing import Dict, List, Optional, Tuple
+
+# OpenAI model lists are cached in memory and on disk for this long (seconds).
+# Set PIXELLE_REFRESH_CACHE=1 to bypass the cache and refetch.
+OPENAI_MODELS_CACHE_TTL = 3600
+_openai_models_cache: Dict[str, Tuple[float, List[str]]] = {}
 
 
 def check_url_status(url: str, timeout: int = 5) -> bool:
@@ -47,24 +56,99 @@ def test_comfyui_connection(url: str) -> bool:
         return False
 
 
-def test_ollama_connection(base_url: str) -> bool:
-    """Test Ollama connectivity using /api/tags endpoint.
+def fetch_ollama_status(base_url: str) -> Tuple[bool, List[str]]:
+    """Check Ollama connectivity and list its models with one /api/tags request.
 
     Accepts either base_url with or without "/v1" suffix.
+    Returns (connected, model names); model names are empty if the listing can't be parsed.
     """
     try:
         test_url = base_url.replace("/v1", "")
         response = requests.get(f"{test_url}/api/tags", timeout=5)
-        return response.status_code == 200
     except Exception:
-        return False
+        return False, []
+    if response.status_code != 200:
+        return False, []
+    try:
+        data = response.json()
+        return True, [model.get("name", "") for model in data.get("models", [])]
+    except Exception:
+        return True, []
+
+
+def test_ollama_connection(base_url: str) -> bool:
+    """Test Ollama connectivity using /api/tags endpoint.
+
+    Accepts either base_url with or without "/v1" suffix.
+    """
+    return fetch_ollama_status(base_url)[0]
+
+
+def _openai_models_cache_file() -> str:
+    from pixelle.utils.os_util import get_temp_path
+    return get_temp_path("openai_models_cache.json")
+
+
+def _load_openai_models_cache(cache_key: str) -> Optional[List[str]]:
+    """Return a fresh cached model list for ``cache_key`` from memory or disk, else None."""
+    entry = _openai_models_cache.get(cache_key)
+    if entry is None:
+        try:
+            with open(_openai_models_cache_file(), "r", encoding="utf-8") as f:
+                fetched_at, models = json.load(f)[cache_key]
+            entry = (float(fetched_at), list(models))
+        except Exception:
+            return None
+        _openai_models_cache[cache_key] = entry
+    fetched_at, models = entry
+    if time.time() - fetched_at > OPENAI_MODELS_CACHE_TTL:
+        return None
+    return list(models)
+
+
+def _store_openai_models_cache(cache_key: str, models: List[str]):
+    entry = (time.time(), list(models))
+    _openai_models_cache[cache_key] = entry
+    cache_file = _openai_models_cache_file()
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            data = {}
+    except Exception:
+        data = {}
+    data[cache_key] = entry
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        tmp_file = cache_file + ".tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
 
 
 def get_openai_models(api_key: str, base_url: str) -> List[str]:
     """Fetch available OpenAI(-compatible) models; returns deduplicated list in original order.
 
     Returns all available models without filtering, letting users choose themselves.
+    Successful results are cached per (api_key, base_url) for OPENAI_MODELS_CACHE_TTL
+    seconds; the API key is only stored as a hash.
     """
+    # Cache key never contains the raw API key
+    cache_key = hashlib.sha256(f"{api_key}\0{base_url}".encode("utf-8")).hexdigest()
+    if os.environ.get("PIXELLE_REFRESH_CACHE") != "1":
+        cached = _load_openai_models_cache(cache_key)
+        if cached is not None:
+            return cached
+    
+    models = _fetch_openai_models(api_key, base_url)
+    if models:
+        _store_openai_models_cache(cache_key, models)
+    return models
+
+
+def _fetch_openai_models(api_key: str, base_url: str) -> List[str]:
     try:
         headers = {"Authorization": f"Bearer {api_key}"}
         response = requests.get(f"{base_url}/models", headers=headers, timeout=10)
@@ -86,14 +170,6 @@ def get_openai_models(api_key: str, base_url: str) -> List[str]:
 
 def get_ollama_models(base_url: str) -> List[str]:
     """Fetch available Ollama models from /api/tags; returns list of names."""
-    try:
-        test_url = base_url.replace("/v1", "")
-        response = requests.get(f"{test_url}/api/tags", timeout=5)
-        if response.status_code == 200:
-            data = response.json()
-            return [model.get("name", "") for model in data.get("models", [])]
-    except Exception:
-        pass
-    return []
+    return fetch_ollama_status(base_url)[1]
 
 
@@ -8,10 +8,48 @@ Workflow source utility functions - centralized logic for workflow source type d
 import json
 import os
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 from pixelle.logger import logger
 
+# Parsed workflow files: path -> (st_mtime_ns, st_size, data).
+# Workflow files are read-mostly, so one stat() per lookup replaces a full JSON parse.
+_workflow_json_cache: Dict[str, Tuple[int, int, Any]] = {}
+
+
+def load_workflow_json(workflow_file: str | Path) -> Any:
+    """Load a workflow JSON file, reusing the parsed data while the file is unchanged
+    
+    The returned data is shared between callers and must be treated as read-only.
+    
+    Args:
+        workflow_file: Path to the workflow file
+        
+    Returns:
+        Any: Parsed JSON data
+        
+    Raises:
+        OSError, ValueError: If the file cannot be read or parsed
+    """
+    path = os.fspath(workflow_file)
+    st = os.stat(path)
+    entry = _workflow_json_cache.get(path)
+    if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+        return entry[2]
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    _workflow_json_cache[path] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
+def invalidate_workflow_json(workflow_file: str | Path | None = None):
+    """Drop the cached data of one workflow file, or of all files if none is given"""
+    if workflow_file is None:
+        _workflow_json_cache.clear()
+    else:
+        _workflow_json_cache.pop(os.fspath(workflow_file), None)
+
 
 def get_workflow_source(workflow_file: str | Path) -> Optional[str]:
     """Get workflow source type
@@ -27,8 +65,7 @@ def get_workflow_source(workflow_file: str | Path) -> Optional[str]:
         if not os.path.exists(workflow_file):
             return None
             
-        with open(workflow_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_workflow_json(workflow_file)
         
         return data.get("_source")
     except Exception:
@@ -61,8 +98,7 @@ def has_workflow_source(workflow_file: str | Path) -> bool:
         if not os.path.exists(workflow_file):
             return False
             
-        with open(workflow_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_workflow_json(workflow_file)
         
         return "_source" in data
     except Exception:
@@ -83,8 +119,7 @@ def get_workflow_source_data(workflow_file: str | Path) -> Optional[Dict[str, An
         if not os.path.exists(workflow_file):
             return None
             
-        with open(workflow_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_workflow_json(workflow_file)
         
         # Only return data if it has _source field
         if "_source" not in data:
@@ -64,7 +64,7 @@ import torch.nn.functional as F
 class IndexTTS2:
     def __init__(
             self, cfg_path="checkpoints/config.yaml", model_dir="checkpoints", use_fp16=False, device=None,
-            use_cuda_kernel=None,use_deepspeed=False
+            use_cuda_kernel=None,use_deepspeed=False, use_bf16=False
     ):
         """
         Args:
@@ -74,6 +74,7 @@ class IndexTTS2:
             device (str): device to use (e.g., 'cuda:0', 'cpu'). If None, it will be set automatically based on the availability of CUDA or MPS.
             use_cuda_kernel (None | bool): whether to use BigVGan custom fused activation CUDA kernel, only for CUDA device.
             use_deepspeed (bool): whether to use DeepSpeed or not.
+            use_bf16 (bool): whether to use bf16 (CUDA devices with bf16 support only; takes precedence over fp16).
         """
         if device is not None:
             self.device = device
@@ -99,7 +100,10 @@ class IndexTTS2:
 
         self.cfg = OmegaConf.load(cfg_path)
         self.model_dir = model_dir
-        self.dtype = torch.float16 if self.use_fp16 else None
+        self.use_bf16 = bool(use_bf16) and self.device.startswith("cuda") and torch.cuda.is_bf16_supported()
+        if self.use_bf16:
+            self.use_fp16 = False
+        self.dtype = torch.bfloat16 if self.use_bf16 else torch.float16 if self.use_fp16 else None
         self.stop_mel_token = self.cfg.gpt.stop_mel_token
 
         self.qwen_emo = QwenEmotion(os.path.join(self.model_dir, self.cfg.qwen_emo_path))
@@ -110,6 +114,8 @@ class IndexTTS2:
         self.gpt = self.gpt.to(self.device)
         if self.use_fp16:
             self.gpt.eval().half()
+        elif self.use_bf16:
+            self.gpt.eval().to(torch.bfloat16)
         else:
             self.gpt.eval()
         print(">> GPT weights restored from:", self.gpt_path)
@@ -260,6 +266,8 @@ class IndexTTS2:
 
         # 进度引用显示（可选）
         self.gr_progress = None
+        # optional random.Random for use_random preset picks; None uses the global module
+        self.py_rng = None
         self.model_version = self.cfg.version if hasattr(self.cfg, "version") else None
 
     @torch.no_grad()
@@ -372,7 +380,14 @@ class IndexTTS2:
             self.gr_progress(value, desc=desc)
 
     def _load_and_cut_audio(self,audio_path,max_audio_length_seconds,verbose=False,sr=None):
-        if not sr:
+        if hasattr(audio_path, "samples") and hasattr(audio_path, "sample_rate"):
+            # in-memory prompt (channels, N) float32; mirror librosa.load's mono + resample
+            target_sr = sr or 22050
+            audio = librosa.to_mono(audio_path.samples)
+            if audio_path.sample_rate != target_sr:
+                audio = librosa.resample(audio, orig_sr=audio_path.sample_rate, target_sr=target_sr)
+            sr = target_sr
+        elif not sr:
             audio, sr = librosa.load(audio_path)
         else:
             audio, _ = librosa.load(audio_path,sr=sr)
@@ -520,7 +535,8 @@ class IndexTTS2:
         if emo_vector is not None:
             weight_vector = torch.tensor(emo_vector).to(self.device)
             if use_random:
-                random_index = [random.randint(0, x - 1) for x in self.emo_num]
+                rng = self.py_rng or random
+                random_index = [rng.randint(0, x - 1) for x in self.emo_num]
             else:
                 random_index = [find_most_similar_cosine(style, tmp) for tmp in self.spk_matrix]
 
@@ -5,9 +5,23 @@ import torch.nn.functional as F
 
 from indextts.s2mel.modules.diffusion_transformer import DiT
 from indextts.s2mel.modules.commons import sequence_mask
+from indextts.s2mel.modules.gpt_fast.model import TransformerBlock
 
 from tqdm import tqdm
 
+
+def step_cache_schedule(n_steps, warmup=0.2, cooldown=0.1):
+    """Steps whose transformer branch outputs are reused from the previous step.
+
+    Adjacent-step attention/FFN outputs change slowly in the middle of the
+    trajectory, so reuse every other step there; the noisy start and the
+    detail-forming tail are always recomputed, and no two steps in a row reuse.
+    """
+    first = max(1, int(round(n_steps * warmup)))
+    last = n_steps - max(1, int(round(n_steps * cooldown)))
+    return tuple(first <= i < last and (i - first) % 2 == 1 for i in range(n_steps))
+
+
 class BASECFM(torch.nn.Module, ABC):
     def __init__(
         self,
@@ -27,6 +41,19 @@ class BASECFM(torch.nn.Module, ABC):
         else:
             self.zero_prompt_speech_token = False
 
+        self.step_cache = False
+
+    def _set_step_cache(self, enabled, reuse=False):
+        blocks = getattr(self, "_step_cache_blocks", None)
+        if blocks is None:
+            blocks = [m for m in self.estimator.modules() if isinstance(m, TransformerBlock)]
+            self._step_cache_blocks = blocks
+        for block in blocks:
+            block.step_cache_enabled = enabled
+            block.step_cache_reuse = reuse
+            if not enabled:
+                block.step_cache = None
+
     @torch.inference_mode()
     def inference(self, mu, x_lens, prompt, style, f0, n_timesteps, temperature=1.0, inference_cfg_rate=0.5):
         """Forward diffusion
@@ -82,36 +109,42 @@ class BASECFM(torch.nn.Module, ABC):
         x[..., :prompt_len] = 0
         if self.zero_prompt_speech_token:
             mu[..., :prompt_len] = 0
-        for step in tqdm(range(1, len(t_span))):
-            dt = t_span[step] - t_span[step - 1]
-            if inference_cfg_rate > 0:
-                # Stack original and CFG (null) inputs for batched processing
-                stacked_prompt_x = torch.cat([prompt_x, torch.zeros_like(prompt_x)], dim=0)
-                stacked_style = torch.cat([style, torch.zeros_like(style)], dim=0)
-                stacked_mu = torch.cat([mu, torch.zeros_like(mu)], dim=0)
-                stacked_x = torch.cat([x, x], dim=0)
-                stacked_t = torch.cat([t.unsqueeze(0), t.unsqueeze(0)], dim=0)
-
-                # Perform a single forward pass for both original and CFG inputs
-                stacked_dphi_dt = self.estimator(
-                    stacked_x, stacked_prompt_x, x_lens, stacked_t, stacked_style, stacked_mu,
-                )
-
-                # Split the output back into the original and CFG components
-                dphi_dt, cfg_dphi_dt = stacked_dphi_dt.chunk(2, dim=0)
-
-                # Apply CFG formula
-                dphi_dt = (1.0 + inference_cfg_rate) * dphi_dt - inference_cfg_rate * cfg_dphi_dt
-            else:
-                dphi_dt = self.estimator(x, prompt_x, x_lens, t.unsqueeze(0), style, mu)
-
-            x = x + dt * dphi_dt
-            t = t + dt
-            sol.append(x)
-            if step < len(t_span) - 1:
-                dt = t_span[step + 1] - t
-            x[:, :, :prompt_len] = 0
-
+        schedule = step_cache_schedule(len(t_span) - 1) if self.step_cache else None
+        try:
+            for step in tqdm(range(1, len(t_span))):
+                dt = t_span[step] - t_span[step - 1]
+                if schedule is not None:
+                    self._set_step_cache(True, reuse=schedule[step - 1])
+                if inference_cfg_rate > 0:
+                    # Stack original and CFG (null) inputs for batched processing
+                    stacked_prompt_x = torch.cat([prompt_x, torch.zeros_like(prompt_x)], dim=0)
+                    stacked_style = torch.cat([style, torch.zeros_like(style)], dim=0)
+                    stacked_mu = torch.cat([mu, torch.zeros_like(mu)], dim=0)
+                    stacked_x = torch.cat([x, x], dim=0)
+                    stacked_t = torch.cat([t.unsqueeze(0), t.unsqueeze(0)], dim=0)
+
+                    # Perform a single forward pass for both original and CFG inputs
+                    stacked_dphi_dt = self.estimator(
+                        stacked_x, stacked_prompt_x, x_lens, stacked_t, stacked_style, stacked_mu,
+                    )
+
+                    # Split the output back into the original and CFG components
+                    dphi_dt, cfg_dphi_dt = stacked_dphi_dt.chunk(2, dim=0)
+
+                    # Apply CFG formula
+                    dphi_dt = (1.0 + inference_cfg_rate) * dphi_dt - inference_cfg_rate * cfg_dphi_dt
+                else:
+                    dphi_dt = self.estimator(x, prompt_x, x_lens, t.unsqueeze(0), style, mu)
+
+                x = x + dt * dphi_dt
+                t = t + dt
+                sol.append(x)
+                if step < len(t_span) - 1:
+                    dt = t_span[step + 1] - t
+                x[:, :, :prompt_len] = 0
+        finally:
+            if schedule is not None:
+                self._set_step_cache(False)
         return sol[-1]
     def forward(self, x1, x_lens, prompt_lens, mu, style):
         """Computes diffusion loss
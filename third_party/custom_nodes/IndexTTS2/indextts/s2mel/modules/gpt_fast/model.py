@@ -218,6 +218,12 @@ class TransformerBlock(nn.Module):
 
         self.time_as_token = config.time_as_token
 
+        # step cache (driven by the CFM solver): when enabled, the attention/FFN
+        # branch outputs are kept so that scheduled diffusion steps can reuse them
+        self.step_cache_enabled = False
+        self.step_cache_reuse = False
+        self.step_cache = None
+
     def forward(self,
                 x: Tensor,
                 c: Tensor,
@@ -232,10 +238,22 @@ class TransformerBlock(nn.Module):
         c = None if self.time_as_token else c
         if self.uvit_skip_connection and skip_in_x is not None:
             x = self.skip_in_linear(torch.cat([x, skip_in_x], dim=-1))
-        h = x + self.attention(self.attention_norm(x, c), freqs_cis, mask, input_pos)
+        if self.step_cache_reuse and self.step_cache is not None and self.step_cache[0].shape == x.shape:
+            attn_out, cross_out, ffn_out = self.step_cache
+            h = x + attn_out
+            if cross_out is not None:
+                h = h + cross_out
+            return h + ffn_out
+        attn_out = self.attention(self.attention_norm(x, c), freqs_cis, mask, input_pos)
+        h = x + attn_out
+        cross_out = None
         if self.has_cross_attention:
-            h = h + self.cross_attention(self.cross_attention_norm(h, c), freqs_cis, cross_attention_mask, input_pos, context, context_freqs_cis)
-        out = h + self.feed_forward(self.ffn_norm(h, c))
+            cross_out = self.cross_attention(self.cross_attention_norm(h, c), freqs_cis, cross_attention_mask, input_pos, context, context_freqs_cis)
+            h = h + cross_out
+        ffn_out = self.feed_forward(self.ffn_norm(h, c))
+        if self.step_cache_enabled:
+            self.step_cache = (attn_out, cross_out, ffn_out)
+        out = h + ffn_out
         return out
 
 
@@ -1,18 +1,22 @@
 ﻿import gc
+import hashlib
 import os
 import sys
 import tempfile
 import threading
 import math
-from functools import wraps
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
 from typing import Any, Dict, Tuple
 
 import numpy as np
 
 #simple in-memory cache for loaded models to avoid re-initializing weights
-_MODEL_CACHE: Dict[Tuple[str, str, str, bool, bool], Any] = {}
+_MODEL_CACHE: Dict[Tuple[str, str, str, bool, bool, bool], Any] = {}
 _CACHE_LOCK = threading.RLock()
 _UNLOAD_HOOK_INSTALLED = False
+#overlaps the speaker/emotion prompt WAV writes (encode + disk I/O release the GIL)
+_PROMPT_WRITER = ThreadPoolExecutor(max_workers=2, thread_name_prefix="indextts2_prompt")
 
 def _resolve_device(device: str):
     try:
@@ -30,14 +34,23 @@ def _resolve_device(device: str):
         return "mps"
     return "cpu"
 
+@lru_cache(maxsize=None)
+def _bf16_supported(device: str) -> bool:
+    try:
+        import torch
+    except Exception:
+        return False
+    return device.startswith("cuda") and torch.cuda.is_available() and torch.cuda.is_bf16_supported()
+
 def _get_tts2_model(config_path: str,
                     model_dir: str,
                     device: str,
                     use_cuda_kernel: bool,
-                    use_fp16: bool):
+                    use_fp16: bool,
+                    use_bf16: bool = False):
     _install_unload_hook()
 
-    key = (os.path.abspath(config_path), os.path.abspath(model_dir), device, bool(use_cuda_kernel), bool(use_fp16))
+    key = (os.path.abspath(config_path), os.path.abspath(model_dir), device, bool(use_cuda_kernel), bool(use_fp16), bool(use_bf16))
 
     with _CACHE_LOCK:
         cached_model = _MODEL_CACHE.get(key)
@@ -58,7 +71,8 @@ def _get_tts2_model(config_path: str,
 
     from indextts.infer_v2 import IndexTTS2
 
-    eff_fp16 = use_fp16 and device.startswith("cuda")
+    eff_bf16 = use_bf16 and _bf16_supported(device)
+    eff_fp16 = use_fp16 and device.startswith("cuda") and not eff_bf16
 
     model = IndexTTS2(
         cfg_path=config_path,
@@ -67,6 +81,7 @@ def _get_tts2_model(config_path: str,
         device=device,
         use_cuda_kernel=use_cuda_kernel,
         use_deepspeed=False,
+        use_bf16=eff_bf16,
     )
     with _CACHE_LOCK:
         existing = _MODEL_CACHE.get(key)
@@ -79,6 +94,21 @@ def _get_tts2_model(config_path: str,
 
 
 
+@lru_cache(maxsize=4)
+def _cached_tts2(config_path: str, model_dir: str, device: str, use_fp16: bool, use_bf16: bool = False):
+    """Hot-path shim over _get_tts2_model keyed on plain hashable args (no CUDA kernel).
+
+    Cleared by _dispose_cached_models so unloaded models are not kept alive.
+    """
+    return _get_tts2_model(
+        config_path=config_path,
+        model_dir=model_dir,
+        device=device,
+        use_cuda_kernel=False,
+        use_fp16=use_fp16,
+        use_bf16=use_bf16,
+    )
+
 
 def _flush_device_caches():
     try:
@@ -183,6 +213,7 @@ def _teardown_model(model):
 
 
 def _dispose_cached_models() -> bool:
+    _cached_tts2.cache_clear()
     with _CACHE_LOCK:
         if not _MODEL_CACHE:
             return False
@@ -228,14 +259,41 @@ def _install_unload_hook():
     _UNLOAD_HOOK_INSTALLED = True
 
 
-def _audio_to_temp_wav(audio: Any) -> Tuple[str, int, bool]:
+class _AudioPrompt:
+    """In-memory reference audio handed to IndexTTS2 in place of a file path.
+
+    Equality is by content digest, so the model's prompt caches hit when the
+    same waveform is fed again (e.g. ComfyUI graph re-runs).
+    """
+
+    __slots__ = ("sample_rate", "samples", "digest")
+
+    def __init__(self, sample_rate: int, samples: np.ndarray):
+        self.sample_rate = int(sample_rate)
+        self.samples = np.ascontiguousarray(samples)  # (channels, N) float32 in [-1, 1]
+        h = hashlib.blake2b(digest_size=16)
+        h.update(self.sample_rate.to_bytes(4, "little"))
+        h.update(self.samples.data)
+        self.digest = h.digest()
+
+    def __eq__(self, other):
+        if not isinstance(other, _AudioPrompt):
+            return NotImplemented
+        return self.digest == other.digest
+
+    def __hash__(self):
+        return hash(self.digest)
+
+    def __repr__(self):
+        return f"<in-memory audio {self.sample_rate}Hz {self.digest.hex()[:12]}>"
+
+
+def _audio_to_array(audio: Any) -> Tuple[np.ndarray, int]:
+    """Normalize an AUDIO input to a (channels, samples) float32 array."""
 
     sr = None
     data = None
 
-    if isinstance(audio, str) and os.path.exists(audio):
-        return audio, 0, False  # use existing path, no cleanup
-
     if isinstance(audio, (tuple, list)):
         cand_ints = [x for x in audio if isinstance(x, (int, np.integer))]
         cand_arrays = [x for x in audio if hasattr(x, "shape")]
@@ -285,12 +343,36 @@ def _audio_to_temp_wav(audio: Any) -> Tuple[str, int, bool]:
         wav = wav.astype(np.float32) / denom
     else:
         wav = np.clip(wav.astype(np.float32), -1.0, 1.0)
+    return wav, int(sr)
+
+
+def _audio_to_prompt(audio: Any):
+    """Return an existing file path unchanged, otherwise an in-memory prompt."""
+    if isinstance(audio, str) and os.path.exists(audio):
+        return audio
+    wav, sr = _audio_to_array(audio)
+    return _AudioPrompt(sr, wav)
+
 
+def _audio_to_temp_wav(audio: Any) -> Tuple[str, int, bool]:
+    if isinstance(audio, str) and os.path.exists(audio):
+        return audio, 0, False  # use existing path, no cleanup
+
+    wav, sr = _audio_to_array(audio)
     fd, tmp_path = tempfile.mkstemp(suffix=".wav", prefix="indextts2_prompt_")
     os.close(fd)
     _save_wav(tmp_path, wav, int(sr))
     return tmp_path, int(sr), True
 
+def _remove_temp_files(entries):
+    """Unlink (path, needs_cleanup) temp files; no exists() pre-check, missing files are fine."""
+    for path, needs_cleanup in entries:
+        if needs_cleanup and path:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
 def _save_wav(path: str, wav_cn: np.ndarray, sr: int):
     """Save numpy waveform to WAV PCM16 without requiring torchaudio.
     Expects wav_cn as (channels, samples) float32 in [-1, 1].
@@ -360,14 +442,20 @@ class IndexTTS2Simple:
         if not isinstance(text, str) or len(text.strip()) == 0:
             raise ValueError("Text is empty. Please provide text to synthesize.")
 
-        prompt_path, _, need_cleanup = _audio_to_temp_wav(audio)
+        prompt_future = _PROMPT_WRITER.submit(_audio_to_temp_wav, audio)
+        emo_future = _PROMPT_WRITER.submit(_audio_to_temp_wav, emotion_audio) if emotion_audio is not None else None
         emo_path = None
         emo_need_cleanup = False
-        if emotion_audio is not None:
+        if emo_future is not None:
             try:
-                emo_path, _, emo_need_cleanup = _audio_to_temp_wav(emotion_audio)
+                emo_path, _, emo_need_cleanup = emo_future.result()
             except Exception:
                 emo_path, emo_need_cleanup = None, False
+        try:
+            prompt_path, _, need_cleanup = prompt_future.result()
+        except Exception:
+            _remove_temp_files(((emo_path, emo_need_cleanup),))
+            raise
 
         base_dir = os.path.dirname(os.path.abspath(__file__))
         ext_root = os.path.dirname(base_dir)
@@ -437,13 +525,7 @@ class IndexTTS2Simple:
             )
         finally:
             #clean up temp files
-            try:
-                if need_cleanup and prompt_path and os.path.exists(prompt_path):
-                    os.remove(prompt_path)
-                if emo_need_cleanup and emo_path and os.path.exists(emo_path):
-                    os.remove(emo_path)
-            except Exception:
-                pass
+            _remove_temp_files(((prompt_path, need_cleanup), (emo_path, emo_need_cleanup)))
 
         if not isinstance(result, (tuple, list)) or len(result) != 2:
             #defensive: if the upstream API changes unexpectedly
@@ -1,34 +1,86 @@
-﻿import os
+﻿import functools
+import os
 import random
+import threading
+import weakref
+from collections import OrderedDict
 import numpy as np
+import torch
+
+try:
+    from numba import njit, prange
+except Exception:  # numba is optional; fall back to plain NumPy
+    njit = None
 
 from .indextts2_node import (
-    _audio_to_temp_wav,
-    _get_tts2_model,
+    _audio_to_prompt,
+    _bf16_supported,
+    _cached_tts2,
     _resolve_device,
 )
 
 
-def _coerce_float(value, default, clamp=None, random_bounds=None):
-    def _maybe_random():
-        if not random_bounds:
-            base = default if isinstance(default, (int, float)) else 0.0
-            low = max(0.0, base * 0.5) if base else 0.0
-            high = base * 1.5 + 1.0 if base else 1.0
-            return random.uniform(low, high)
-        low, high = random_bounds
-        return random.uniform(low, high)
+#device availability probed once at import instead of on every synthesize call
+_DEV_FLAGS = {
+    "cuda": torch.cuda.is_available(),
+    "xpu": hasattr(torch, "xpu") and callable(getattr(torch.xpu, "is_available", None)) and torch.xpu.is_available(),
+    "mps": hasattr(torch.backends, "mps") and torch.backends.mps.is_available(),
+}
+_AUTO_DEVICE = _resolve_device("auto")
 
-    if value is None:
+_EXT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_RESOLVED_MODEL_DIR = os.path.join(_EXT_ROOT, "checkpoints")
+_RESOLVED_CONFIG = os.path.join(_RESOLVED_MODEL_DIR, "config.yaml")
+
+
+@functools.cache
+def _validate_paths():
+    #only a successful check is cached; a missing checkpoint keeps raising until it is installed
+    if not os.path.isfile(_RESOLVED_CONFIG):
+        raise FileNotFoundError(f"Config file not found: {_RESOLVED_CONFIG}")
+    if not os.path.isdir(_RESOLVED_MODEL_DIR):
+        raise FileNotFoundError(f"Model directory not found: {_RESOLVED_MODEL_DIR}")
+    return _RESOLVED_CONFIG, _RESOLVED_MODEL_DIR
+
+
+#conditioning latents IndexTTS2 keeps in single-slot caches, grouped by prompt kind
+_LATENT_SLOTS = {
+    "spk": ("cache_spk_audio_prompt", ("cache_spk_cond", "cache_s2mel_style", "cache_s2mel_prompt", "cache_mel")),
+    "emo": ("cache_emo_audio_prompt", ("cache_emo_cond",)),
+}
+_LATENT_CACHE_SIZE = 16
+
+
+_RANDOM_TOKENS = frozenset({"random", "rand", "randomize"})
+_TRUE_TOKENS = frozenset({"true", "1", "yes", "on"})
+_FALSE_TOKENS = frozenset({"false", "0", "no", "off"})
+_NONE_TOKENS = frozenset({"", "none"})
+
+
+def _random_float(default, random_bounds, rng=random):
+    if not random_bounds:
+        base = default if isinstance(default, (int, float)) else 0.0
+        low = max(0.0, base * 0.5) if base else 0.0
+        high = base * 1.5 + 1.0 if base else 1.0
+        return rng.uniform(low, high)
+    low, high = random_bounds
+    return rng.uniform(low, high)
+
+
+def _coerce_float(value, default, clamp=None, random_bounds=None, rng=random):
+    value_type = type(value)
+    if value_type is float or value_type is int:
+        result = float(value)
+    elif value is None:
         return default
-    if isinstance(value, (int, float)):
+    elif isinstance(value, (int, float)):
         result = float(value)
     elif isinstance(value, str):
         token = value.strip().lower()
         if not token:
             return default
-        if token in {"random", "rand", "randomize"}:
-            result = float(_maybe_random())
+        if token in _RANDOM_TOKENS:
+            result = float(_random_float(default, random_bounds, rng))
         else:
             try:
                 result = float(token)
@@ -45,8 +97,11 @@ def _coerce_float(value, default, clamp=None, random_bounds=None):
     return result
 
 
-def _coerce_int(value, default, clamp=None, random_bounds=None):
-    if value is None:
+def _coerce_int(value, default, clamp=None, random_bounds=None, rng=random):
+    value_type = type(value)
+    if value_type is int or value_type is float:
+        result = int(value)
+    elif value is None:
         result = default
     elif isinstance(value, (int, float)):
         result = int(value)
@@ -54,7 +109,7 @@ def _coerce_int(value, default, clamp=None, random_bounds=None):
         token = value.strip().lower()
         if not token:
             return default
-        if token in {"random", "rand", "randomize"}:
+        if token in _RANDOM_TOKENS:
             if random_bounds is not None:
                 low, high = random_bounds
             else:
@@ -63,7 +118,7 @@ def _coerce_int(value, default, clamp=None, random_bounds=None):
                 high = max(low + 1, int(base * 1.5) + 1)
             if high <= low:
                 high = low + 1
-            result = random.randint(int(low), int(high))
+            result = rng.randint(int(low), int(high))
         else:
             try:
                 result = int(float(token))
@@ -81,21 +136,73 @@ def _coerce_int(value, default, clamp=None, random_bounds=None):
 
 
 def _coerce_bool(value, default=False):
-    if isinstance(value, bool):
+    value_type = type(value)
+    if value_type is bool:
         return value
     if value is None:
         return default
     if isinstance(value, str):
         token = value.strip().lower()
-        if token in {"", "none"}:
+        if token in _NONE_TOKENS:
             return default
-        if token in {"true", "1", "yes", "on"}:
+        if token in _TRUE_TOKENS:
             return True
-        if token in {"false", "0", "no", "off"}:
+        if token in _FALSE_TOKENS:
             return False
     return bool(value)
 
 
+def _mix_channels_numpy(x, scale, gain, clip, out):
+    np.multiply(x.mean(axis=0, dtype=np.float32), np.float32(scale * gain), out=out)
+    if clip:
+        np.clip(out, -1.0, 1.0, out=out)
+    return out
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _mix_channels(x, scale, gain, clip, out):
+        channels, n = x.shape
+        factor = scale * gain / channels
+        for i in prange(n):
+            acc = 0.0
+            for c in range(channels):
+                acc += x[c, i]
+            v = acc * factor
+            if clip:
+                v = min(max(v, -1.0), 1.0)
+            out[i] = v
+        return out
+else:
+    _mix_channels = _mix_channels_numpy
+
+
+def _finalize_waveform(wav, gain):
+    """Down-mix to mono, scale int16 PCM, apply gain and clip in one pass.
+
+    Returns a 1-D float32 array; clipping only happens when gain != 1,
+    matching the previous multi-pass behaviour.
+    """
+    wav = np.asarray(wav)
+    if wav.ndim == 1:
+        x = wav[None, :]
+    else:
+        #samples run along the longest axis; everything else is channels
+        x = np.moveaxis(wav, int(np.argmax(wav.shape)), -1)
+        if x.ndim > 2:
+            x = x.reshape(-1, x.shape[-1])
+
+    scale = 1.0 / 32767.0 if x.dtype == np.int16 else 1.0
+    if x.shape[0] == 1 and gain == 1.0 and scale == 1.0 and x.dtype == np.float32:
+        return x[0]
+
+    if x.dtype not in (np.float32, np.float64, np.int16):
+        x = x.astype(np.float32)
+    #exact-length output: it becomes the returned tensor, which ComfyUI may cache
+    out = np.empty(x.shape[1], dtype=np.float32)
+    return _mix_channels(x, scale, float(gain), gain != 1.0, out)
+
+
 class IndexTTS2Advanced:
     @classmethod
     def INPUT_TYPES(cls):
@@ -125,6 +232,8 @@ class IndexTTS2Advanced:
                 "speech_speed": ("FLOAT", {"default": 1.0, "min": 0.0, "max": 4.0, "step": 0.05}),
                 "use_fp16": ("BOOLEAN", {"default": False}),
                 "output_gain": ("FLOAT", {"default": 1.0, "min": 0.0, "max": 4.0, "step": 0.05}),
+                "enable_step_cache": ("BOOLEAN", {"default": False}),
+                "precision": (["fp32", "fp16", "bf16"], {"default": "fp32", "tooltip": "bf16 needs a CUDA GPU with bf16 support and falls back to fp16 otherwise; use_fp16 still selects fp16 when this is fp32"}),
             },
         }
 
@@ -132,6 +241,42 @@ class IndexTTS2Advanced:
     FUNCTION = "synthesize"
     CATEGORY = "Audio/IndexTTS"
 
+    #per-model LRU of conditioning latents; entries die with the model instance
+    _latent_cache = weakref.WeakKeyDictionary()
+    _latent_lock = threading.Lock()
+
+    @classmethod
+    def _restore_latents(cls, tts2, kind, prompt):
+        prompt_attr, attrs = _LATENT_SLOTS[kind]
+        if prompt is None or getattr(tts2, prompt_attr, None) == prompt:
+            return
+        with cls._latent_lock:
+            lru = cls._latent_cache.get(tts2)
+            entry = lru.get((kind, prompt)) if lru is not None else None
+            if entry is not None:
+                lru.move_to_end((kind, prompt))
+        if entry is None:
+            return
+        for attr, value in zip(attrs, entry):
+            setattr(tts2, attr, value)
+        setattr(tts2, prompt_attr, prompt)
+
+    @classmethod
+    def _remember_latents(cls, tts2, kind):
+        prompt_attr, attrs = _LATENT_SLOTS[kind]
+        prompt = getattr(tts2, prompt_attr, None)
+        entry = tuple(getattr(tts2, attr, None) for attr in attrs)
+        if prompt is None or entry[0] is None:
+            return
+        with cls._latent_lock:
+            lru = cls._latent_cache.get(tts2)
+            if lru is None:
+                lru = cls._latent_cache[tts2] = OrderedDict()
+            lru[(kind, prompt)] = entry
+            lru.move_to_end((kind, prompt))
+            while len(lru) > _LATENT_CACHE_SIZE:
+                lru.popitem(last=False)
+
     def synthesize(self,
                    audio,
                    text: str,
@@ -154,79 +299,56 @@ class IndexTTS2Advanced:
                    typical_mass: float = 0.9,
                    speech_speed: float = 1.0,
                    use_fp16: bool = False,
-                   output_gain: float = 1.0):
+                   output_gain: float = 1.0,
+                   enable_step_cache: bool = False,
+                   precision: str = "fp32"):
 
         if not isinstance(text, str) or len(text.strip()) == 0:
             raise ValueError("Text is empty. Please provide text to synthesize.")
 
-        prompt_path, _, need_cleanup = _audio_to_temp_wav(audio)
+        prompt_path = _audio_to_prompt(audio)
         emo_path = None
-        emo_need_cleanup = False
         if emotion_audio is not None:
             try:
-                emo_path, _, emo_need_cleanup = _audio_to_temp_wav(emotion_audio)
+                emo_path = _audio_to_prompt(emotion_audio)
             except Exception:
-                emo_path, emo_need_cleanup = None, False
+                emo_path = None
 
         seed_value = None
         if isinstance(seed, (int, np.integer)) and int(seed) >= 0:
             seed_value = int(seed)
-            random.seed(seed_value)
-            np.random.seed(seed_value)
-
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        ext_root = os.path.dirname(base_dir)
-        resolved_model_dir = os.path.join(ext_root, "checkpoints")
-        resolved_config = os.path.join(resolved_model_dir, "config.yaml")
-
-        if not os.path.isfile(resolved_config):
-            raise FileNotFoundError(f"Config file not found: {resolved_config}")
-        if not os.path.isdir(resolved_model_dir):
-            raise FileNotFoundError(f"Model directory not found: {resolved_model_dir}")
-
-        resolved_device = _resolve_device("auto")
-        use_fp16_flag = _coerce_bool(use_fp16, False)
-        tts2 = _get_tts2_model(
-            config_path=resolved_config,
-            model_dir=resolved_model_dir,
-            device=resolved_device,
-            use_cuda_kernel=False,
-            use_fp16=use_fp16_flag,
-        )
-
-        torch_mod = None
-
-        def _ensure_torch():
-            nonlocal torch_mod
-            if torch_mod is None:
-                try:
-                    import torch as torch_lib  # type: ignore
-                except Exception as exc:
-                    raise RuntimeError(f"PyTorch is required for IndexTTS2 Advanced: {exc}")
-                torch_mod = torch_lib
-            return torch_mod
+        #seeded runs get a private RNG instead of reseeding the process-wide ones
+        py_rng = random.Random(seed_value) if seed_value is not None else random
+
+        resolved_config, resolved_model_dir = _validate_paths()
+
+        resolved_device = _AUTO_DEVICE
+        precision = str(precision or "fp32").strip().lower()
+        if precision not in ("fp32", "fp16", "bf16"):
+            precision = "fp32"
+        if precision == "fp32" and _coerce_bool(use_fp16, False):
+            precision = "fp16"
+        if precision == "bf16" and not _bf16_supported(resolved_device):
+            precision = "fp16"
+        use_fp16_flag = precision == "fp16"
+        use_bf16_flag = precision == "bf16"
+        tts2 = _cached_tts2(resolved_config, resolved_model_dir, str(resolved_device), use_fp16_flag, use_bf16_flag)
 
         seed_info = "random"
         if seed_value is not None:
-            torch_lib = _ensure_torch()
-            torch_lib.manual_seed(seed_value)
-            if torch_lib.cuda.is_available():
-                torch_lib.cuda.manual_seed_all(seed_value)
-            if hasattr(torch_lib, "xpu") and callable(getattr(torch_lib.xpu, "is_available", None)) and torch_lib.xpu.is_available():
-                torch_lib.xpu.manual_seed_all(seed_value)
-            if hasattr(torch_lib.backends, "mps") and torch_lib.backends.mps.is_available():
-                try:
-                    torch_lib.manual_seed(seed_value)
-                except Exception:
-                    pass
+            torch.manual_seed(seed_value)
+            if _DEV_FLAGS["cuda"]:
+                torch.cuda.manual_seed_all(seed_value)
+            if _DEV_FLAGS["xpu"]:
+                torch.xpu.manual_seed_all(seed_value)
             seed_info = str(seed_value)
 
         emo_alpha = max(0.0, min(1.0, float(emotion_control_weight)))
         emo_audio_prompt = emo_path if emo_path else prompt_path
         ui_msgs = []
-        ui_msgs.append(f"Model precision: {'FP16' if use_fp16_flag else 'FP32'}")
+        ui_msgs.append(f"Model precision: {precision.upper()}")
 
-        gain_value = _coerce_float(output_gain, 1.0, clamp=(0.0, 4.0))
+        gain_value = _coerce_float(output_gain, 1.0, clamp=(0.0, 4.0), rng=py_rng)
 
         emo_vector_arg = None
         if emotion_vector is not None:
@@ -256,26 +378,26 @@ class IndexTTS2Advanced:
         do_sample = _coerce_bool(do_sample, True)
         typical_sampling = _coerce_bool(typical_sampling, False)
 
-        interval_silence_ms = _coerce_int(interval_silence_ms, 200, clamp=(0, 12000))
-        max_text_tokens_per_segment = _coerce_int(max_text_tokens_per_segment, 120, clamp=(0, 2048))
+        interval_silence_ms = _coerce_int(interval_silence_ms, 200, clamp=(0, 12000), rng=py_rng)
+        max_text_tokens_per_segment = _coerce_int(max_text_tokens_per_segment, 120, clamp=(0, 2048), rng=py_rng)
         if max_text_tokens_per_segment <= 0:
             max_text_tokens_per_segment = 120
 
-        top_k = _coerce_int(top_k, 30, clamp=(0, 2048))
-        num_beams = max(1, _coerce_int(num_beams, 3, clamp=(1, 128)))
-        max_mel_tokens = _coerce_int(max_mel_tokens, 1500, clamp=(1, 8192))
+        top_k = _coerce_int(top_k, 30, clamp=(0, 2048), rng=py_rng)
+        num_beams = max(1, _coerce_int(num_beams, 3, clamp=(1, 128), rng=py_rng))
+        max_mel_tokens = _coerce_int(max_mel_tokens, 1500, clamp=(1, 8192), rng=py_rng)
 
-        temperature = _coerce_float(temperature, 0.8, clamp=(0.0, 5.0), random_bounds=(0.6, 1.4))
+        temperature = _coerce_float(temperature, 0.8, clamp=(0.0, 5.0), random_bounds=(0.6, 1.4), rng=py_rng)
         if temperature < 1e-4:
             temperature = 1e-4
-        top_p = _coerce_float(top_p, 0.8, clamp=(0.0, 1.0), random_bounds=(0.5, 0.95))
-        repetition_penalty = _coerce_float(repetition_penalty, 10.0, clamp=(0.0, 50.0))
-        length_penalty = _coerce_float(length_penalty, 0.0, clamp=(-10.0, 50.0))
-        typical_mass = _coerce_float(typical_mass, 0.9, clamp=(0.0, 0.99), random_bounds=(0.5, 0.95))
+        top_p = _coerce_float(top_p, 0.8, clamp=(0.0, 1.0), random_bounds=(0.5, 0.95), rng=py_rng)
+        repetition_penalty = _coerce_float(repetition_penalty, 10.0, clamp=(0.0, 50.0), rng=py_rng)
+        length_penalty = _coerce_float(length_penalty, 0.0, clamp=(-10.0, 50.0), rng=py_rng)
+        typical_mass = _coerce_float(typical_mass, 0.9, clamp=(0.0, 0.99), random_bounds=(0.5, 0.95), rng=py_rng)
         if typical_mass <= 0.0:
             typical_mass = 0.9
 
-        speech_speed = _coerce_float(speech_speed, 1.0, clamp=(0.25, 4.0), random_bounds=(0.6, 1.4))
+        speech_speed = _coerce_float(speech_speed, 1.0, clamp=(0.25, 4.0), random_bounds=(0.6, 1.4), rng=py_rng)
 
         generation_kwargs = {
             "do_sample": bool(do_sample),
@@ -290,63 +412,49 @@ class IndexTTS2Advanced:
             "typical_mass": typical_mass,
             "speech_speed": speech_speed,
         }
-        try:
-            result = tts2.infer(
-                spk_audio_prompt=prompt_path,
-                text=text,
-                output_path=None,
-                emo_audio_prompt=emo_audio_prompt,
-                emo_alpha=emo_alpha,
-                emo_vector=emo_vector_arg,
-                use_random=bool(use_random_style),
-                interval_silence=interval_silence_ms,
-                verbose=False,
-                max_text_tokens_per_segment=max_text_tokens_per_segment,
-                **generation_kwargs,
-            )
-        finally:
-            try:
-                if need_cleanup and prompt_path and os.path.exists(prompt_path):
-                    os.remove(prompt_path)
-                if emo_need_cleanup and emo_path and os.path.exists(emo_path):
-                    os.remove(emo_path)
-            except Exception:
-                pass
+        step_cache_flag = _coerce_bool(enable_step_cache, False)
+        cfm = tts2.s2mel.models['cfm']
+        if hasattr(cfm, "step_cache"):
+            cfm.step_cache = step_cache_flag
+            if step_cache_flag:
+                ui_msgs.append("Diffusion step cache: on")
+
+        tts2.py_rng = py_rng if seed_value is not None else None
+        self._restore_latents(tts2, "spk", prompt_path)
+        self._restore_latents(tts2, "emo", emo_audio_prompt)
+        result = tts2.infer(
+            spk_audio_prompt=prompt_path,
+            text=text,
+            output_path=None,
+            emo_audio_prompt=emo_audio_prompt,
+            emo_alpha=emo_alpha,
+            emo_vector=emo_vector_arg,
+            use_random=bool(use_random_style),
+            interval_silence=interval_silence_ms,
+            verbose=False,
+            max_text_tokens_per_segment=max_text_tokens_per_segment,
+            **generation_kwargs,
+        )
+        self._remember_latents(tts2, "spk")
+        self._remember_latents(tts2, "emo")
 
         if not isinstance(result, (tuple, list)) or len(result) != 2:
             raise RuntimeError("IndexTTS2 returned an unexpected result format")
 
         sr, wav = result
-        torch_lib = _ensure_torch()
         if hasattr(wav, "cpu"):
             wav = wav.cpu().numpy()
-        wav = np.asarray(wav)
-
-        if wav.dtype == np.int16:
-            wav = wav.astype(np.float32) / 32767.0
-        elif wav.dtype != np.float32:
-            wav = wav.astype(np.float32)
-
-        mono = wav
-        if mono.ndim == 2:
-            if mono.shape[0] <= 8 and mono.shape[1] > mono.shape[0]:
-                mono = mono.mean(axis=0)
-            else:
-                mono = mono.mean(axis=-1)
-        elif mono.ndim > 2:
-            mono = mono.reshape(-1, mono.shape[-1]).mean(axis=0)
-        if mono.ndim != 1:
-            mono = mono.flatten()
+        mono = _finalize_waveform(wav, gain_value)
 
         info_lines = []
         if ui_msgs:
             info_lines.extend(ui_msgs)
 
         if gain_value != 1.0:
-            mono = np.clip(mono * gain_value, -1.0, 1.0)
             info_lines.append(f"Output gain applied: {gain_value:.2f}x")
 
-        waveform = torch_lib.from_numpy(mono[None, None, :].astype(np.float32))
+        #no copy when mono is already C-contiguous float32 (always true for the mixed output)
+        waveform = torch.from_numpy(np.ascontiguousarray(mono, dtype=np.float32)).unsqueeze_(0).unsqueeze_(0)
 
         info_lines.append(f"Seed: {seed_info}")
         if do_sample:
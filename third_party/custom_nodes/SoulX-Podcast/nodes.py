@@ -1,26 +1,164 @@
 import os
 import re
+import time
+import hashlib
+import threading
+import importlib.util
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import torch
-import s3tokenizer
-import onnxruntime
-import torchaudio
-from typing import Dict, Any, List
+from typing import TYPE_CHECKING, Dict, Any, List
 
-from soulxpodcast.config import Config, SoulXPodcastLLMConfig, SamplingParams
-from soulxpodcast.models.soulxpodcast import SoulXPodcast
-from soulxpodcast.utils.text import normalize_text
-from soulxpodcast.utils.audio import mel_spectrogram, audio_volume_normalize
-from soulxpodcast.utils.commons import set_all_random_seed
-from soulxpodcast.engine.llm_engine import HFLLMEngine
-import torchaudio.compliance.kaldi as kaldi
+# ComfyUI imports every custom node at startup; onnxruntime, s3tokenizer, torchaudio and
+# soulxpodcast (transformers, vllm) are imported inside the node methods that use them.
+if TYPE_CHECKING:
+    import onnxruntime
+    import torchaudio
 
 SPK_DICT = ["<|SPEAKER_0|>", "<|SPEAKER_1|>", "<|SPEAKER_2|>", "<|SPEAKER_3|>"]
 TEXT_START, TEXT_END, AUDIO_START = "<|text_start|>", "<|text_end|>", "<|semantic_token_start|>"
 TASK_PODCAST = "<|task_podcast|>"
 
+# One "[S<n>] text" turn per line; [^\S\n] keeps the whitespace matches from crossing lines.
+_SCRIPT_RE = re.compile(r'^[^\S\n]*\[S([1-9])\][^\S\n]*(\S.*?)[^\S\n]*$', re.MULTILINE)
+
+VLLM_AVAILABLE = importlib.util.find_spec("vllm") is not None
+
+_RESAMPLER_CACHE: Dict[tuple, "torchaudio.transforms.Resample"] = {}
+
+# Speaker featurization is deterministic in the prompt waveform, so node re-executions
+# with the same prompt audio reuse the previous result. Small LRU keyed on a content hash.
+_FEAT_CACHE: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+_FEAT_CACHE_SIZE = 16
+_FEAT_CACHE_LOCK = threading.Lock()
+
+
+def _get_resampler(orig_freq: int, new_freq: int, device) -> "torchaudio.transforms.Resample":
+    # Resample designs its sinc kernel in the constructor; build it once per rate pair.
+    key = (orig_freq, new_freq, str(device))
+    resampler = _RESAMPLER_CACHE.get(key)
+    if resampler is None:
+        import torchaudio
+        resampler = torchaudio.transforms.Resample(orig_freq=orig_freq, new_freq=new_freq).to(device)
+        _RESAMPLER_CACHE[key] = resampler
+    return resampler
+
+
+def _load_spk_model(model_path: str, providers: List[str]) -> "onnxruntime.InferenceSession":
+    """Load CAM++, reusing the ORT-optimized graph cached next to the source model.
+    
+    ORT_ENABLE_ALL layout transforms can regress on small models like CAM++, so stop at
+    EXTENDED. The optimized graph is saved per provider (fused nodes are EP-specific) and
+    keyed on campplus.onnx's mtime and size, so an updated source model is re-optimized
+    instead of being shadowed by a stale graph. It is written to a temp file and renamed
+    into place; a cached graph that fails to load is deleted and rebuilt from the source.
+    """
+    import onnxruntime
+    
+    def session_options(level):
+        option = onnxruntime.SessionOptions()
+        option.execution_mode = onnxruntime.ExecutionMode.ORT_SEQUENTIAL
+        option.intra_op_num_threads = 1
+        option.graph_optimization_level = level
+        return option
+    
+    spk_model_file = os.path.join(model_path, "campplus.onnx")
+    source_stat = os.stat(spk_model_file)
+    optimized_prefix = f"campplus.opt.{providers[0].replace('ExecutionProvider', '').lower()}."
+    optimized_name = f"{optimized_prefix}{source_stat.st_mtime_ns:x}-{source_stat.st_size:x}.onnx"
+    optimized_file = os.path.join(model_path, optimized_name)
+    
+    if os.path.isfile(optimized_file) and os.stat(optimized_file).st_mtime_ns >= source_stat.st_mtime_ns:
+        try:
+            return onnxruntime.InferenceSession(
+                optimized_file,
+                sess_options=session_options(onnxruntime.GraphOptimizationLevel.ORT_DISABLE_ALL),
+                providers=providers
+            )
+        except Exception as e:
+            print(f"[WARNING]: cached optimized CAM++ model {optimized_file} failed to load, rebuilding: {e}")
+            try:
+                os.remove(optimized_file)
+            except OSError:
+                pass
+    
+    option = session_options(onnxruntime.GraphOptimizationLevel.ORT_ENABLE_EXTENDED)
+    tmp_file = None
+    if os.access(model_path, os.W_OK):
+        tmp_file = f"{optimized_file}.{os.getpid()}.tmp"
+        option.optimized_model_filepath = tmp_file
+    try:
+        spk_model = onnxruntime.InferenceSession(spk_model_file, sess_options=option, providers=providers)
+    except BaseException:
+        if tmp_file is not None and os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
+    
+    if tmp_file is not None:
+        # Caching the optimized graph is best effort
+        try:
+            os.replace(tmp_file, optimized_file)
+            # Drop graphs optimized from earlier versions of campplus.onnx
+            for name in os.listdir(model_path):
+                if name.startswith(optimized_prefix) and name.endswith(".onnx") and name != optimized_name:
+                    os.remove(os.path.join(model_path, name))
+        except OSError as e:
+            print(f"[WARNING]: could not cache the optimized CAM++ model: {e}")
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+    return spk_model
+
+
+def _run_spk_model(spk_model: "onnxruntime.InferenceSession", spk_feat: torch.Tensor) -> List[float]:
+    """Run CAM++ on an fbank feature, binding CUDA tensors in place when the session is on GPU."""
+    import numpy as np
+    
+    input_name = spk_model.get_inputs()[0].name
+    spk_feat = spk_feat.unsqueeze(dim=0).float().contiguous()
+    if spk_feat.is_cuda and "CUDAExecutionProvider" in spk_model.get_providers():
+        # ORT runs on its own stream; make sure torch has finished writing the feature.
+        torch.cuda.current_stream(spk_feat.device).synchronize()
+        binding = spk_model.io_binding()
+        binding.bind_input(
+            name=input_name,
+            device_type="cuda",
+            device_id=spk_feat.device.index or 0,
+            element_type=np.float32,
+            shape=tuple(spk_feat.shape),
+            buffer_ptr=spk_feat.data_ptr(),
+        )
+        binding.bind_output(spk_model.get_outputs()[0].name, "cuda")
+        spk_model.run_with_iobinding(binding)
+        return binding.copy_outputs_to_cpu()[0].flatten().tolist()
+    if spk_feat.is_cuda:
+        spk_feat = spk_feat.cpu()
+    # .numpy() aliases the CPU tensor's storage, so ORT reads the fbank buffer without a copy.
+    return spk_model.run(None, {input_name: spk_feat.numpy()})[0].flatten().tolist()
+
+
+def _encode_batch(tokenizer, texts: List[str]) -> List[List[int]]:
+    """Tokenize all strings in one call into the fast tokenizer backend."""
+    if not texts:
+        return []
+    return tokenizer(texts)["input_ids"]
+
+
+def _pad_batch(features: List[torch.Tensor], time_dim: int) -> torch.Tensor:
+    """Zero-pad per-speaker features along ``time_dim`` into one preallocated [n_spk, ...] tensor."""
+    shape = list(features[0].shape)
+    shape[time_dim] = max(feat.shape[time_dim] for feat in features)
+    batch = features[0].new_zeros((len(features), *shape))
+    for idx, feat in enumerate(features):
+        batch[idx].narrow(time_dim, 0, feat.shape[time_dim]).copy_(feat)
+    return batch
+
 
 class SoulXPodcastLoader:
     
+    REQUIRED_MODEL_FILES = frozenset({"soulxpodcast_config.json", "flow.pt", "hift.pt", "campplus.onnx"})
+    MODEL_LIST_CACHE_TTL = 5.0
+    _model_list_cache = None
+    
     @classmethod
     def get_tts_dir(cls):
         current_file = os.path.abspath(__file__)
@@ -32,24 +170,40 @@ class SoulXPodcastLoader:
     def get_model_list(cls):
         tts_dir = cls.get_tts_dir()
         
+        try:
+            tts_dir_mtime = os.stat(tts_dir).st_mtime
+        except OSError:
+            tts_dir_mtime = None
+        
+        # INPUT_TYPES is re-evaluated on every graph refresh; skip the rescan while
+        # the TTS dir is unchanged and the cached entry is still fresh.
+        cached = cls._model_list_cache
+        if cached is not None:
+            cached_mtime, cached_at, cached_list = cached
+            if cached_mtime == tts_dir_mtime and time.monotonic() - cached_at < cls.MODEL_LIST_CACHE_TTL:
+                return list(cached_list)
+        
         model_list = []
-        if os.path.exists(tts_dir) and os.path.isdir(tts_dir):
-            for item in os.listdir(tts_dir):
-                item_path = os.path.join(tts_dir, item)
-                if os.path.isdir(item_path):
-                    config_file = os.path.join(item_path, "soulxpodcast_config.json")
-                    flow_file = os.path.join(item_path, "flow.pt")
-                    hift_file = os.path.join(item_path, "hift.pt")
-                    onnx_file = os.path.join(item_path, "campplus.onnx")
-                    if os.path.exists(config_file) and os.path.exists(flow_file) and os.path.exists(hift_file) and os.path.exists(onnx_file):
-                        model_list.append(item)
+        if tts_dir_mtime is not None and os.path.isdir(tts_dir):
+            with os.scandir(tts_dir) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+                    try:
+                        with os.scandir(entry.path) as model_entries:
+                            file_names = {model_entry.name for model_entry in model_entries}
+                    except OSError:
+                        continue
+                    if cls.REQUIRED_MODEL_FILES <= file_names:
+                        model_list.append(entry.name)
         
         model_list.sort()
         
         if not model_list:
-            return ["No models found"]
+            model_list = ["No models found"]
         
-        return model_list
+        cls._model_list_cache = (tts_dir_mtime, time.monotonic(), model_list)
+        return list(model_list)
     
     @classmethod
     def INPUT_TYPES(cls):
@@ -60,7 +214,8 @@ class SoulXPodcastLoader:
                     "default": model_list[0] if model_list else "No models found",
                 }),
                 "llm_engine": (["hf", "vllm"], {
-                    "default": "hf"
+                    "default": "vllm" if VLLM_AVAILABLE else "hf",
+                    "tooltip": "vllm: PagedAttention + continuous batching + CUDA graphs (recommended)\nhf: transformers generate, eager mode"
                 }),
                 "fp16_flow": ("BOOLEAN", {
                     "default": False
@@ -71,14 +226,57 @@ class SoulXPodcastLoader:
                     "max": 2**32 - 1,
                     "step": 1
                 }),
+            },
+            "optional": {
+                "gpu_memory_utilization": ("FLOAT", {
+                    "default": 0.9,
+                    "min": 0.1,
+                    "max": 1.0,
+                    "step": 0.05,
+                    "tooltip": "vllm only: fraction of GPU memory reserved for weights and the paged KV cache"
+                }),
+                "max_num_batched_tokens": ("INT", {
+                    "default": 0,
+                    "min": 0,
+                    "max": 65536,
+                    "step": 256,
+                    "tooltip": "vllm only: token budget per continuous-batching step, 0 uses the vLLM default"
+                }),
+                "bf16_vocoder": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Run flow in bf16 weights and hift under bf16 autocast (CUDA with bf16 support only, overrides fp16_flow)"
+                }),
+                "cuda_graph_flow": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Capture the flow estimator in a CUDA graph per turn and replay it across ODE steps to cut kernel launch overhead"
+                }),
             }
         }
     
     RETURN_TYPES = ("SOULX_MODEL",)
     FUNCTION = "load_models"
     CATEGORY = "SoulX-Podcast"
+    DESCRIPTION = (
+        "Load SoulX-Podcast models. The vllm engine enables PagedAttention, continuous batching "
+        "and CUDA graphs for the LLM decode loop; it falls back to hf when vLLM is not installed."
+    )
     
-    def load_models(self, model_name: str, llm_engine: str = "hf", fp16_flow: bool = False, seed: int = 1988):
+    def load_models(
+        self,
+        model_name: str,
+        llm_engine: str = "vllm",
+        fp16_flow: bool = False,
+        seed: int = 1988,
+        gpu_memory_utilization: float = 0.9,
+        max_num_batched_tokens: int = 0,
+        bf16_vocoder: bool = False,
+        cuda_graph_flow: bool = False,
+    ):
+        import onnxruntime
+        from soulxpodcast.config import Config, SoulXPodcastLLMConfig
+        from soulxpodcast.models.soulxpodcast import SoulXPodcast
+        from soulxpodcast.utils.commons import set_all_random_seed
+        
         set_all_random_seed(seed)
         
         tts_dir = SoulXPodcastLoader.get_tts_dir()
@@ -88,43 +286,56 @@ class SoulXPodcastLoader:
             raise ValueError(f"Model path does not exist: {model_path}")
         
         hf_config = SoulXPodcastLLMConfig.from_initial_and_json(
-            initial_values={"fp16_flow": fp16_flow},
+            initial_values={
+                "fp16_flow": fp16_flow,
+                "bf16_vocoder": bf16_vocoder and torch.cuda.is_available() and torch.cuda.is_bf16_supported(),
+                "cuda_graph_flow": cuda_graph_flow,
+            },
             json_file=f"{model_path}/soulxpodcast_config.json"
         )
         
-        if llm_engine == "vllm":
-            import importlib.util
-            if not importlib.util.find_spec("vllm"):
-                llm_engine = "hf"
-                print(f"[WARNING]: VLLM 未安装，切换到 hf engine。")
+        if llm_engine == "vllm" and not VLLM_AVAILABLE:
+            llm_engine = "hf"
+            print(f"[WARNING]: VLLM 未安装，切换到 hf engine。")
         
+        # CUDA graphs are only captured by the vllm engine; the hf path stays eager.
         config = Config(
             model=model_path,
-            enforce_eager=True,
+            enforce_eager=llm_engine != "vllm",
+            enable_prefix_caching=llm_engine == "vllm",
+            gpu_memory_utilization=gpu_memory_utilization,
+            max_num_batched_tokens=max_num_batched_tokens or None,
             llm_engine=llm_engine,
             hf_config=hf_config
         )
         
         model = SoulXPodcast(config)
         
-        option = onnxruntime.SessionOptions()
-        option.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
-        option.intra_op_num_threads = 1
-        spk_model = onnxruntime.InferenceSession(
-            f"{model_path}/campplus.onnx",
-            sess_options=option,
-            providers=["CPUExecutionProvider"]
-        )
+        providers = ["CPUExecutionProvider"]
+        if torch.cuda.is_available() and "CUDAExecutionProvider" in onnxruntime.get_available_providers():
+            providers.insert(0, "CUDAExecutionProvider")
+        
+        spk_model = _load_spk_model(model_path, providers)
         
+        # Special-token fragments of the prompt template, tokenized once per model load.
+        # They are added tokens, so splicing them around separately tokenized text gives
+        # the same ids as tokenizing the fully formatted string.
+        tokenizer = model.llm.tokenizer
         soulx_model = {
+            "task_podcast_ids": tokenizer.encode(TASK_PODCAST),
+            "spk_prefix_ids": [tokenizer.encode(spk) for spk in SPK_DICT],
+            "text_markers": (tokenizer.encode(TEXT_START), tokenizer.encode(TEXT_END), tokenizer.encode(AUDIO_START)),
             "model": model,
             "config": config,
             "spk_model": spk_model,
+            # Stable identity of the speaker model for _FEAT_CACHE keys; id() is reused
+            # once an unloaded model is garbage-collected
+            "spk_model_key": f"{os.path.abspath(model_path)}/campplus.onnx|{','.join(providers)}",
             "audio_tokenizer": model.audio_tokenizer,
             "llm": model.llm,
             "flow": model.flow,
             "hift": model.hift,
-            "tokenizer": model.llm.tokenizer,
+            "tokenizer": tokenizer,
         }
         
         return (soulx_model,)
@@ -174,6 +385,7 @@ class SoulXPodcastInputParser:
                 break
         return text
     
+    @torch.inference_mode()
     def parse_input(
         self,
         soulx_model: Dict[str, Any],
@@ -183,6 +395,8 @@ class SoulXPodcastInputParser:
         dialogue_script: str = "",
         json_config: str = "{}",
     ):
+        from soulxpodcast.utils.text import normalize_text
+        
         DEFAULT_PROMPTS = {
             "S1": "喜欢攀岩、徒步、滑雪的语言爱好者，以及过两天要带着全部家当去景德镇做陶瓷的白日梦想家。",
             "S2": "呃，还有一个就是要跟大家纠正一点，就是我们在看电影的时候，尤其是游戏玩家，看电影的时候，在看到那个到西北那边的这个陕北民谣，嗯，这个可能在想，哎，是不是他是受到了黑神话的启发？"
@@ -191,6 +405,8 @@ class SoulXPodcastInputParser:
         config = soulx_model["config"]
         tokenizer = soulx_model["tokenizer"]
         spk_model = soulx_model["spk_model"]
+        spk_model_key = soulx_model["spk_model_key"]
+        spk_device = "cuda" if "CUDAExecutionProvider" in spk_model.get_providers() else "cpu"
         
         if input_mode == "json":
             json_speakers_data, dialogue_script_from_json = self._parse_json_config(json_config)
@@ -319,134 +535,70 @@ class SoulXPodcastInputParser:
         
         use_dialect_prompt = any(len(p) > 0 for p in dialect_prompt_text_list)
         
-        prompt_text_ids_list = []
-        dialect_prompt_text_ids_list = []
-        spk_emb_list = []
-        mel_list = []
-        mel_len_list = []
-        log_mel_list = []
-        dialect_prefix_list = []
-        
-        dialect_prefix_list.append(tokenizer.encode(f"{TASK_PODCAST}"))
-        
-        for spk_idx, (prompt_text, prompt_audio) in enumerate(zip(prompt_text_list, prompt_wav_list)):
-            if isinstance(prompt_audio, dict):
-                audio_tensor = prompt_audio.get("waveform")
-                sample_rate = prompt_audio.get("sample_rate")
-                if audio_tensor is None or sample_rate is None:
-                    raise ValueError(f"Invalid audio dictionary format, missing 'waveform' or 'sample_rate': {prompt_audio.keys()}")
-            elif isinstance(prompt_audio, str):
-                audio_tensor, sample_rate = torchaudio.load(prompt_audio)
-            elif isinstance(prompt_audio, tuple) or isinstance(prompt_audio, list):
-                if len(prompt_audio) >= 2:
-                    audio_tensor, sample_rate = prompt_audio[0], prompt_audio[1]
-                else:
-                    raise ValueError(f"Invalid audio format, expected (tensor, sample_rate), but got: {type(prompt_audio)}")
-            else:
-                raise ValueError(f"Unsupported audio format: {type(prompt_audio)}")
-            
-            if not isinstance(audio_tensor, torch.Tensor):
-                raise ValueError(f"Invalid audio tensor type, expected torch.Tensor, but got: {type(audio_tensor)}")
-            
-            if not isinstance(sample_rate, (int, float)):
-                raise ValueError(f"Invalid sample rate type, expected int/float, but got: {type(sample_rate)}")
-            sample_rate = int(sample_rate)
-            
-            # Normalize audio tensor to 1D: [samples]
-            # Handle various input shapes: [channels, samples], [1, samples], [samples], [1, channels, samples], etc.
-            original_shape = audio_tensor.shape
-            while audio_tensor.dim() > 1:
-                if audio_tensor.dim() == 2:
-                    # For shape [channels, samples] or [1, samples]
-                    if audio_tensor.shape[0] == 1:
-                        # Mono audio with batch dimension: [1, samples] -> [samples]
-                        audio_tensor = audio_tensor.squeeze(0)
-                    else:
-                        # Multi-channel audio: [channels, samples] -> take first channel [samples]
-                        audio_tensor = audio_tensor[0]
-                else:
-                    # For 3D+ tensors, squeeze or take first element
-                    audio_tensor = audio_tensor.squeeze()
-                    # If still not 1D after squeeze, take first element along first dimension
-                    if audio_tensor.dim() > 1:
-                        audio_tensor = audio_tensor[0]
-            
-            if audio_tensor.dim() != 1:
-                raise ValueError(f"Invalid audio tensor dimensions after processing: {audio_tensor.shape} (original: {original_shape})")
-            
-            if sample_rate != 16000:
-                resampler = torchaudio.transforms.Resample(orig_freq=sample_rate, new_freq=16000)
-                audio_for_tokenizer = resampler(audio_tensor.unsqueeze(0)).squeeze(0)
-            else:
-                audio_for_tokenizer = audio_tensor
-            
-            audio_for_tokenizer = audio_volume_normalize(audio_for_tokenizer)
-            log_mel = s3tokenizer.log_mel_spectrogram(audio_for_tokenizer)
-            
-            spk_feat = kaldi.fbank(audio_for_tokenizer.unsqueeze(0), num_mel_bins=80, dither=0, sample_frequency=16000)
-            spk_feat = spk_feat - spk_feat.mean(dim=0, keepdim=True)
-            spk_emb = spk_model.run(
-                None, {spk_model.get_inputs()[0].name: spk_feat.unsqueeze(dim=0).cpu().numpy()}
-            )[0].flatten().tolist()
-            
-            if sample_rate != 24000:
-                resampler = torchaudio.transforms.Resample(orig_freq=sample_rate, new_freq=24000)
-                audio_for_flow = resampler(audio_tensor.unsqueeze(0))
-            else:
-                audio_for_flow = audio_tensor.unsqueeze(0)
-            
-            audio_for_flow = audio_volume_normalize(audio_for_flow.squeeze(0)).unsqueeze(0)
-            mel = mel_spectrogram(audio_for_flow).transpose(1, 2).squeeze(0)
-            if mel.shape[0] % 2 != 0:
-                mel = mel[:-1]
-            mel_len = mel.shape[0]
-            
-            prompt_text = normalize_text(prompt_text)
-            formatted_prompt = f"{SPK_DICT[spk_idx]}{TEXT_START}{prompt_text}{TEXT_END}{AUDIO_START}"
-            if spk_idx == 0:
-                formatted_prompt = f"{TASK_PODCAST}{formatted_prompt}"
-            prompt_text_ids = tokenizer.encode(formatted_prompt)
-            prompt_text_ids_list.append(prompt_text_ids)
-            
-            if use_dialect_prompt and len(dialect_prompt_text_list[spk_idx]) > 0:
-                dialect_prompt_text = normalize_text(dialect_prompt_text_list[spk_idx])
-                dialect_prompt_text = f"{SPK_DICT[spk_idx]}{TEXT_START}{dialect_prompt_text}{TEXT_END}{AUDIO_START}"
-                dialect_prompt_text_ids = tokenizer.encode(dialect_prompt_text)
-                dialect_prompt_text_ids_list.append(dialect_prompt_text_ids)
-                if spk_idx == 0:
-                    dialect_prefix_list.append(tokenizer.encode(f"{TASK_PODCAST}"))
-                else:
-                    dialect_prefix_list.append([])
-            else:
-                dialect_prompt_text_ids_list.append([])
-                if spk_idx == 0:
-                    dialect_prefix_list.append(tokenizer.encode(f"{TASK_PODCAST}"))
-                else:
-                    dialect_prefix_list.append([])
-            
-            log_mel_list.append(log_mel)
-            spk_emb_list.append(spk_emb)
-            mel_list.append(mel)
-            mel_len_list.append(mel_len)
+        # Every turn prompt starts with the speaker preamble built below. Keep the
+        # speaker order (S1, S2) and the dialect_prefix / prompt_text_ids concatenation
+        # order fixed so the token prefix is identical across turns and vLLM's prefix
+        # cache block hashes match.
+        task_podcast_ids = soulx_model["task_podcast_ids"]
+        dialect_prefix_list = [task_podcast_ids]
+        
+        # Featurization is independent per speaker and spends its time in torch / ONNX
+        # Runtime kernels that release the GIL, so the speakers are processed concurrently.
+        # Tokenization stays on this thread.
+        with ThreadPoolExecutor(max_workers=len(prompt_wav_list)) as executor:
+            speaker_feats = list(executor.map(
+                lambda prompt_audio: self._featurize_speaker(prompt_audio, spk_model, spk_model_key, spk_device),
+                prompt_wav_list,
+            ))
+        
+        prompt_texts = [normalize_text(prompt_text) for prompt_text in prompt_text_list]
+        prompt_text_ids_list = [
+            self._format_text_ids(soulx_model, spk_idx, text_ids, with_task=spk_idx == 0)
+            for spk_idx, text_ids in enumerate(_encode_batch(tokenizer, prompt_texts))
+        ]
+        
+        dialect_spk_idxs = [
+            spk_idx for spk_idx, dialect_prompt in enumerate(dialect_prompt_text_list)
+            if use_dialect_prompt and len(dialect_prompt) > 0
+        ]
+        dialect_texts = [normalize_text(dialect_prompt_text_list[spk_idx]) for spk_idx in dialect_spk_idxs]
+        dialect_prompt_text_ids_list = [[] for _ in dialect_prompt_text_list]
+        for spk_idx, text_ids in zip(dialect_spk_idxs, _encode_batch(tokenizer, dialect_texts)):
+            dialect_prompt_text_ids_list[spk_idx] = self._format_text_ids(soulx_model, spk_idx, text_ids)
+        dialect_prefix_list.extend(task_podcast_ids if spk_idx == 0 else [] for spk_idx in range(len(prompt_text_list)))
+        
+        log_mel_list = [speaker_feat["log_mel"] for speaker_feat in speaker_feats]
+        spk_emb_list = [speaker_feat["spk_emb"] for speaker_feat in speaker_feats]
+        mel_list = [speaker_feat["mel"] for speaker_feat in speaker_feats]
+        mel_len_list = [speaker_feat["mel_len"] for speaker_feat in speaker_feats]
         
-        text_ids_list = []
         spk_ids_for_model = []
-        for text, spk_id in zip(text_list, spk_list):
-            text = normalize_text(text)
-            
+        for spk_id in spk_list:
             if spk_id < 0 or spk_id >= 2:
                 raise ValueError(f"Unsupported speaker index used in dialogue script: {spk_id} (only 0 and 1 are supported, corresponding to S1 and S2)")
-            
-            formatted_text = f"{SPK_DICT[spk_id]}{TEXT_START}{text}{TEXT_END}{AUDIO_START}"
-            text_ids = tokenizer.encode(formatted_text)
-            text_ids_list.append(text_ids)
             spk_ids_for_model.append(spk_id)
-        
-        prompt_mels_for_llm, prompt_mels_lens_for_llm = s3tokenizer.padding(log_mel_list)
+        turn_texts = [normalize_text(text) for text in text_list]
+        text_ids_list = [
+            self._format_text_ids(soulx_model, spk_id, text_ids)
+            for spk_id, text_ids in zip(spk_ids_for_model, _encode_batch(tokenizer, turn_texts))
+        ]
+        
+        # Write each speaker's features straight into [n_spk, ...] padded batches (log-mel is
+        # [n_mels, T], flow mel is [T, n_mels]) rather than transposing through pad_sequence.
+        prompt_mels_for_llm = _pad_batch(log_mel_list, time_dim=1)
+        prompt_mels_lens_for_llm = torch.tensor([log_mel.shape[1] for log_mel in log_mel_list], dtype=torch.int32)
         spk_emb_for_flow = torch.tensor(spk_emb_list)
-        prompt_mels_for_flow = torch.nn.utils.rnn.pad_sequence(mel_list, batch_first=True, padding_value=0)
+        prompt_mels_for_flow = _pad_batch(mel_list, time_dim=0)
         prompt_mels_lens_for_flow = torch.tensor(mel_len_list)
         
+        if torch.cuda.is_available():
+            # Page-lock whatever is still on the host so the copies in generate can be
+            # issued non_blocking and overlap with the first kernels of forward_longform.
+            prompt_mels_for_llm, prompt_mels_lens_for_llm, spk_emb_for_flow, prompt_mels_for_flow, prompt_mels_lens_for_flow = (
+                tensor.pin_memory() if tensor.device.type == "cpu" else tensor
+                for tensor in (prompt_mels_for_llm, prompt_mels_lens_for_llm, spk_emb_for_flow, prompt_mels_for_flow, prompt_mels_lens_for_flow)
+            )
+        
         podcast_input = {
             "prompt_mels_for_llm": prompt_mels_for_llm,
             "prompt_mels_lens_for_llm": prompt_mels_lens_for_llm,
@@ -467,42 +619,125 @@ class SoulXPodcastInputParser:
         
         return (podcast_input,)
     
+    @staticmethod
+    def _format_text_ids(soulx_model: Dict[str, Any], spk_idx: int, text_ids: List[int], with_task: bool = False) -> List[int]:
+        """Token ids of ``[TASK_PODCAST]SPK_DICT[spk_idx]{TEXT_START}text{TEXT_END}{AUDIO_START}``."""
+        text_start_ids, text_end_ids, audio_start_ids = soulx_model["text_markers"]
+        ids = soulx_model["spk_prefix_ids"][spk_idx] + text_start_ids + text_ids + text_end_ids + audio_start_ids
+        if with_task:
+            ids = soulx_model["task_podcast_ids"] + ids
+        return ids
+    
+    @staticmethod
+    @torch.inference_mode()  # grad mode is thread-local; executor workers don't inherit it
+    def _featurize_speaker(prompt_audio, spk_model, spk_model_key: str, spk_device: str) -> Dict[str, Any]:
+        import s3tokenizer
+        import torchaudio
+        import torchaudio.compliance.kaldi as kaldi
+        from soulxpodcast.utils.audio import mel_spectrogram, audio_volume_normalize
+        
+        if isinstance(prompt_audio, dict):
+            audio_tensor = prompt_audio.get("waveform")
+            sample_rate = prompt_audio.get("sample_rate")
+            if audio_tensor is None or sample_rate is None:
+                raise ValueError(f"Invalid audio dictionary format, missing 'waveform' or 'sample_rate': {prompt_audio.keys()}")
+        elif isinstance(prompt_audio, str):
+            audio_tensor, sample_rate = torchaudio.load(prompt_audio)
+        elif isinstance(prompt_audio, tuple) or isinstance(prompt_audio, list):
+            if len(prompt_audio) >= 2:
+                audio_tensor, sample_rate = prompt_audio[0], prompt_audio[1]
+            else:
+                raise ValueError(f"Invalid audio format, expected (tensor, sample_rate), but got: {type(prompt_audio)}")
+        else:
+            raise ValueError(f"Unsupported audio format: {type(prompt_audio)}")
+        
+        if not isinstance(audio_tensor, torch.Tensor):
+            raise ValueError(f"Invalid audio tensor type, expected torch.Tensor, but got: {type(audio_tensor)}")
+        
+        if not isinstance(sample_rate, (int, float)):
+            raise ValueError(f"Invalid sample rate type, expected int/float, but got: {type(sample_rate)}")
+        sample_rate = int(sample_rate)
+        
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(f"{spk_model_key}|{spk_device}|{sample_rate}|{tuple(audio_tensor.shape)}|{audio_tensor.dtype}".encode())
+        hasher.update(audio_tensor.detach().cpu().contiguous().view(-1).view(torch.uint8).numpy())
+        cache_key = hasher.digest()
+        with _FEAT_CACHE_LOCK:
+            cached = _FEAT_CACHE.get(cache_key)
+            if cached is not None:
+                _FEAT_CACHE.move_to_end(cache_key)
+                return dict(cached)
+        
+        # Normalize audio tensor to 1D: [samples]
+        # Handle various input shapes ([channels, samples], [1, samples], [1, channels, samples], ...)
+        # by averaging every leading batch/channel dim in one reduction.
+        original_shape = audio_tensor.shape
+        if audio_tensor.dim() > 1:
+            audio_tensor = audio_tensor.mean(dim=tuple(range(audio_tensor.dim() - 1)))
+        
+        if audio_tensor.dim() != 1:
+            raise ValueError(f"Invalid audio tensor dimensions after processing: {audio_tensor.shape} (original: {original_shape})")
+        
+        # Volume normalization is a per-clip gain, so apply it once at the source rate
+        # and resample the normalized signal for both the tokenizer and the flow.
+        audio_tensor = audio_volume_normalize(audio_tensor)
+        
+        # Resampling, log-mel, fbank and the flow mel all reduce to torch.stft / conv
+        # kernels, so run them on the GPU when one is available.
+        if torch.cuda.is_available():
+            audio_tensor = audio_tensor.to("cuda", non_blocking=True)
+        
+        # Resample the source once to the flow rate (24k) and derive the tokenizer rate
+        # from that with the cheap 3:2 24k -> 16k conversion.
+        if sample_rate != 24000:
+            resampler = _get_resampler(sample_rate, 24000, audio_tensor.device)
+            audio_for_flow = resampler(audio_tensor.unsqueeze(0))
+        else:
+            audio_for_flow = audio_tensor.unsqueeze(0)
+        
+        if sample_rate != 16000:
+            resampler = _get_resampler(24000, 16000, audio_tensor.device)
+            audio_for_tokenizer = resampler(audio_for_flow).squeeze(0)
+        else:
+            audio_for_tokenizer = audio_tensor
+        
+        log_mel = s3tokenizer.log_mel_spectrogram(audio_for_tokenizer)
+        
+        spk_feat = kaldi.fbank(audio_for_tokenizer.unsqueeze(0).to(spk_device), num_mel_bins=80, dither=0, sample_frequency=16000)
+        spk_feat.sub_(spk_feat.mean(dim=0, keepdim=True))
+        spk_emb = _run_spk_model(spk_model, spk_feat)
+        
+        mel = mel_spectrogram(audio_for_flow).transpose(1, 2).squeeze(0)
+        if mel.shape[0] % 2 != 0:
+            mel = mel[:-1]
+        mel_len = mel.shape[0]
+        
+        speaker_feat = {
+            "log_mel": log_mel,
+            "spk_emb": spk_emb,
+            "mel": mel,
+            "mel_len": mel_len,
+        }
+        with _FEAT_CACHE_LOCK:
+            _FEAT_CACHE[cache_key] = speaker_feat
+            while len(_FEAT_CACHE) > _FEAT_CACHE_SIZE:
+                _FEAT_CACHE.popitem(last=False)
+        return dict(speaker_feat)
+    
     def _parse_dialogue_script(self, dialogue_script: str) -> tuple[List[str], List[int]]:
         text_list = []
         spk_list = []
         
-        lines = dialogue_script.strip().split('\n')
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
+        for match in _SCRIPT_RE.finditer(dialogue_script):
+            spk_num = int(match.group(1))
+            text = match.group(2)
+            spk_id = spk_num - 1
             
-            pattern = r'(\[S([1-9])\])(.+)'
-            match = re.match(pattern, line)
-            if match:
-                spk_label = match.group(1)
-                spk_num = int(match.group(2))
-                text = match.group(3).strip()
-                
-                spk_id = spk_num - 1
-                
-                if spk_id < 0 or spk_id >= 2:
-                    raise ValueError(f"Unsupported speaker identifier: {spk_label}, currently only supports two-person dialogue (S1 and S2)")
-                
-                text_list.append(text)
-                spk_list.append(spk_id)
-            else:
-                loose_pattern = r'\[S([1-9])\]\s*(.+)'
-                loose_match = re.match(loose_pattern, line)
-                if loose_match:
-                    spk_num = int(loose_match.group(1))
-                    text = loose_match.group(2).strip()
-                    spk_id = spk_num - 1
-                    if 0 <= spk_id < 2:
-                        text_list.append(text)
-                        spk_list.append(spk_id)
-                    else:
-                        raise ValueError(f"Unsupported speaker identifier: S{spk_num}, currently only supports two-person dialogue (S1 and S2)")
+            if spk_id < 0 or spk_id >= 2:
+                raise ValueError(f"Unsupported speaker identifier: [S{spk_num}], currently only supports two-person dialogue (S1 and S2)")
+            
+            text_list.append(text)
+            spk_list.append(spk_id)
         
         if not text_list:
             raise ValueError("Dialogue script format error, failed to parse any dialogue content. Format should be: [S1] text content")
@@ -592,6 +827,10 @@ class SoulXPodcastGenerate:
                     "max": 5000,
                     "step": 100
                 }),
+                "parallel_turns": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "vllm only: generate all dialogue turns in a single batched call. Each turn is conditioned on the speaker prompts only, not on earlier turns"
+                }),
             }
         }
     
@@ -599,6 +838,7 @@ class SoulXPodcastGenerate:
     FUNCTION = "generate"
     CATEGORY = "SoulX-Podcast"
     
+    @torch.inference_mode()
     def generate(
         self,
         soulx_model: Dict[str, Any],
@@ -610,7 +850,11 @@ class SoulXPodcastGenerate:
         top_p: float = 0.9,
         min_tokens: int = 8,
         max_tokens: int = 3000,
+        parallel_turns: bool = False,
     ):
+        from soulxpodcast.config import SamplingParams
+        from soulxpodcast.utils.commons import set_all_random_seed
+        
         set_all_random_seed(seed)
         
         model = soulx_model["model"]
@@ -637,6 +881,7 @@ class SoulXPodcastGenerate:
             "sampling_params": sampling_params,
             "spk_ids": podcast_input["spk_ids"],
             "use_dialect_prompt": podcast_input["use_dialect_prompt"],
+            "parallel_turns": parallel_turns,
         }
         
         if podcast_input["use_dialect_prompt"]:
@@ -645,32 +890,25 @@ class SoulXPodcastGenerate:
                 "dialect_prefix": podcast_input["dialect_prefix"],
             })
         
-        results_dict = model.forward_longform(**forward_params)
+        if torch.cuda.is_available():
+            for key, value in forward_params.items():
+                if isinstance(value, torch.Tensor):
+                    forward_params[key] = value.to("cuda", non_blocking=True)
         
-        target_audio = None
-        for wav in results_dict["generated_wavs"]:
-            if target_audio is None:
-                target_audio = wav
-            else:
-                if target_audio.dim() == 3:
-                    if wav.dim() == 3:
-                        target_audio = torch.cat([target_audio, wav], dim=2)
-                    else:
-                        wav = wav.unsqueeze(0)
-                        target_audio = torch.cat([target_audio, wav], dim=2)
-                elif target_audio.dim() == 2:
-                    if wav.dim() == 2:
-                        target_audio = torch.cat([target_audio, wav], dim=1)
-                    else:
-                        wav = wav.squeeze(0) if wav.shape[0] == 1 else wav[0]
-                        target_audio = torch.cat([target_audio, wav], dim=1)
+        results_dict = model.forward_longform(**forward_params)
         
-        if target_audio.dim() == 2:
-            audio_tensor = target_audio.unsqueeze(0)
-        elif target_audio.dim() == 3:
-            audio_tensor = target_audio
-        else:
-            audio_tensor = target_audio.unsqueeze(0) if target_audio.dim() == 1 else target_audio
+        # hift emits one mono clip per turn; write them into a single buffer instead of
+        # re-concatenating the growing result on every turn.
+        generated_wavs = results_dict["generated_wavs"]
+        total_len = sum(wav.shape[-1] for wav in generated_wavs)
+        audio_tensor = torch.empty(
+            (1, 1, total_len), dtype=generated_wavs[0].dtype, device=generated_wavs[0].device
+        )
+        offset = 0
+        for wav in generated_wavs:
+            wav_len = wav.shape[-1]
+            audio_tensor[..., offset:offset + wav_len] = wav.reshape(1, 1, -1)
+            offset += wav_len
         
         sample_rate = 24000
         
@@ -39,6 +39,8 @@ class SoulXPodcastLLMConfig:
     lm_head_bias: bool = False
     qkv_bias: bool = False
     fp16_flow: bool = False
+    bf16_vocoder: bool = False  # takes precedence over fp16_flow
+    cuda_graph_flow: bool = False
     speech_token_offset: int = 152927
 
     @classmethod
@@ -123,8 +125,10 @@ class Config:
     model: str
     max_model_len: int = 8192  # 15s prompt + 30s generated audio for 25hz audio tokenizer
     gpu_memory_utilization: float = 0.9
+    max_num_batched_tokens: int | None = None  # None lets vllm pick its default
     tensor_parallel_size: int = 1
     enforce_eager: bool = False
+    enable_prefix_caching: bool = False  # vllm only: reuse KV blocks of the shared speaker preamble
     hf_config: SoulXPodcastLLMConfig | AutoConfig = field(default_factory=SoulXPodcastLLMConfig)
     eos: int = -1
     llm_engine: str = "hf" # support hf, nano-vllm
@@ -89,7 +89,15 @@ class VLLMEngine:
         self.device = "cuda:0" if torch.cuda.is_available() else "cpu"
         os.environ["VLLM_USE_V1"] = "0"
         if SUPPORT_VLLM:
-            self.model = LLM(model=model, enforce_eager=True, dtype="bfloat16", max_model_len=8192)
+            self.model = LLM(
+                model=model,
+                enforce_eager=config.enforce_eager,
+                dtype="bfloat16",
+                max_model_len=config.max_model_len,
+                gpu_memory_utilization=config.gpu_memory_utilization,
+                max_num_batched_tokens=config.max_num_batched_tokens,
+                enable_prefix_caching=config.enable_prefix_caching,
+            )
         else:
             raise ImportError("Not Support VLLM now!!!")
         self.config = config
@@ -112,4 +120,26 @@ class VLLMEngine:
             "text": self.tokenizer.decode(generated_ids),
             "token_ids": list(generated_ids),
         }
-        return output
\ No newline at end of file
+        return output
+
+    def generate_batch(
+        self,
+        prompts: list[list[int]],
+        sampling_param: SamplingParams,
+    ) -> list[dict]:
+        """Submit all prompts in one call so vLLM can continuously batch their decodes."""
+        sampling_param.stop_token_ids = [self.config.hf_config.eos_token_id]
+        with torch.no_grad():
+            request_outputs = self.model.generate(
+                [TokensPrompt(prompt_token_ids=prompt) for prompt in prompts],
+                VllmSamplingParams(**asdict(sampling_param)),
+                use_tqdm=False,
+            )
+        outputs = []
+        for request_output in request_outputs:
+            generated_ids = request_output.outputs[0].token_ids
+            outputs.append({
+                "text": self.tokenizer.decode(generated_ids),
+                "token_ids": list(generated_ids),
+            })
+        return outputs
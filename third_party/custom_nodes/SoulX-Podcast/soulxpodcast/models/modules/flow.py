@@ -36,6 +36,8 @@ class CausalConditionalCFM(torch.nn.Module):
         in_channels = in_channels + (spk_emb_dim if n_spks > 0 else 0)
         # Just change the architecture of the estimator here
         self.estimator = CausalConditionalDecoder() if estimator is None else estimator
+        # Capture the estimator in a CUDA graph once per solve and replay it for the remaining steps
+        self.use_cuda_graph = False
 
     @torch.inference_mode()
     def forward(self, mu, mask, n_timesteps, temperature=1.0, spks=None, cond=None, streaming=False):
@@ -94,6 +96,7 @@ class CausalConditionalCFM(torch.nn.Module):
         spks_in = torch.zeros([batch_size * 2, spks.size(1)], device=x.device, dtype=x.dtype)
         cond_in = torch.zeros([batch_size * 2, cond.size(1), cond.size(2)], device=x.device, dtype=x.dtype)
 
+        graph, graph_out = None, None
         for step in range(1, len(t_span)):
             # Classifier-Free Guidance inference introduced in VoiceBox
             # Copy conditional and unconditional input
@@ -107,13 +110,22 @@ class CausalConditionalCFM(torch.nn.Module):
             spks_in[:batch_size] = spks
             cond_in[:batch_size] = cond
 
-            dphi_dt = self.estimator(
-                x_in, mask_in,
-                mu_in, t_in,
-                spks_in,
-                cond_in,
-                streaming
-            )
+            if graph is not None:
+                graph.replay()
+                dphi_dt = graph_out
+            elif self.use_cuda_graph and x.is_cuda:
+                # The *_in buffers are static across steps, so one capture serves the whole solve.
+                dphi_dt, graph, graph_out = self._capture_estimator(
+                    x_in, mask_in, mu_in, t_in, spks_in, cond_in, streaming
+                )
+            else:
+                dphi_dt = self.estimator(
+                    x_in, mask_in,
+                    mu_in, t_in,
+                    spks_in,
+                    cond_in,
+                    streaming
+                )
             dphi_dt, cfg_dphi_dt = torch.split(dphi_dt, [batch_size, batch_size], dim=0)
             dphi_dt = ((1.0 + self.inference_cfg_rate) * dphi_dt - self.inference_cfg_rate * cfg_dphi_dt)
             x = x + dt * dphi_dt
@@ -124,6 +136,30 @@ class CausalConditionalCFM(torch.nn.Module):
 
         return sol[-1].float()
 
+    def _capture_estimator(self, x_in, mask_in, mu_in, t_in, spks_in, cond_in, streaming):
+        """Warm up the estimator on a side stream, then capture it into a CUDA graph.
+
+        Returns the warmup output (the result for the current step), the graph and
+        its static output tensor, which is overwritten on every replay.
+
+        The caller's autocast state is kept, but with the cast cache disabled so
+        the weight casts are recorded into the graph instead of cached tensors.
+        """
+        def autocast():
+            return torch.autocast("cuda", dtype=torch.get_autocast_gpu_dtype(),
+                                  enabled=torch.is_autocast_enabled(), cache_enabled=False)
+
+        side_stream = torch.cuda.Stream()
+        side_stream.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(side_stream), autocast():
+            warmup_out = self.estimator(x_in, mask_in, mu_in, t_in, spks_in, cond_in, streaming)
+        torch.cuda.current_stream().wait_stream(side_stream)
+
+        graph = torch.cuda.CUDAGraph()
+        with torch.cuda.graph(graph), autocast():
+            graph_out = self.estimator(x_in, mask_in, mu_in, t_in, spks_in, cond_in, streaming)
+        return warmup_out, graph, graph_out
+
 
 class CausalMaskedDiffWithXvec(torch.nn.Module):
     def __init__(
@@ -112,9 +112,9 @@ def add_optional_chunk_mask(xs: torch.Tensor,
     else:
         chunk_masks = masks
     assert chunk_masks.dtype == torch.bool
-    if (chunk_masks.sum(dim=-1) == 0).sum().item() != 0:
-        print('get chunk_masks all false at some timestep, force set to true, make sure they are masked in futuer computation!')
-        chunk_masks[chunk_masks.sum(dim=-1) == 0] = True
+    # Rows that are all false are forced to true, make sure they are masked in future computation!
+    # Done without .item() or boolean indexing so the estimator stays capturable in a CUDA graph
+    chunk_masks = chunk_masks | (chunk_masks.sum(dim=-1, keepdim=True) == 0)
     return chunk_masks
 
 
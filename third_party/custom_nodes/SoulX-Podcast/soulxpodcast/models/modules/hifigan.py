@@ -185,15 +185,17 @@ class HiFTGenerator(nn.Module):
             source_resblock.remove_weight_norm()
 
     def _stft(self, x):
+        # stft/istft have no reduced-precision kernels; keep them in fp32 under autocast
         spec = torch.stft(
-            x,
+            x.float(),
             self.istft_params["n_fft"], self.istft_params["hop_len"], self.istft_params["n_fft"], window=self.stft_window.to(x.device),
             return_complex=True)
         spec = torch.view_as_real(spec)  # [B, F, TT, 2]
         return spec[..., 0], spec[..., 1]
 
     def _istft(self, magnitude, phase):
-        magnitude = torch.clip(magnitude, max=1e2)
+        magnitude = torch.clip(magnitude.float(), max=1e2)
+        phase = phase.float()
         real = magnitude * torch.cos(phase)
         img = magnitude * torch.sin(phase)
         inverse_transform = torch.istft(torch.complex(real, img), self.istft_params["n_fft"], self.istft_params["hop_len"],
@@ -33,12 +33,21 @@ class SoulXPodcast(torch.nn.Module):
         self.use_tqdm = True
 
         self.flow = CausalMaskedDiffWithXvec()
-        if self.config.hf_config.fp16_flow:
+        if self.config.hf_config.bf16_vocoder:
+            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S,%f')[:-3]
+            tqdm.write(f"[{timestamp}] - [INFO] - Casting flow to bf16, running hift under bf16 autocast")
+            self.flow.to(torch.bfloat16)
+            self.flow_dtype = torch.bfloat16
+        elif self.config.hf_config.fp16_flow:
             timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S,%f')[:-3]
             tqdm.write(f"[{timestamp}] - [INFO] - Casting flow to fp16")
             self.flow.half()
+            self.flow_dtype = torch.float16
+        else:
+            self.flow_dtype = torch.float32
         self.flow.load_state_dict(torch.load(f"{self.config.model}/flow.pt", map_location="cpu", weights_only=True), strict=True)
         self.flow.cuda().eval()
+        self.flow.decoder.use_cuda_graph = self.config.hf_config.cuda_graph_flow
 
         self.hift = HiFTGenerator()
         hift_state_dict = {k.replace('generator.', ''): v for k, v in torch.load(f"{self.config.model}/hift.pt", map_location="cpu", weights_only=True).items()}
@@ -59,6 +68,7 @@ class SoulXPodcast(torch.nn.Module):
         use_dialect_prompt: bool = False,
         dialect_prompt_text_tokens_for_llm: list[list[int]] = None,
         dialect_prefix: list[list[int]] = None,
+        parallel_turns: bool = False,
         **kwargs,  # for compatibility
     ):
 
@@ -114,28 +124,40 @@ class SoulXPodcast(torch.nn.Module):
         cache_config = AutoPretrainedConfig().from_dataclass(self.llm.config.hf_config)
         past_key_values = DynamicCache(config=cache_config)
         valid_turn_size = prompt_size
-        for i in range(turn_size):
 
-            # # set ratio: reach the reset cache ratio;
-            if valid_turn_size > self.config.max_turn_size or len(inputs)>self.config.turn_tokens_threshold:
-                assert self.config.max_turn_size >= self.config.prompt_context + self.config.history_context, "Invalid Long history size setting, "
-                prompt_text_bound = max(self.config.prompt_context, len(history_inputs)-self.config.history_text_context-self.config.history_context)
-                inputs = list(chain.from_iterable(
-                    history_inputs[:self.config.prompt_context]+ \
-                    history_inputs[prompt_text_bound:-self.config.history_context]+ \
-                    prompt_inputs[-self.config.history_context:]
-                ))
-                valid_turn_size = self.config.prompt_context + len(history_inputs) - prompt_text_bound
-                past_key_values = DynamicCache(config=cache_config)
-            valid_turn_size += 1
-            
-            inputs.extend(text_tokens_for_llm[i])
-            start_time = time.time()
-            llm_outputs = self.llm.generate(inputs, sampling_params, past_key_values=past_key_values)
+        # Parallel turns: every turn is conditioned on the speaker prompts only, so all
+        # of them can go to vLLM as independent requests and be decoded together.
+        batched_outputs = None
+        if parallel_turns and isinstance(self.llm, VLLMEngine):
+            batched_outputs = self.llm.generate_batch(
+                [inputs + text_tokens_for_llm[i] for i in range(turn_size)], sampling_params
+            )
 
-            inputs.extend(llm_outputs['token_ids'])
-            prompt_inputs.append(text_tokens_for_llm[i]+llm_outputs['token_ids'])
-            history_inputs.append(text_tokens_for_llm[i][:-1]) # remove the <|audio_start|>
+        for i in range(turn_size):
+
+            if batched_outputs is not None:
+                llm_outputs = batched_outputs[i]
+            else:
+                # # set ratio: reach the reset cache ratio;
+                if valid_turn_size > self.config.max_turn_size or len(inputs)>self.config.turn_tokens_threshold:
+                    assert self.config.max_turn_size >= self.config.prompt_context + self.config.history_context, "Invalid Long history size setting, "
+                    prompt_text_bound = max(self.config.prompt_context, len(history_inputs)-self.config.history_text_context-self.config.history_context)
+                    inputs = list(chain.from_iterable(
+                        history_inputs[:self.config.prompt_context]+ \
+                        history_inputs[prompt_text_bound:-self.config.history_context]+ \
+                        prompt_inputs[-self.config.history_context:]
+                    ))
+                    valid_turn_size = self.config.prompt_context + len(history_inputs) - prompt_text_bound
+                    past_key_values = DynamicCache(config=cache_config)
+                valid_turn_size += 1
+                
+                inputs.extend(text_tokens_for_llm[i])
+                start_time = time.time()
+                llm_outputs = self.llm.generate(inputs, sampling_params, past_key_values=past_key_values)
+
+                inputs.extend(llm_outputs['token_ids'])
+                prompt_inputs.append(text_tokens_for_llm[i]+llm_outputs['token_ids'])
+                history_inputs.append(text_tokens_for_llm[i][:-1]) # remove the <|audio_start|>
             
             # Prepare Flow inputs
             turn_spk = spk_ids[i]
@@ -151,7 +173,7 @@ class SoulXPodcast(torch.nn.Module):
             spk_emb = spk_emb_for_flow[start_idx:start_idx+1]
 
             # Flow generation
-            with torch.amp.autocast("cuda", dtype=torch.float16 if self.config.hf_config.fp16_flow else torch.float32):
+            with torch.amp.autocast("cuda", dtype=self.flow_dtype):
                 generated_mels, generated_mels_lens = self.flow(
                     flow_input.cuda(), flow_inputs_len.cuda(),
                     prompt_mels, prompt_mels_lens, spk_emb.cuda(),
@@ -160,8 +182,9 @@ class SoulXPodcast(torch.nn.Module):
 
             # HiFi-GAN generation
             mel = generated_mels[:, :, prompt_mels_lens[0].item():generated_mels_lens[0].item()]
-            wav, _ = self.hift(speech_feat=mel)
-            generated_wavs.append(wav)
+            with torch.amp.autocast("cuda", dtype=torch.bfloat16, enabled=self.config.hf_config.bf16_vocoder):
+                wav, _ = self.hift(speech_feat=mel)
+            generated_wavs.append(wav.float())
 
         # Save the generated wav;
         results_dict['generated_wavs'] = generated_wavs